@@ -2,158 +2,123 @@
 drone_sim.py
 Simulasi AI Drone Penjaga Rumah (2D)
 Python 3.12 + Pygame
+
+State simulasi ada di a_world.py (mode objek) atau a_array.py (mode array
+NumPy untuk crowd besar). Jalankan dari root repo:
+    python -m ai1.a --array --people 5000
+Profiler per fase + HUD: --profile (atau F3 saat jalan), F4 export JSON.
 """
 
+import argparse
 import pygame
-import random
-import math
-
-# =========================
-#  KONFIGURASI DASAR
-# =========================
-WIDTH, HEIGHT = 800, 600
-FPS = 30
-NUM_PEOPLE = 15
-NUM_DRONES = 2
-THREAT_THRESHOLD = 0.66
-
-# =========================
-#  WARNA
-# =========================
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GREEN = (0, 255, 0)
-YELLOW = (255, 255, 0)
-RED = (255, 50, 50)
-BLUE = (0, 120, 255)
-CYAN = (0, 255, 255)
-
-# =========================
-#  KELAS PERSON (ORANG)
-# =========================
-class Person:
-    def __init__(self):
-        self.x = random.randint(50, WIDTH - 50)
-        self.y = random.randint(50, HEIGHT - 50)
-        self.threat = random.random()
-        self.caught = False
-
-    def move(self):
-        if self.caught:
-            return
-        dx, dy = random.choice([-2, -1, 0, 1, 2]), random.choice([-2, -1, 0, 1, 2])
-        self.x = min(max(0, self.x + dx), WIDTH)
-        self.y = min(max(0, self.y + dy), HEIGHT)
-
-    def color(self):
-        if self.caught:
-            return (100, 100, 100)
-        if self.threat <= 0.33:
-            return GREEN
-        elif self.threat <= 0.66:
-            return YELLOW
-        else:
-            return RED
-
-# =========================
-#  KELAS DRONE
-# =========================
-class Drone:
-    def __init__(self, x, y):
-        self.x, self.y = x, y
-        self.speed = 4
-        self.target = None
-
-    def scan(self, people):
-        visible_threats = [
-            p for p in people if not p.caught and p.threat > THREAT_THRESHOLD
-        ]
-        if not visible_threats:
-            self.target = None
-            return
-        # cari target terdekat
-        nearest = min(
-            visible_threats, key=lambda p: math.hypot(p.x - self.x, p.y - self.y)
+from datetime import datetime
+
+from simcore import paths
+
+paths.use("ai1")  # a_world, a_array diimpor datar dari folder ai1
+from a_world import World, WIDTH, HEIGHT, FPS, NUM_PEOPLE, NUM_DRONES, WHITE, BLACK, BLUE, CYAN
+from simcore.textcache import TextCache
+from simcore.dirty import DirtyRenderer
+from simcore.scheduler import FixedStep
+from simcore.profiler import Profiler
+from simcore.perfhud import PerfHUD
+
+RENDER_FPS = 60  # laju gambar; simulasi tetap maju FPS tick/detik (a_world.FPS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi Drone AI Penjaga Rumah")
+    parser.add_argument("--array", action="store_true", help="pakai world berbasis array NumPy")
+    parser.add_argument("--people", type=int, default=NUM_PEOPLE)
+    parser.add_argument("--drones", type=int, default=NUM_DRONES)
+    parser.add_argument("--dirty", action="store_true", help="gambar ulang hanya area yang berubah (dirty rect)")
+    parser.add_argument("--profile", action="store_true", help="profiler per fase + HUD aktif sejak awal (F3 toggle)")
+    args = parser.parse_args()
+
+    # =========================
+    #  SETUP PYGAME
+    # =========================
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Simulasi Drone AI Penjaga Rumah")
+    clock = pygame.time.Clock()
+
+    # =========================
+    #  OBJEK SIMULASI
+    # =========================
+    if args.array:
+        from a_array import ArrayWorld  # NumPy hanya dibutuhkan di mode array
+        world = ArrayWorld(args.people, args.drones)
+    else:
+        world = World(args.people, args.drones)
+
+    font = pygame.font.SysFont("Arial", 18)
+    text_cache = TextCache()
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
+    background.fill(BLACK)
+    renderer = DirtyRenderer(screen, args.dirty)
+    sched = FixedStep(FPS)
+    profiler = Profiler(args.profile)
+    hud = PerfHUD(profiler, pygame.font.SysFont("Consolas", 14), 1000 / RENDER_FPS, pos=(10, 36), text=text_cache)
+    sim = "ai1-array" if args.array else "ai1"
+
+    def profile_path():
+        return f"profile_house_sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+    # =========================
+    #  LOOP UTAMA
+    # =========================
+    running = True
+    while running:
+        profiler.begin()
+        for event in pygame.event.get():
+            if hud.handle(event, profile_path, sim=sim, people=args.people, drones=args.drones):
+                continue
+            if event.type == pygame.QUIT:
+                running = False
+        profiler.mark("events")
+
+        for _ in range(sched.advance()):
+            world.step()
+            if args.array:
+                for i in world.last_captures.tolist():
+                    x, y = world.pos[i]
+                    print(f"[INFO] Drone menangkap target di ({int(x)}, {int(y)})")
+        profiler.mark("sim")
+
+        renderer.begin(background)
+
+        people_view = world.people_view()
+        drones_view = world.drones_view(sched.alpha)
+
+        # Gambar orang
+        for x, y, color in people_view:
+            renderer.mark(pygame.draw.circle(screen, color, (int(x), int(y)), 6))
+
+        # Gambar drone
+        for x, y, chasing in drones_view:
+            color = CYAN if chasing else BLUE
+            renderer.mark(pygame.draw.rect(screen, color, pygame.Rect(x - 5, y - 5, 10, 10)))
+
+        # Teks status (di-render ulang hanya bila angkanya berubah)
+        text = text_cache.render(
+            font,
+            f"Drones: {len(drones_view)} | People: {len(people_view)} | Threat Aktif: {world.active_threats()}",
+            WHITE,
         )
-        self.target = nearest
-
-    def move(self):
-        if self.target is None or self.target.caught:
-            # patroli acak
-            self.x += random.choice([-2, -1, 0, 1, 2])
-            self.y += random.choice([-2, -1, 0, 1, 2])
-        else:
-            # kejar target
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            dist = math.hypot(dx, dy)
-            if dist > 0:
-                self.x += self.speed * dx / dist
-                self.y += self.speed * dy / dist
-            # jika sudah dekat, tangkap target
-            if dist < 10:
-                self.target.caught = True
-                print(
-                    f"[INFO] Drone menangkap target di ({int(self.target.x)}, {int(self.target.y)})"
-                )
-                self.target = None
-
-        # pastikan tetap di dalam layar
-        self.x = max(0, min(WIDTH, self.x))
-        self.y = max(0, min(HEIGHT, self.y))
-
-# =========================
-#  SETUP PYGAME
-# =========================
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Simulasi Drone AI Penjaga Rumah")
-clock = pygame.time.Clock()
-
-# =========================
-#  OBJEK SIMULASI
-# =========================
-people = [Person() for _ in range(NUM_PEOPLE)]
-drones = [
-    Drone(WIDTH // (NUM_DRONES + 1) * (i + 1), HEIGHT // 2)
-    for i in range(NUM_DRONES)
-]
-
-font = pygame.font.SysFont("Arial", 18)
-
-# =========================
-#  LOOP UTAMA
-# =========================
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    screen.fill(BLACK)
-
-    # Update & gambar orang
-    for p in people:
-        p.move()
-        pygame.draw.circle(screen, p.color(), (int(p.x), int(p.y)), 6)
-
-    # Update & gambar drone
-    for d in drones:
-        d.scan(people)
-        d.move()
-        color = CYAN if d.target else BLUE
-        pygame.draw.rect(screen, color, pygame.Rect(d.x - 5, d.y - 5, 10, 10))
-
-    # Teks status
-    active_threats = len([p for p in people if not p.caught and p.threat > THREAT_THRESHOLD])
-    text = font.render(
-        f"Drones: {len(drones)} | People: {len(people)} | Threat Aktif: {active_threats}",
-        True,
-        WHITE,
-    )
-    screen.blit(text, (10, 10))
-
-    pygame.display.flip()
-    clock.tick(FPS)
-
-pygame.quit()
+        renderer.mark(screen.blit(text, (10, 10)))
+        profiler.mark("draw")
+        hud.draw(screen, renderer)
+        profiler.mark("hud")
+
+        renderer.present()
+        profiler.end("flip")
+        clock.tick(RENDER_FPS)
+
+    pygame.quit()
+    if profiler.frames:
+        print(f"[PROFILE] {profiler.export(profile_path(), sim=sim, people=args.people, drones=args.drones)}")
+
+
+if __name__ == "__main__":
+    main()
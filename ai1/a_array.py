@@ -0,0 +1,178 @@
+"""
+a_array.py
+World berbasis array NumPy untuk crowd besar (mode array a.py).
+
+Posisi, threat dan flag caught semua person disimpan dalam array; random walk
+dilakukan dengan satu panggilan batch, dan pencarian threat terdekat untuk
+semua drone memakai satu perhitungan jarak tervektorisasi.
+
+Beda dengan mode objek: semua drone scan & bergerak serentak dalam satu tick
+(di mode objek drone diproses berurutan, jadi drone kedua bisa melihat target
+yang baru saja ditangkap drone pertama).
+"""
+
+import numpy as np
+
+from a_world import (WIDTH, HEIGHT, NUM_PEOPLE, NUM_DRONES, THREAT_THRESHOLD, ASSIGN_TOLERANCE, CAPTURE_RADIUS,
+                     GREEN, YELLOW, RED, CAUGHT_GRAY)
+from simcore.rng import WorldRNG
+from simcore.assign import Assigner
+from simcore.pursuit import SMOOTHING, gate_velocity, intercept_many
+from simcore.capture import captures
+
+# batas elemen matriks jarak (drone x threat) per chunk supaya memori tetap kecil
+_DIST_CHUNK = 1 << 22
+
+
+class ArrayWorld:
+    def __init__(self, num_people=NUM_PEOPLE, num_drones=NUM_DRONES, threshold=THREAT_THRESHOLD, seed=None,
+                 assign=True, intercept=True, swept=True):
+        self.threshold = threshold
+        self.assigner = Assigner(ASSIGN_TOLERANCE) if assign else None  # None = argmin jarak per drone
+        self.intercept = intercept  # drone membidik titik intercept, bukan posisi target
+        self.swept = swept  # penangkapan kontinu semua drone pengejar x threat aktif (simcore.capture)
+        self.tick = 0
+        self.world_rng = WorldRNG(seed)  # seed yang dipakai: self.world_rng.seed
+        self.rng = self.world_rng.numpy("array-world")
+        rng = self.rng
+        # --- person ---
+        self.pos = np.column_stack([
+            rng.integers(50, WIDTH - 50, num_people, endpoint=True),
+            rng.integers(50, HEIGHT - 50, num_people, endpoint=True),
+        ]).astype(np.float64)
+        self.threat = rng.random(num_people)
+        self.caught = np.zeros(num_people, dtype=bool)
+        self.prev_pos = self.pos.copy()  # posisi tick sebelumnya (swept capture)
+        # index threat aktif; threat tetap sejak spawn, jadi hanya berkurang saat ada penangkapan
+        self.active = np.flatnonzero(self.threat > threshold)
+        self.vel = np.zeros_like(self.pos)           # estimasi kecepatan person (EMA perpindahan per tick)
+        self.vel_m2 = np.zeros(num_people)           # EMA |perpindahan|^2, untuk gerbang signifikansi drift
+        # --- drone ---
+        self.drone_pos = np.array(
+            [[WIDTH // (num_drones + 1) * (i + 1), HEIGHT // 2] for i in range(num_drones)],
+            dtype=np.float64,
+        ).reshape(num_drones, 2)
+        self.prev_drone_pos = self.drone_pos.copy()  # posisi tick sebelumnya, untuk interpolasi render
+        self.drone_target = np.full(num_drones, -1, dtype=np.intp)  # index person, -1 = patroli
+        self.drone_speed = 4.0
+        self.last_captures = np.empty(0, dtype=np.intp)  # index person yang ditangkap di step terakhir
+        self._limits = np.array([WIDTH, HEIGHT], dtype=np.float64)
+        # metrik (sama dengan a_world.World)
+        self.stats = {"captures": 0, "false_pursuits": 0, "warnings": 0}
+        self.capture_latencies = []
+
+    # ---------- update ----------
+    def step(self, n=1):
+        for _ in range(n):
+            self.tick += 1
+            self._move_people()
+            self._scan()
+            self._move_drones()
+
+    def _move_people(self):
+        steps = self.rng.integers(-2, 3, size=self.pos.shape)
+        steps[self.caught] = 0
+        np.copyto(self.prev_pos, self.pos)
+        self.pos += steps
+        np.clip(self.pos, 0, self._limits, out=self.pos)
+        if self.intercept:
+            moved = self.pos - self.prev_pos
+            self.vel += SMOOTHING * (moved - self.vel)
+            self.vel_m2 += SMOOTHING * (np.einsum("ij,ij->i", moved, moved) - self.vel_m2)
+
+    def _scan(self):
+        """Target = threat aktif terdekat untuk tiap drone (argmin jarak kuadrat)."""
+        prev = self.drone_target.copy()
+        active = self.active
+        if active.size == 0 or len(self.drone_pos) == 0:
+            self.drone_target.fill(-1)
+            return
+        threats = self.pos[active]
+        if self.assigner is not None:
+            assigned = self.assigner.assign(range(len(self.drone_pos)), self.drone_pos,
+                                            active.tolist(), threats, self.threat[active].tolist())
+            self.drone_target[:] = [-1 if t is None else t for t in assigned]
+            self._count_switches(prev)
+            return
+        chunk = max(1, _DIST_CHUNK // active.size)
+        for start in range(0, len(self.drone_pos), chunk):
+            d = self.drone_pos[start:start + chunk, None, :] - threats[None, :, :]
+            dist2 = np.einsum("ijk,ijk->ij", d, d)
+            self.drone_target[start:start + chunk] = active[np.argmin(dist2, axis=1)]
+        self._count_switches(prev)
+
+    def _count_switches(self, prev):
+        # ganti target sebelum yang lama tertangkap = kejaran sia-sia
+        switched = (prev >= 0) & (prev != self.drone_target)
+        self.stats["false_pursuits"] += int(np.count_nonzero(switched & ~self.caught[np.maximum(prev, 0)]))
+
+    def _move_drones(self):
+        np.copyto(self.prev_drone_pos, self.drone_pos)
+        chasing = self.drone_target >= 0
+        idle = ~chasing
+        # patroli acak
+        n_idle = int(idle.sum())
+        if n_idle:
+            self.drone_pos[idle] += self.rng.integers(-2, 3, size=(n_idle, 2))
+
+        captured = np.empty(0, dtype=np.intp)
+        if chasing.any():
+            who = np.flatnonzero(chasing)
+            tgt = self.drone_target[who]
+            delta = self.pos[tgt] - self.drone_pos[who]
+            dist = np.hypot(delta[:, 0], delta[:, 1])
+            if self.intercept:
+                # semua drone pengejar dibidikkan ke titik intercept dalam satu batch
+                aim = intercept_many(self.pos[tgt], gate_velocity(self.vel[tgt], self.vel_m2[tgt]),
+                                     self.drone_pos[who], self.drone_speed)
+                delta = aim - self.drone_pos[who]
+            step_dist = np.hypot(delta[:, 0], delta[:, 1])
+            moving = step_dist > 0
+            self.drone_pos[who[moving]] += self.drone_speed * delta[moving] / step_dist[moving, None]
+            if not self.swept:
+                # jika sudah dekat, tangkap target
+                hit = dist < CAPTURE_RADIUS
+                captured = np.unique(tgt[hit])
+                self.drone_target[who[hit]] = -1
+
+        # pastikan tetap di dalam layar
+        np.clip(self.drone_pos, 0, self._limits, out=self.drone_pos)
+
+        if self.swept and chasing.any():
+            captured = self._swept_captures(np.flatnonzero(chasing))
+        self.caught[captured] = True
+        if captured.size:
+            self.active = self.active[~self.caught[self.active]]
+        self.stats["captures"] += len(captured)
+        self.capture_latencies.extend([self.tick] * len(captured))
+        self.last_captures = captured
+
+    def _swept_captures(self, who):
+        """Threat aktif yang dilewati drone pengejar `who` dalam radius selama tick ini; index person tertangkap."""
+        active = self.active
+        hits = captures(self.prev_drone_pos[who], self.drone_pos[who], self.prev_pos[active], self.pos[active],
+                        CAPTURE_RADIUS)
+        if not hits:
+            return np.empty(0, dtype=np.intp)
+        ii, jj, _t = (np.array(col) for col in zip(*hits))
+        captured = active[jj]
+        # drone yang menangkap targetnya sendiri kembali patroli
+        own = self.drone_target[who[ii]] == captured
+        self.drone_target[who[ii[own]]] = -1
+        return np.sort(captured)
+
+    # ---------- view ----------
+    def active_threats(self):
+        return int(self.active.size)
+
+    def people_view(self):
+        """(x, y, color) tiap person untuk digambar."""
+        colors = np.where(self.threat <= 0.33, 0, np.where(self.threat <= 0.66, 1, 2))
+        colors[self.caught] = 3
+        palette = (GREEN, YELLOW, RED, CAUGHT_GRAY)
+        return [(x, y, palette[c]) for (x, y), c in zip(self.pos.tolist(), colors.tolist())]
+
+    def drones_view(self, alpha=1.0):
+        """(x, y, sedang_mengejar) tiap drone untuk digambar; alpha < 1 menginterpolasi dari posisi tick sebelumnya."""
+        pos = self.drone_pos if alpha >= 1.0 else self.prev_drone_pos + (self.drone_pos - self.prev_drone_pos) * alpha
+        return [(x, y, t >= 0) for (x, y), t in zip(pos.tolist(), self.drone_target.tolist())]
@@ -0,0 +1,230 @@
+"""
+a_world.py
+State simulasi drone penjaga rumah (mode objek, tanpa pygame).
+Dipakai oleh a.py (UI pygame); versi array NumPy ada di a_array.py.
+"""
+
+import random
+import math
+
+from simcore.rng import WorldRNG
+from simcore.scheduler import lerp
+from simcore.assign import Assigner
+from simcore.pursuit import VelocityEstimator, intercept
+from simcore.capture import captures
+
+# =========================
+#  KONFIGURASI DASAR
+# =========================
+WIDTH, HEIGHT = 800, 600
+FPS = 30
+NUM_PEOPLE = 15
+NUM_DRONES = 2
+THREAT_THRESHOLD = 0.66
+ASSIGN_TOLERANCE = 8  # px; assignment drone->threat di-solve ulang bila ada posisi bergeser lebih dari ini
+CAPTURE_RADIUS = 10   # px; drone menangkap threat yang pernah lebih dekat dari ini
+
+# =========================
+#  WARNA
+# =========================
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GREEN = (0, 255, 0)
+YELLOW = (255, 255, 0)
+RED = (255, 50, 50)
+BLUE = (0, 120, 255)
+CYAN = (0, 255, 255)
+CAUGHT_GRAY = (100, 100, 100)
+
+# =========================
+#  KELAS PERSON (ORANG)
+# =========================
+class Person:
+    def __init__(self, rng=None):
+        self.rng = rng or random  # substream WorldRNG, atau modul random global
+        self.x = self.rng.randint(50, WIDTH - 50)
+        self.y = self.rng.randint(50, HEIGHT - 50)
+        self.threat = self.rng.random()
+        self.caught = False
+        self.prev_x, self.prev_y = self.x, self.y  # posisi tick sebelumnya (swept capture)
+
+    def move(self):
+        self.prev_x, self.prev_y = self.x, self.y
+        if self.caught:
+            return
+        dx, dy = self.rng.choice([-2, -1, 0, 1, 2]), self.rng.choice([-2, -1, 0, 1, 2])
+        self.x = min(max(0, self.x + dx), WIDTH)
+        self.y = min(max(0, self.y + dy), HEIGHT)
+
+    def color(self):
+        if self.caught:
+            return CAUGHT_GRAY
+        if self.threat <= 0.33:
+            return GREEN
+        elif self.threat <= 0.66:
+            return YELLOW
+        else:
+            return RED
+
+# =========================
+#  KELAS DRONE
+# =========================
+class Drone:
+    def __init__(self, x, y, rng=None):
+        self.rng = rng or random
+        self.x, self.y = x, y
+        self.prev_x, self.prev_y = x, y  # posisi tick sebelumnya
+        self.speed = 4
+        self.target = None
+
+    def scan(self, visible_threats):
+        """visible_threats: person belum tertangkap dengan threat > threshold (World.threats)."""
+        if not visible_threats:
+            self.target = None
+            return
+        # cari target terdekat
+        nearest = min(
+            visible_threats, key=lambda p: math.hypot(p.x - self.x, p.y - self.y)
+        )
+        self.target = nearest
+
+    def move(self, aim=None, capture=True):
+        """
+        Patroli / kejar target. Mengembalikan person yang tertangkap di langkah ini (atau None).
+        aim: titik bidik (x, y) hasil intercept; None = kejar posisi target saat ini.
+        capture: False = hanya bergerak; penangkapan diperiksa World (swept) setelah semua drone bergerak.
+        """
+        captured = None
+        self.prev_x, self.prev_y = self.x, self.y  # untuk interpolasi render
+        if self.target is None or self.target.caught:
+            # patroli acak
+            self.x += self.rng.choice([-2, -1, 0, 1, 2])
+            self.y += self.rng.choice([-2, -1, 0, 1, 2])
+        else:
+            # kejar target
+            dx = self.target.x - self.x
+            dy = self.target.y - self.y
+            dist = math.hypot(dx, dy)
+            if aim is not None:
+                dx, dy = aim[0] - self.x, aim[1] - self.y
+            step_dist = math.hypot(dx, dy)
+            if step_dist > 0:
+                self.x += self.speed * dx / step_dist
+                self.y += self.speed * dy / step_dist
+            # jika sudah dekat, tangkap target
+            if capture and dist < CAPTURE_RADIUS:
+                self.target.caught = True
+                captured = self.target
+                self.target = None
+
+        # pastikan tetap di dalam layar
+        self.x = max(0, min(WIDTH, self.x))
+        self.y = max(0, min(HEIGHT, self.y))
+        return captured
+
+# =========================
+#  WORLD (MODE OBJEK)
+# =========================
+class World:
+    """Kumpulan Person & Drone; satu step = satu frame simulasi lama."""
+
+    def __init__(self, num_people=NUM_PEOPLE, num_drones=NUM_DRONES, threshold=THREAT_THRESHOLD, verbose=True,
+                 seed=None, assign=True, intercept=True, swept=True):
+        """
+        assign: True = target dibagi global (Hungarian) tiap tick; False = tiap drone kejar threat terdekat
+        intercept: True = drone membidik titik intercept (kecepatan target diestimasi); False = posisi target
+        swept: True = penangkapan kontinu sepanjang tick untuk semua pasangan drone pengejar x threat
+               (simcore.capture); False = cek jarak titik sebelum drone bergerak, hanya ke targetnya
+        """
+        self.threshold = threshold
+        self.assigner = Assigner(ASSIGN_TOLERANCE) if assign else None
+        self.velocities = VelocityEstimator() if intercept else None
+        self.swept = swept
+        self.verbose = verbose
+        self.tick = 0
+        self.rng = WorldRNG(seed)  # seed yang dipakai: self.rng.seed
+        self.people = [Person(self.rng.stream(f"person:{i}")) for i in range(num_people)]
+        # threat aktif (belum tertangkap, threat > threshold); threat tetap sejak spawn,
+        # jadi set ini hanya berubah saat ada penangkapan
+        self.threats = {p: None for p in self.people if p.threat > threshold}
+        self.drones = [
+            Drone(WIDTH // (num_drones + 1) * (i + 1), HEIGHT // 2, self.rng.stream(f"drone:{i}"))
+            for i in range(num_drones)
+        ]
+        # metrik untuk sweep/benchmark; threat tetap sejak spawn (tick 0), jadi latency = tick tangkap
+        self.stats = {"captures": 0, "false_pursuits": 0, "warnings": 0}
+        self.capture_latencies = []
+
+    def step(self, n=1):
+        for _ in range(n):
+            self.tick += 1
+            for p in self.people:
+                p.move()
+            if self.velocities is not None:
+                for p in self.threats:
+                    self.velocities.observe(p, p.x, p.y)
+            assigned = self._assign_targets() if self.assigner else None
+            for i, d in enumerate(self.drones):
+                prev = d.target
+                if assigned is None:
+                    d.scan(self.threats)
+                else:
+                    d.target = assigned[i]
+                if prev is not None and d.target is not prev and not prev.caught:
+                    # ganti target sebelum yang lama tertangkap = kejaran sia-sia
+                    self.stats["false_pursuits"] += 1
+                captured = d.move(self._aim(d), capture=not self.swept)
+                if captured is not None:
+                    self._captured(captured)
+            if self.swept:
+                self._swept_captures()
+
+    def _swept_captures(self):
+        """Threat yang dilewati drone pengejar dalam radius selama tick ini (urut waktu kontak)."""
+        chasing = [d for d in self.drones if d.target is not None]
+        if not chasing or not self.threats:
+            return
+        threats = list(self.threats)
+        hits = captures([(d.prev_x, d.prev_y) for d in chasing], [(d.x, d.y) for d in chasing],
+                        [(p.prev_x, p.prev_y) for p in threats], [(p.x, p.y) for p in threats], CAPTURE_RADIUS)
+        for i, j, _t in hits:
+            d, p = chasing[i], threats[j]
+            p.caught = True
+            if d.target is p:
+                d.target = None
+            self._captured(p)
+
+    def _captured(self, p):
+        del self.threats[p]
+        if self.velocities is not None:
+            self.velocities.forget(p)
+        self.stats["captures"] += 1
+        self.capture_latencies.append(self.tick)
+        if self.verbose:
+            print(f"[INFO] Drone menangkap target di ({int(p.x)}, {int(p.y)})")
+
+    def _aim(self, drone):
+        """Titik intercept untuk drone yang sedang mengejar (None = bidik posisi target)."""
+        t = drone.target
+        if self.velocities is None or t is None or t.caught:
+            return None
+        vx, vy = self.velocities.velocity(t)
+        return intercept(t.x, t.y, vx, vy, drone.x, drone.y, drone.speed)
+
+    def _assign_targets(self):
+        """Target per drone dari assignment global (biaya = jarak / threat)."""
+        threats = list(self.threats)
+        drones = self.drones
+        return self.assigner.assign(drones, [(d.x, d.y) for d in drones],
+                                    threats, [(p.x, p.y) for p in threats], [p.threat for p in threats])
+
+    def active_threats(self):
+        return len(self.threats)
+
+    def people_view(self):
+        """(x, y, color) tiap person untuk digambar."""
+        return [(p.x, p.y, p.color()) for p in self.people]
+
+    def drones_view(self, alpha=1.0):
+        """(x, y, sedang_mengejar) tiap drone untuk digambar; alpha < 1 menginterpolasi dari posisi tick sebelumnya."""
+        return [(lerp(d.prev_x, d.x, alpha), lerp(d.prev_y, d.y, alpha), d.target is not None) for d in self.drones]
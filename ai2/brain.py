@@ -9,24 +9,29 @@ Aturan utama:
 - Jika target berbahaya (threat > threshold) DAN target **masuk ke dalam protected_zone** -> drone boleh menyerang (pursue).
 - Jika target berbahaya tapi BELUM masuk protected_zone -> drone hanya memberi PERINGATAN (broadcast), tidak mengejar.
 - shared_targets menyimpan status awareness (pos, locked_by, warning_only flag).
+- "by" pada record adalah targets.Observers (ukuran tetap), bukan list yang terus tumbuh.
 """
 
 import time
 import math
-from typing import Dict, Tuple
+from typing import Callable, Dict, Optional, Tuple
+from targets import Observers
 
 class DroneBrain:
-    def __init__(self, drone_id: str, shared_targets: Dict, scan_cells: int = 5, threshold: float = 0.66):
+    def __init__(self, drone_id: str, shared_targets: Dict, scan_cells: int = 5, threshold: float = 0.66,
+                 clock: Callable[[], float] = time.time):
         """
         drone_id: identifier drone (mis. "D0")
         shared_targets: shared registry (dict) bersama antar drone
         scan_cells: radius scan dalam satuan cell grid
         threshold: nilai ambang threat
+        clock: sumber waktu untuk "ts" (default time.time; World memakai waktu simulasi)
         """
         self.id = drone_id
         self.shared_targets = shared_targets
         self.scan_cells = scan_cells
         self.threshold = threshold
+        self.clock = clock
         self.target_id = None  # id person yang sedang di-lock untuk pursuit
 
     def in_scan_range(self, drone_cell: Tuple[int,int], person_cell: Tuple[int,int]) -> bool:
@@ -34,12 +39,16 @@ class DroneBrain:
         dy = abs(drone_cell[1] - person_cell[1])
         return dx <= self.scan_cells and dy <= self.scan_cells
 
-    def decide(self, drone_cell: Tuple[int,int], persons: list, protected_zone: Tuple[int,int,int,int]):
+    def decide(self, drone_cell: Tuple[int,int], persons: list, protected_zone: Tuple[int,int,int,int],
+               index=None, assignment: Optional[Dict[str, str]] = None):
         """
         Scan persons and decide:
         - If a person has threat > threshold AND is inside protected_zone -> try lock + pursue.
         - Else if threat > threshold but outside protected_zone AND within scan range -> issue warning (broadcast) only.
         - If locked target is no longer valid, release it.
+        If index (spatial.CellIndex) is given, only persons in cells within scan_cells are scanned.
+        If assignment (pid -> drone_id, hasil assignment global World) is given, pursuit candidates
+        assigned to another drone are skipped and the one assigned to this drone is preferred.
         Returns action string for logging.
         """
         # Release target if invalid
@@ -50,24 +59,32 @@ class DroneBrain:
                 self.target_id = None
 
         # scan nearby persons
+        if index is not None:
+            persons = index.query(drone_cell, self.scan_cells)
         best_candidate = None  # (person, score)
         for p in persons:
             if p.caught:
                 continue
             if p.threat <= 0:
                 continue
-            if not self.in_scan_range(drone_cell, (p.cell_x, p.cell_y)):
-                continue
+            if index is None and not self.in_scan_range(drone_cell, (p.cell_x, p.cell_y)):
+                continue  # (hasil index.query sudah pasti dalam scan range)
 
             inside_protected = self._in_zone((p.cell_x, p.cell_y), protected_zone)
             if inside_protected and p.threat > self.threshold:
+                mine = 0  # 1 = target hasil assignment untuk drone ini (didahulukan)
+                if assignment is not None:
+                    owner = assignment.get(p.id)
+                    if owner is not None and owner != self.id:
+                        continue  # dikejar drone lain menurut assignment global
+                    mine = int(owner == self.id)
                 # immediate high-priority pursuit candidate
-                score = (p.threat, -self._manhattan(drone_cell, (p.cell_x, p.cell_y)))
+                score = (mine, p.threat, -self._manhattan(drone_cell, (p.cell_x, p.cell_y)))
                 if (best_candidate is None) or (score > best_candidate[1]):
                     best_candidate = (p, score, "PURSUE")
             elif p.threat > self.threshold:
                 # warning candidate (lower priority)
-                score = (p.threat * 0.8, -self._manhattan(drone_cell, (p.cell_x, p.cell_y)))
+                score = (0, p.threat * 0.8, -self._manhattan(drone_cell, (p.cell_x, p.cell_y)))
                 if (best_candidate is None) or (score > best_candidate[1]):
                     best_candidate = (p, score, "WARN")
 
@@ -78,12 +95,15 @@ class DroneBrain:
                 # try to lock for pursuit
                 rec = self.shared_targets.get(pid)
                 if rec is None or rec.get("locked_by") is None:
+                    if self.target_id and self.target_id != pid:
+                        # pindah target: lepas lock lama supaya drone lain bisa mengambilnya
+                        self.release_lock(self.target_id)
                     # lock for pursuit
                     self.shared_targets[pid] = {
                         "pos": (person.cell_x, person.cell_y),
                         "locked_by": self.id,
-                        "by": [self.id],
-                        "ts": time.time(),
+                        "by": self._observed(Observers()),
+                        "ts": self.clock(),
                         "warning_only": False
                     }
                     self.target_id = pid
@@ -91,8 +111,8 @@ class DroneBrain:
                 else:
                     # someone else locked it; just broadcast location
                     self.shared_targets[pid]["pos"] = (person.cell_x, person.cell_y)
-                    self.shared_targets[pid].setdefault("by", []).append(self.id)
-                    self.shared_targets[pid]["ts"] = time.time()
+                    self._observed(self.shared_targets[pid].setdefault("by", Observers()))
+                    self.shared_targets[pid]["ts"] = self.clock()
                     return f"ALREADY_LOCKED {pid} by {rec.get('locked_by')}"
             else:
                 # WARN: do not lock; broadcast as warning_only
@@ -101,15 +121,15 @@ class DroneBrain:
                     self.shared_targets[pid] = {
                         "pos": (person.cell_x, person.cell_y),
                         "locked_by": None,
-                        "by": [self.id],
-                        "ts": time.time(),
+                        "by": self._observed(Observers()),
+                        "ts": self.clock(),
                         "warning_only": True
                     }
                 else:
                     # update
                     rec["pos"] = (person.cell_x, person.cell_y)
-                    rec.setdefault("by", []).append(self.id)
-                    rec["ts"] = time.time()
+                    self._observed(rec.setdefault("by", Observers()))
+                    rec["ts"] = self.clock()
                     rec["warning_only"] = True
                 return f"WARN {pid}"
         else:
@@ -120,8 +140,8 @@ class DroneBrain:
         rec = self.shared_targets.get(pid)
         if rec and rec.get("locked_by") == self.id:
             rec["locked_by"] = None
-            rec["ts"] = time.time()
-            rec.setdefault("by", []).append(self.id)
+            rec["ts"] = self.clock()
+            self._observed(rec.setdefault("by", Observers()))
         if self.target_id == pid:
             self.target_id = None
 
@@ -132,6 +152,11 @@ class DroneBrain:
         if self.target_id == pid:
             self.target_id = None
 
+    def _observed(self, by: Observers) -> Observers:
+        """Catat bahwa drone ini melihat target (hitungan + waktu terakhir)."""
+        by.add(self.id, self.clock())
+        return by
+
     @staticmethod
     def _in_zone(cell: Tuple[int,int], zone: Tuple[int,int,int,int]) -> bool:
         # zone = (x1,y1,x2,y2) inclusive cell coords
@@ -0,0 +1,187 @@
+# pathfinding.py
+"""
+Pathfinding di grid GRID_W x GRID_H untuk drone (tanpa pygame).
+
+Kelas / fungsi:
+- Grid: cell yang terhalang (tembok, footprint rumah). Setiap perubahan
+  menaikkan `version`, yang dipakai untuk invalidasi cache.
+- astar(grid, start, goal): jalur terpendek satu query (8 arah, tanpa
+  memotong sudut obstacle, heuristik octile).
+- FlowField: Dijkstra mundur dari satu cell tujuan; untuk setiap cell
+  tersimpan cell berikutnya menuju tujuan.
+- Pathfinder: fasad yang dipakai World. Query pertama ke satu tujuan dalam
+  satu tick memakai A*; begitu drone kedua meminta tujuan yang sama, flow
+  field tujuan itu dibangun dan dipakai bersama semua drone (dan tick
+  berikutnya) sampai target pindah cell atau obstacle berubah.
+"""
+
+import heapq
+import math
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Cell = Tuple[int, int]
+
+SQRT2 = math.sqrt(2.0)
+# (dx, dy, biaya)
+_STEPS = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+          (1, 1, SQRT2), (1, -1, SQRT2), (-1, 1, SQRT2), (-1, -1, SQRT2)]
+
+
+class Grid:
+    def __init__(self, width: int, height: int, obstacles: Iterable[Tuple[int,int,int,int]] = ()):
+        """obstacles: rect (x1,y1,x2,y2) inklusif dalam koordinat cell, seperti PROTECTED_ZONE."""
+        self.width = width
+        self.height = height
+        self.blocked = set()
+        self.version = 0
+        for rect in obstacles:
+            self.block_rect(rect)
+
+    def block_rect(self, rect: Tuple[int,int,int,int]):
+        x1, y1, x2, y2 = rect
+        self.blocked.update((x, y) for x in range(max(0, x1), min(self.width - 1, x2) + 1)
+                            for y in range(max(0, y1), min(self.height - 1, y2) + 1))
+        self.version += 1
+
+    def unblock_rect(self, rect: Tuple[int,int,int,int]):
+        x1, y1, x2, y2 = rect
+        self.blocked.difference_update((x, y) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1))
+        self.version += 1
+
+    def in_bounds(self, cell: Cell) -> bool:
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
+
+    def passable(self, cell: Cell) -> bool:
+        return self.in_bounds(cell) and cell not in self.blocked
+
+    def neighbors(self, cell: Cell):
+        """(cell tetangga, biaya) yang bisa dilewati; diagonal hanya bila kedua sisi ortogonal bebas."""
+        x, y = cell
+        passable = self.passable
+        for dx, dy, cost in _STEPS:
+            n = (x + dx, y + dy)
+            if not passable(n):
+                continue
+            if dx and dy and not (passable((x + dx, y)) and passable((x, y + dy))):
+                continue
+            yield n, cost
+
+
+def _octile(a: Cell, b: Cell) -> float:
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dx, dy) + (SQRT2 - 1.0) * min(dx, dy)
+
+
+def astar(grid: Grid, start: Cell, goal: Cell) -> Optional[List[Cell]]:
+    """Jalur [start, ..., goal], atau None bila goal tidak terjangkau. start boleh terhalang."""
+    if start == goal:
+        return [start]
+    if not grid.passable(goal):
+        return None
+    g = {start: 0.0}
+    came: Dict[Cell, Cell] = {}
+    heap = [(_octile(start, goal), 0.0, start)]
+    while heap:
+        _f, gc, cur = heapq.heappop(heap)
+        if cur == goal:
+            path = [cur]
+            while cur in came:
+                cur = came[cur]
+                path.append(cur)
+            path.reverse()
+            return path
+        if gc > g[cur]:
+            continue  # entri usang
+        for n, cost in grid.neighbors(cur):
+            ng = gc + cost
+            if ng < g.get(n, math.inf):
+                g[n] = ng
+                came[n] = cur
+                heapq.heappush(heap, (ng + _octile(n, goal), ng, n))
+    return None
+
+
+class FlowField:
+    def __init__(self, grid: Grid, goal: Cell):
+        self.goal = goal
+        self.version = grid.version
+        self.next: Dict[Cell, Cell] = {}   # cell -> cell berikutnya menuju goal
+        self.dist: Dict[Cell, float] = {}  # cell -> jarak ke goal
+        if not grid.passable(goal):
+            return
+        dist = self.dist
+        dist[goal] = 0.0
+        heap = [(0.0, goal)]
+        while heap:
+            d, cur = heapq.heappop(heap)
+            if d > dist[cur]:
+                continue
+            for n, cost in grid.neighbors(cur):  # graf simetris: tetangga cur juga bisa ke cur
+                nd = d + cost
+                if nd < dist.get(n, math.inf):
+                    dist[n] = nd
+                    self.next[n] = cur
+                    heapq.heappush(heap, (nd, n))
+
+    def step(self, cell: Cell) -> Optional[Cell]:
+        """Cell berikutnya dari cell menuju goal (None bila tidak terjangkau / cell terhalang)."""
+        if cell == self.goal:
+            return cell
+        return self.next.get(cell)
+
+
+class Pathfinder:
+    def __init__(self, grid: Grid, max_fields: int = 32):
+        self.grid = grid
+        self.max_fields = max_fields
+        self._fields: "OrderedDict[Cell, FlowField]" = OrderedDict()  # goal -> FlowField (LRU)
+        self._version = grid.version
+        self._requests: Dict[Cell, int] = {}  # goal -> jumlah query pada tick ini
+        # statistik untuk profiling
+        self.astar_queries = 0
+        self.fields_built = 0
+
+    def cached_goals(self) -> List[Cell]:
+        """Goal flow field yang sedang di-cache, dari yang paling lama tidak dipakai (untuk snapshot)."""
+        return list(self._fields)
+
+    def begin_tick(self):
+        self._requests.clear()
+
+    def path(self, start: Cell, goal: Cell) -> Optional[List[Cell]]:
+        """Query tunggal A*."""
+        self.astar_queries += 1
+        return astar(self.grid, start, goal)
+
+    def flow_field(self, goal: Cell) -> FlowField:
+        """Flow field ke goal dari cache; dibangun ulang hanya bila obstacle berubah."""
+        if self.grid.version != self._version:
+            self._fields.clear()
+            self._version = self.grid.version
+        field = self._fields.get(goal)
+        if field is None:
+            field = FlowField(self.grid, goal)
+            self.fields_built += 1
+            self._fields[goal] = field
+            if len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+        else:
+            self._fields.move_to_end(goal)
+        return field
+
+    def next_cell(self, start: Cell, goal: Cell) -> Optional[Cell]:
+        """Cell berikutnya dari start menuju goal (None bila tidak terjangkau)."""
+        if start == goal:
+            return goal
+        if self.grid.version != self._version:
+            self._fields.clear()
+            self._version = self.grid.version
+        n = self._requests.get(goal, 0)
+        self._requests[goal] = n + 1
+        if goal in self._fields or n >= 1:
+            step = self.flow_field(goal).step(start)
+            if step is not None:
+                return step
+        path = self.path(start, goal)
+        return path[1] if path else None
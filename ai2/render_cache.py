@@ -0,0 +1,84 @@
+# render_cache.py
+"""
+Cache layer statis untuk UI pygame (main.py).
+
+Kelas:
+- RenderCache: membangun sekali lalu mem-blit ulang
+    * layer statis: background, bar UI atas + judul, garis grid, protected_zone,
+      obstacle (tembok, rumah);
+    * surface lingkaran scan per radius (scan_cells).
+  Layer statis dibangun ulang hanya bila kuncinya berubah (ukuran layar,
+  protected_zone, judul, ukuran grid, versi obstacle) — mis. saat resize atau
+  ganti konfigurasi.
+"""
+
+import pygame
+from world import CELL_SIZE, GRID_W, GRID_H
+
+BACKGROUND = (10,10,10)
+TOP_BAR = (40,40,40)
+GRID_LINE = (30,30,30)
+ZONE_FILL = (180,40,40,60)
+ZONE_BORDER = (180,40,40)
+SCAN_FILL = (60,60,60,18)
+OBSTACLE_FILL = (90,80,70)
+
+
+def draw_grid(screen):
+    for gx in range(GRID_W):
+        for gy in range(GRID_H):
+            rect = pygame.Rect(gx*CELL_SIZE, gy*CELL_SIZE + 80, CELL_SIZE, CELL_SIZE)
+            pygame.draw.rect(screen, GRID_LINE, rect, 1)
+
+def draw_zone(screen, zone, color=ZONE_FILL):
+    x1,y1,x2,y2 = zone
+    rect = pygame.Rect(x1*CELL_SIZE, y1*CELL_SIZE + 80, (x2-x1+1)*CELL_SIZE, (y2-y1+1)*CELL_SIZE)
+    s = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+    s.fill(color)
+    screen.blit(s, (rect.x, rect.y))
+    pygame.draw.rect(screen, ZONE_BORDER, rect, 2)
+
+def draw_obstacles(screen, blocked, color=OBSTACLE_FILL):
+    for gx, gy in blocked:
+        pygame.draw.rect(screen, color, (gx*CELL_SIZE, gy*CELL_SIZE + 80, CELL_SIZE, CELL_SIZE))
+
+
+class RenderCache:
+    def __init__(self):
+        self._static_key = None
+        self._static = None
+        self._scan = {}  # radius px -> Surface
+
+    def invalidate(self):
+        """Paksa semua surface dibangun ulang pada pemakaian berikutnya."""
+        self._static_key = None
+        self._static = None
+        self._scan.clear()
+
+    def static_layer(self, size, zone, title, grid=None):
+        """Surface penuh layar berisi semua elemen yang tidak berubah antar frame.
+        title: Surface teks judul (sudah di-render); grid: pathfinding.Grid berisi obstacle."""
+        key = (size, zone, id(title), CELL_SIZE, GRID_W, GRID_H,
+               None if grid is None else (id(grid), grid.version))
+        if key != self._static_key:
+            layer = pygame.Surface(size).convert()
+            layer.fill(BACKGROUND)
+            # top UI area
+            pygame.draw.rect(layer, TOP_BAR, (0,0, size[0], 80))
+            layer.blit(title, (8,8))
+            draw_grid(layer)
+            draw_zone(layer, zone)
+            if grid is not None:
+                draw_obstacles(layer, grid.blocked)
+            self._static = layer
+            self._static_key = key
+        return self._static
+
+    def scan_circle(self, radius):
+        """Lingkaran scan transparan dengan radius (px); dibuat sekali per radius."""
+        s = self._scan.get(radius)
+        if s is None:
+            s = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(s, SCAN_FILL, (radius, radius), radius)
+            self._scan[radius] = s
+        return s
@@ -0,0 +1,133 @@
+# spatial.py
+"""
+Spatial hash untuk grid simulator.
+
+Kelas:
+- CellIndex: bucket person per cell (cell_x, cell_y). Index dirawat secara
+  inkremental (add / update / remove) sehingga DroneBrain.decide cukup
+  memeriksa cell di dalam radius scan_cells, bukan seluruh populasi.
+- PersonRegistry: semua person berdasarkan id (lookup O(1)) + CellIndex untuk
+  person yang belum tertangkap (lookup per cell, klik mouse).
+"""
+
+from typing import Dict, Iterator, Tuple
+
+
+class CellIndex:
+    def __init__(self):
+        self.cells: Dict[Tuple[int,int], Dict[str, object]] = {}  # cell -> {pid: person}
+        self._where: Dict[str, Tuple[int,int]] = {}              # pid -> cell terakhir
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, pid):
+        return pid in self._where
+
+    def add(self, person):
+        cell = (person.cell_x, person.cell_y)
+        self._where[person.id] = cell
+        self.cells.setdefault(cell, {})[person.id] = person
+
+    def remove(self, person):
+        cell = self._where.pop(person.id, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        del bucket[person.id]
+        if not bucket:
+            del self.cells[cell]
+
+    def update(self, person):
+        """Pindahkan person ke bucket baru jika cell-nya berubah sejak add/update terakhir."""
+        old = self._where.get(person.id)
+        new = (person.cell_x, person.cell_y)
+        if old == new:
+            return
+        if old is not None:
+            bucket = self.cells[old]
+            del bucket[person.id]
+            if not bucket:
+                del self.cells[old]
+        self._where[person.id] = new
+        self.cells.setdefault(new, {})[person.id] = person
+
+    def at(self, cell: Tuple[int,int]):
+        """Person di satu cell (dict pid -> person, bisa kosong)."""
+        return self.cells.get(cell, {})
+
+    def query(self, cell: Tuple[int,int], radius: int) -> Iterator:
+        """Semua person dengan |dx| <= radius dan |dy| <= radius dari cell (sama dengan in_scan_range)."""
+        cells = self.cells
+        cx, cy = cell
+        # crowd jarang: lebih murah iterasi bucket yang ada daripada (2r+1)^2 lookup
+        if len(cells) < (2*radius + 1) ** 2:
+            for (x, y), bucket in cells.items():
+                if abs(x - cx) <= radius and abs(y - cy) <= radius:
+                    yield from bucket.values()
+            return
+        for x in range(cx - radius, cx + radius + 1):
+            for y in range(cy - radius, cy + radius + 1):
+                bucket = cells.get((x, y))
+                if bucket:
+                    yield from bucket.values()
+
+
+class PersonRegistry:
+    def __init__(self):
+        self.by_id: Dict[str, object] = {}   # pid -> person (urutan spawn)
+        self.cells = CellIndex()             # hanya person yang belum tertangkap
+        self._seq: Dict[str, int] = {}       # pid -> urutan spawn, untuk tie-break
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def get(self, pid):
+        return self.by_id.get(pid)
+
+    def add(self, person):
+        self._seq[person.id] = len(self._seq)
+        self.by_id[person.id] = person
+        if not person.caught:
+            self.cells.add(person)
+
+    def load(self, people, indexed):
+        """
+        Isi ulang dari snapshot. people: semua person urut spawn; indexed: person
+        belum tertangkap urut bucket CellIndex lama, supaya urutan scan (tie-break) sama.
+        """
+        for person in people:
+            self._seq[person.id] = len(self._seq)
+            self.by_id[person.id] = person
+        for person in indexed:
+            self.cells.add(person)
+
+    def indexed(self):
+        """Person di CellIndex, urut cell lalu urut masuk bucket."""
+        return [p for bucket in self.cells.cells.values() for p in bucket.values()]
+
+    def moved(self, person):
+        """Panggil setelah person bergerak."""
+        if not person.caught:
+            self.cells.update(person)
+
+    def caught(self, person):
+        """Panggil saat person tertangkap; keluar dari index cell."""
+        self.cells.remove(person)
+
+    def nearest(self, cell: Tuple[int,int], max_dist: int = 1):
+        """Person belum tertangkap dengan jarak manhattan terkecil (<= max_dist) dari cell, atau None."""
+        cx, cy = cell
+        best = None
+        best_key = None
+        for x in range(cx - max_dist, cx + max_dist + 1):
+            rem = max_dist - abs(x - cx)
+            for y in range(cy - rem, cy + rem + 1):
+                for p in self.cells.at((x, y)).values():
+                    key = (abs(x - cx) + abs(y - cy), self._seq[p.id])
+                    if best_key is None or key < best_key:
+                        best, best_key = p, key
+        return best
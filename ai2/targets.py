@@ -0,0 +1,192 @@
+# targets.py
+"""
+Store untuk shared_targets.
+
+Kelas:
+- Observers: isi field "by" — himpunan terbatas drone id yang pernah melihat
+  target, masing-masing dengan hitungan & waktu terakhir terlihat.
+- TargetRecord: dict record target ("pos", "locked_by", "by", "ts", "warning_only").
+  Perubahan "ts" / "locked_by" diteruskan ke store pemiliknya, jadi DroneBrain
+  tetap boleh mengubah record secara langsung (rec["ts"] = ...).
+- TargetStore: mapping pid -> TargetRecord (API sama dengan dict yang dipakai
+  DroneBrain) dengan:
+    * heap (ts, pid) untuk record yang tidak di-lock -> evict_stale() O(log n)
+      per record yang kedaluwarsa, tanpa menyapu seluruh dict tiap tick;
+    * index kepemilikan lock: drone_id -> set(pid).
+  Entri heap yang sudah usang (ts berubah / record di-lock / dihapus) dibuang
+  secara malas saat di-pop, dan heap dibangun ulang bila terlalu banyak entri usang.
+"""
+
+import heapq
+from collections.abc import MutableMapping
+from typing import Dict, Set
+
+MAX_OBSERVERS = 8  # jumlah drone id maksimum per record "by"
+
+
+class Observers:
+    """Drone yang melihat target. Ukuran tetap: id dengan last_seen tertua dibuang saat penuh."""
+    __slots__ = ("maxlen", "_seen")
+
+    def __init__(self, maxlen: int = MAX_OBSERVERS):
+        self.maxlen = maxlen
+        self._seen: Dict[str, list] = {}  # drone_id -> [count, last_seen]
+
+    def add(self, drone_id, ts=None):
+        entry = self._seen.get(drone_id)
+        if entry is not None:
+            entry[0] += 1
+            entry[1] = ts
+            return
+        if len(self._seen) >= self.maxlen:
+            oldest = min(self._seen, key=lambda k: (self._seen[k][1] is not None, self._seen[k][1]))
+            del self._seen[oldest]
+        self._seen[drone_id] = [1, ts]
+
+    append = add  # kompatibel dengan kode lama yang memperlakukan "by" sebagai list
+
+    def count(self, drone_id):
+        """Berapa kali drone_id melaporkan target ini."""
+        entry = self._seen.get(drone_id)
+        return entry[0] if entry else 0
+
+    def last_seen(self, drone_id):
+        entry = self._seen.get(drone_id)
+        return entry[1] if entry else None
+
+    def __iter__(self):
+        return iter(self._seen)
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __contains__(self, drone_id):
+        return drone_id in self._seen
+
+    def entries(self):
+        """[(drone_id, count, last_seen)] urut saat pertama terlihat (untuk snapshot)."""
+        return [(k, c, ts) for k, (c, ts) in self._seen.items()]
+
+    @classmethod
+    def from_entries(cls, entries, maxlen: int = MAX_OBSERVERS):
+        by = cls(maxlen)
+        for drone_id, count, ts in entries:
+            by._seen[drone_id] = [count, ts]
+        return by
+
+    def __repr__(self):
+        return repr(list(self._seen))
+
+
+class TargetRecord(dict):
+    __slots__ = ("_store", "_pid")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._store = None
+        self._pid = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if self._store is not None and (key == "ts" or key == "locked_by"):
+            self._store._touched(self._pid, self)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __reduce__(self):
+        # isi dict dipulihkan tanpa lewat __setitem__ (store di copy/pickle bisa belum lengkap)
+        return _restore_record, (dict(self), self._store, self._pid)
+
+
+def _restore_record(items, store, pid):
+    rec = TargetRecord(items)
+    rec._store = store
+    rec._pid = pid
+    return rec
+
+
+class TargetStore(MutableMapping):
+    def __init__(self):
+        self._records: Dict[str, TargetRecord] = {}
+        self._heap = []                              # (ts, pid), hanya record tanpa lock
+        self._owner_of: Dict[str, str] = {}          # pid -> drone_id pemegang lock
+        self._owned: Dict[str, Set[str]] = {}        # drone_id -> {pid}
+
+    # ---------- Mapping API ----------
+    def __getitem__(self, pid):
+        return self._records[pid]
+
+    def __setitem__(self, pid, value):
+        old = self._records.get(pid)
+        if old is not None:
+            old._store = None
+        rec = TargetRecord(value)
+        rec._store = self
+        rec._pid = pid
+        self._records[pid] = rec
+        self._touched(pid, rec)
+
+    def __delitem__(self, pid):
+        rec = self._records.pop(pid)
+        rec._store = None
+        self._set_owner(pid, None)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, pid):
+        return pid in self._records
+
+    def get(self, pid, default=None):
+        return self._records.get(pid, default)
+
+    # ---------- index ----------
+    def locked_by(self, drone_id):
+        """pid yang sedang di-lock oleh drone_id."""
+        return set(self._owned.get(drone_id, ()))
+
+    def evict_stale(self, now, ttl):
+        """Hapus record tanpa lock dengan now - ts > ttl. Mengembalikan list pid yang dihapus."""
+        heap = self._heap
+        removed = []
+        while heap and now - heap[0][0] > ttl:
+            ts, pid = heapq.heappop(heap)
+            rec = self._records.get(pid)
+            if rec is None or rec.get("locked_by") is not None or rec.get("ts") != ts:
+                continue  # entri usang
+            del self[pid]
+            removed.append(pid)
+        return removed
+
+    def _touched(self, pid, rec):
+        owner = rec.get("locked_by")
+        self._set_owner(pid, owner)
+        ts = rec.get("ts")
+        if owner is None and ts is not None:
+            heapq.heappush(self._heap, (ts, pid))
+            if len(self._heap) > 2 * len(self._records) + 64:
+                self._rebuild_heap()
+
+    def _set_owner(self, pid, owner):
+        prev = self._owner_of.get(pid)
+        if prev == owner:
+            return
+        if prev is not None:
+            owned = self._owned[prev]
+            owned.discard(pid)
+            if not owned:
+                del self._owned[prev]
+            del self._owner_of[pid]
+        if owner is not None:
+            self._owner_of[pid] = owner
+            self._owned.setdefault(owner, set()).add(pid)
+
+    def _rebuild_heap(self):
+        self._heap = [(rec["ts"], pid) for pid, rec in self._records.items()
+                      if rec.get("locked_by") is None and rec.get("ts") is not None]
+        heapq.heapify(self._heap)
@@ -0,0 +1,546 @@
+# world.py
+"""
+Inti simulasi headless untuk simulator grid (tanpa pygame).
+
+Kelas:
+- Person: orang yang bergerak acak per cell.
+- Drone: badan drone (posisi px/py) yang dikendalikan DroneBrain; saat
+  mengejar, rute lewat pathfinding.Pathfinder supaya tidak menembus obstacle.
+- World: state lengkap (people, drones, shared_targets, PROTECTED_ZONE) yang
+  dimajukan dengan langkah tetap lewat World.step(n). World.snapshot() /
+  World.restore(data) menyimpan & memulihkan state lengkap (simcore.snapshot).
+Waktu simulasi (World.now) maju dt detik per tick, bukan jam dinding, sehingga
+World bisa dijalankan ribuan tick per detik tanpa display. main.py hanya
+menggambar state World.
+
+Jalankan headless dari root repo:  python -m ai2.world --ticks 10000
+Checkpoint:  python -m ai2.world --ticks 10000 --save w.snap
+             python -m ai2.world --ticks 10000 --load w.snap
+"""
+
+import argparse
+import math
+import random
+import time
+
+from simcore import paths
+
+paths.use("ai2")  # brain, spatial, targets, pathfinding diimpor datar dari folder ai2
+from brain import DroneBrain
+from spatial import PersonRegistry
+from targets import Observers, TargetStore
+from pathfinding import Grid, Pathfinder
+from simcore.rng import WorldRNG
+from simcore.assign import Assigner
+from simcore.pursuit import VelocityEstimator, intercept
+from simcore.capture import captures
+from simcore import snapshot
+from simcore.snapshot import gc_paused
+from simcore.profiler import Profiler
+
+# ---------- Konfigurasi Grid ----------
+CELL_SIZE = 28
+GRID_W = 28   # jumlah kolom
+GRID_H = 20   # jumlah baris
+FPS = 20
+
+NUM_PEOPLE = 12
+NUM_DRONES = 3
+THREAT_THRESHOLD = 0.66
+SCAN_CELLS = 4
+STALE_TARGET_TTL = 20.0  # detik (waktu simulasi) sebelum target yang tidak di-lock dibuang
+CAPTURE_RADIUS = 6  # px; drone menangkap target yang di-lock bila pernah lebih dekat dari ini
+
+# protected_zone: rectangle in cell coords (x1,y1,x2,y2)
+PROTECTED_ZONE = (10, 8, 17, 15)  # example: a rectangle near center
+
+# obstacles: rect cell (x1,y1,x2,y2) inklusif yang tidak bisa dilewati person maupun drone
+HOUSE = (12, 10, 15, 13)  # footprint rumah di tengah protected_zone
+WALLS = [
+    (11, 5, 18, 5),   # tembok utara
+    (7, 5, 7, 12),    # tembok barat
+    (20, 11, 20, 18), # tembok timur
+]
+OBSTACLES = [HOUSE] + WALLS
+
+# ---------- Utility ----------
+def clamp(v,a,b): return max(a,min(b,v))
+
+# ---------- Entities ----------
+class Person:
+    def __init__(self, pid, rng=None, grid=None):
+        self.id = pid
+        self.rng = rng or random  # substream WorldRNG, atau modul random global
+        self.grid = grid  # pathfinding.Grid; None = tanpa obstacle
+        while True:
+            self.cell_x = self.rng.randrange(1, GRID_W-1)
+            self.cell_y = self.rng.randrange(4, GRID_H-1)  # keep top rows for UI
+            if grid is None or grid.passable((self.cell_x, self.cell_y)):
+                break
+        self.threat = self.rng.random()
+        self.caught = False
+        self.prev_cell = (self.cell_x, self.cell_y)  # cell tick sebelumnya (swept capture)
+
+    def move(self):
+        self.prev_cell = (self.cell_x, self.cell_y)
+        if self.caught:
+            return
+        dx, dy = self.rng.choice([(0,1),(1,0),(-1,0),(0,-1),(0,0)])
+        x = clamp(self.cell_x + dx, 0, GRID_W-1)
+        y = clamp(self.cell_y + dy, 2, GRID_H-1)
+        if self.grid is None or self.grid.passable((x, y)):
+            self.cell_x, self.cell_y = x, y
+
+class Drone:
+    def __init__(self, did, cell_x, cell_y, shared_targets, clock=time.time,
+                 scan_cells=SCAN_CELLS, threshold=THREAT_THRESHOLD, rng=None):
+        self.id = did
+        self.rng = rng or random
+        self.cell_x = cell_x
+        self.cell_y = cell_y
+        self.shared_targets = shared_targets
+        self.brain = DroneBrain(drone_id=did, shared_targets=shared_targets, scan_cells=scan_cells,
+                                threshold=threshold, clock=clock)
+        # for smooth pos in px
+        self.px = cell_x * CELL_SIZE + CELL_SIZE//2
+        self.py = cell_y * CELL_SIZE + CELL_SIZE//2
+        self.prev_px, self.prev_py = self.px, self.py  # posisi tick sebelumnya, untuk interpolasi render
+        self.speed = 6.0  # pixels per tick
+        self.locked_pid = None
+
+    def update(self, registry, protected_zone, assignment=None, velocities=None, pathfinder=None, capture=True):
+        """capture: False = hanya bergerak; penangkapan diperiksa World (swept) setelah semua drone bergerak."""
+        self.prev_px, self.prev_py = self.px, self.py
+        # call brain.decide using grid cells (registry.cells: scan lokal per cell)
+        drone_cell = (self.cell_x, self.cell_y)
+        action = self.brain.decide(drone_cell, registry, protected_zone, index=registry.cells,
+                                   assignment=assignment)
+        # if brain locked a target for pursuit, update local locked_pid
+        self.locked_pid = self.brain.target_id
+
+        # If we have a locked target to pursue, move toward that person's cell center
+        if self.locked_pid:
+            p = registry.get(self.locked_pid)
+            if p is None:
+                self.brain.release_lock(self.locked_pid)
+                self.locked_pid = None
+                return action
+            # compute target pixel pos
+            tx = p.cell_x * CELL_SIZE + CELL_SIZE//2
+            ty = p.cell_y * CELL_SIZE + CELL_SIZE//2
+            dist = math.hypot(tx - self.px, ty - self.py) + 1e-6
+            waypoint = self._waypoint(pathfinder, (p.cell_x, p.cell_y)) if pathfinder else None
+            if waypoint is not None:
+                # obstacle di antara drone dan target: terbang ke pusat cell berikutnya di rute
+                tx = waypoint[0] * CELL_SIZE + CELL_SIZE//2
+                ty = waypoint[1] * CELL_SIZE + CELL_SIZE//2
+            elif velocities is not None:
+                # bidik titik intercept (kecepatan person dalam cell/tick -> px/tick)
+                vx, vy = velocities.velocity(p.id)
+                tx, ty = intercept(tx, ty, vx * CELL_SIZE, vy * CELL_SIZE, self.px, self.py, self.speed)
+            # move toward tx,ty with simple steering
+            dx = tx - self.px
+            dy = ty - self.py
+            aim_dist = math.hypot(dx,dy) + 1e-6
+            step = min(self.speed, aim_dist)
+            self.px += (dx/aim_dist) * step
+            self.py += (dy/aim_dist) * step
+            # update cell position when center crossed
+            self.cell_x = int(self.px // CELL_SIZE)
+            self.cell_y = int((self.py - 80) // CELL_SIZE) if self.py >= 80 else self.cell_y
+            # capture if reached cell center
+            if capture and dist < CAPTURE_RADIUS:
+                self.capture(p, registry)
+            return action
+        else:
+            # patrol randomly (move cell by cell occasionally)
+            if self.rng.random() < 0.3:
+                dx, dy = self.rng.choice([(0,1),(1,0),(-1,0),(0,-1),(0,0)])
+                x = clamp(self.cell_x + dx, 0, GRID_W-1)
+                y = clamp(self.cell_y + dy, 2, GRID_H-1)
+                if pathfinder is None or pathfinder.grid.passable((x, y)):
+                    self.cell_x, self.cell_y = x, y
+                    # snap pixel pos to cell center
+                    self.px = self.cell_x * CELL_SIZE + CELL_SIZE//2
+                    self.py = self.cell_y * CELL_SIZE + CELL_SIZE//2
+            return action
+
+    def capture(self, p, registry):
+        # mark caught
+        p.caught = True
+        registry.caught(p)
+        # inform brain registry
+        self.brain.capture_occurred(p.id)
+        self.locked_pid = None
+
+    def _waypoint(self, pathfinder, goal):
+        """
+        Cell berikutnya di rute ke goal, atau None bila drone boleh terbang lurus
+        (sudah di cell goal / cell berikutnya adalah goal / goal tidak terjangkau).
+        Cell rute dihitung dari px/py, di koordinat yang sama dengan pusat cell target.
+        """
+        start = (int(self.px // CELL_SIZE), int(self.py // CELL_SIZE))
+        if start == goal:
+            return None
+        nxt = pathfinder.next_cell(start, goal)
+        return None if nxt is None or nxt == goal else nxt
+
+# ---------- World ----------
+class World:
+    def __init__(self, num_people=NUM_PEOPLE, num_drones=NUM_DRONES, protected_zone=PROTECTED_ZONE, fps=FPS,
+                 threshold=THREAT_THRESHOLD, scan_cells=SCAN_CELLS, seed=None, assign=True, intercept=True,
+                 obstacles=OBSTACLES, swept=True):
+        """
+        num_people / num_drones: populasi awal
+        protected_zone: (x1,y1,x2,y2) dalam koordinat cell (inklusif)
+        fps: tick per detik simulasi (dt = 1/fps)
+        threshold / scan_cells: parameter DroneBrain tiap drone
+        seed: seed WorldRNG (None = acak; seed yang dipakai ada di self.rng.seed)
+        assign: True = target pursuit dibagi global antar drone (Hungarian) tiap tick;
+                False = lock first-come lewat shared_targets saja
+        intercept: True = drone membidik titik intercept (kecepatan person diestimasi); False = posisi person
+        obstacles: list rect cell yang terhalang (tembok, rumah); kosong = drone terbang lurus seperti dulu
+        swept: True = penangkapan kontinu sepanjang tick (simcore.capture, semua drone sekaligus);
+               False = cek jarak titik sebelum drone bergerak
+        """
+        self.protected_zone = protected_zone
+        self.threshold = threshold
+        self.fps = fps
+        self.dt = 1.0 / fps
+        self.tick = 0
+        self.now = 0.0  # waktu simulasi (detik)
+        self.rng = WorldRNG(seed)
+        self.shared_targets = TargetStore()  # heap TTL + index lock, API seperti dict
+        self.people = []
+        self.registry = PersonRegistry()  # person per id + per cell
+        # assignment hanya dalam jangkauan scan; cell diskrit, jadi solve ulang tiap ada yang pindah cell
+        self.assigner = Assigner(tolerance=0, reach=scan_cells) if assign else None
+        self.velocities = VelocityEstimator() if intercept else None  # pid -> kecepatan (cell/tick)
+        self.grid = Grid(GRID_W, GRID_H, obstacles)
+        # flow field per cell target di-cache di sini dan dipakai bersama semua drone
+        self.pathfinder = Pathfinder(self.grid) if obstacles else None
+        self.swept = swept
+        self.drones = []
+        for _ in range(num_people):
+            self.spawn_person()
+        for i in range(num_drones):
+            cx = int((i+1) * GRID_W / (num_drones+1))
+            cy = 3
+            self.drones.append(Drone(f"D{i}", cx, cy, self.shared_targets, clock=self.clock,
+                                     scan_cells=scan_cells, threshold=threshold,
+                                     rng=self.rng.stream(f"drone:D{i}")))
+        # metrik untuk sweep/benchmark
+        self.stats = {"captures": 0, "false_pursuits": 0, "warnings": 0}
+        self.capture_latencies = []   # tick dari person pertama kali boleh dikejar sampai tertangkap
+        self._eligible_since = {}     # pid -> tick pertama threat > threshold di dalam protected_zone
+        # waktu per fase tick; UI memasang Profiler aktif di sini (mati = hampir tanpa biaya)
+        self.profiler = Profiler(enabled=False)
+
+    def clock(self):
+        """Waktu simulasi saat ini; dipakai DroneBrain untuk 'ts'."""
+        return self.now
+
+    def spawn_person(self):
+        """Tambah person baru (tombol SPACE di UI)."""
+        pid = f"P{len(self.people)}"
+        p = Person(pid, self.rng.stream(f"person:{pid}"), self.grid if self.grid.blocked else None)
+        self.people.append(p)
+        self.registry.add(p)
+        return p
+
+    def raise_threat_near(self, cell_x, cell_y, amount=0.25):
+        """Naikkan threat person terdekat (jarak manhattan <= 1) dari cell yang diklik."""
+        nearest = self.registry.nearest((cell_x, cell_y), max_dist=1)
+        if nearest:
+            nearest.threat = min(1.0, nearest.threat + amount)
+        return nearest
+
+    # ---------- snapshot ----------
+    @gc_paused
+    def snapshot(self):
+        """State lengkap World sebagai bytes simcore.snapshot; World.restore(data) membangun ulang World yang sama."""
+        people, drones = self.people, self.drones
+        prow = {p.id: i for i, p in enumerate(people)}
+        drow = {d.id: i for i, d in enumerate(drones)}
+        recs = list(self.shared_targets.items())
+        obs = [(r, drow[did], count, ts)
+               for r, (_pid, rec) in enumerate(recs) for did, count, ts in rec["by"].entries()]
+        vel = self.velocities.state() if self.velocities is not None else {}
+        cached = self.assigner.state() if self.assigner is not None else None
+        pathfinder = self.pathfinder
+        meta = {
+            "world": "ai2", "seed": self.rng.seed, "tick": self.tick, "now": self.now,
+            "protected_zone": list(self.protected_zone), "fps": self.fps, "threshold": self.threshold,
+            "scan_cells": drones[0].brain.scan_cells if drones else SCAN_CELLS,
+            "assign": self.assigner is not None, "intercept": self.velocities is not None, "swept": self.swept,
+            "blocked": sorted(self.grid.blocked),
+            "fields": [list(goal) for goal in pathfinder.cached_goals()] if pathfinder else [],
+            "pathfinder_stats": [pathfinder.astar_queries, pathfinder.fields_built] if pathfinder else [],
+            "stats": self.stats, "assign_cached": cached is not None,
+        }
+        cols = {
+            "people.id": [p.id for p in people],
+            "people.cell_x": snapshot.ints([p.cell_x for p in people]),
+            "people.cell_y": snapshot.ints([p.cell_y for p in people]),
+            "people.prev_x": snapshot.ints([p.prev_cell[0] for p in people]),
+            "people.prev_y": snapshot.ints([p.prev_cell[1] for p in people]),
+            "people.threat": snapshot.floats([p.threat for p in people]),
+            "people.caught": snapshot.flags([p.caught for p in people]),
+            "people.indexed": snapshot.ints([prow[p.id] for p in self.registry.indexed()]),
+            "drones.id": [d.id for d in drones],
+            "drones.cell_x": snapshot.ints([d.cell_x for d in drones]),
+            "drones.cell_y": snapshot.ints([d.cell_y for d in drones]),
+            "drones.px": snapshot.floats([d.px for d in drones]),
+            "drones.py": snapshot.floats([d.py for d in drones]),
+            "drones.prev_px": snapshot.floats([d.prev_px for d in drones]),
+            "drones.prev_py": snapshot.floats([d.prev_py for d in drones]),
+            "drones.speed": snapshot.floats([d.speed for d in drones]),
+            "drones.locked": snapshot.ints([prow[d.locked_pid] if d.locked_pid else -1 for d in drones]),
+            "drones.brain_target": snapshot.ints([prow[d.brain.target_id] if d.brain.target_id else -1
+                                                  for d in drones]),
+            "targets.person": snapshot.ints([prow[pid] for pid, _rec in recs]),
+            "targets.pos_x": snapshot.ints([rec["pos"][0] for _pid, rec in recs]),
+            "targets.pos_y": snapshot.ints([rec["pos"][1] for _pid, rec in recs]),
+            "targets.locked_by": snapshot.ints([-1 if rec["locked_by"] is None else drow[rec["locked_by"]]
+                                                for _pid, rec in recs]),
+            "targets.ts": snapshot.floats([rec["ts"] for _pid, rec in recs]),
+            "targets.warning_only": snapshot.flags([rec["warning_only"] for _pid, rec in recs]),
+            "observers.target": snapshot.ints([o[0] for o in obs]),
+            "observers.drone": snapshot.ints([o[1] for o in obs]),
+            "observers.count": snapshot.ints([o[2] for o in obs]),
+            "observers.seen": snapshot.floats([math.nan if o[3] is None else o[3] for o in obs]),
+            "velocity.person": snapshot.ints([prow[pid] for pid in vel]),
+            "velocity.state": snapshot.floats([v for s in vel.values() for v in s]),
+            "eligible.person": snapshot.ints([prow[pid] for pid in self._eligible_since]),
+            "eligible.tick": snapshot.ints(list(self._eligible_since.values())),
+            "capture_latencies": snapshot.ints(self.capture_latencies),
+            **snapshot.rng_columns(self.rng),
+        }
+        if cached is not None:
+            agents, targets, threats, xy, result = cached
+            cols.update({
+                "assign.agents": snapshot.ints([drow[did] for did in agents]),
+                "assign.targets": snapshot.ints([prow[pid] for pid in targets]),
+                "assign.threats": snapshot.floats(threats),
+                "assign.xy": snapshot.floats([v for pt in xy for v in pt]),
+                "assign.result": snapshot.ints([-1 if pid is None else prow[pid] for pid in result]),
+            })
+        return snapshot.pack(meta, cols)
+
+    @classmethod
+    @gc_paused
+    def restore(cls, data):
+        """World baru dari bytes World.snapshot(); melanjutkan step persis seperti World asalnya."""
+        meta, cols = snapshot.unpack(data)
+        if meta.get("world") != "ai2":
+            raise ValueError(f"snapshot bukan World ai2: {meta.get('world')}")
+        world = cls(num_people=0, num_drones=0, protected_zone=tuple(meta["protected_zone"]), fps=meta["fps"],
+                    threshold=meta["threshold"], scan_cells=meta["scan_cells"], seed=meta["seed"],
+                    assign=meta["assign"], intercept=meta["intercept"],
+                    obstacles=[(x, y, x, y) for x, y in meta["blocked"]], swept=meta["swept"])
+        world.tick, world.now = meta["tick"], meta["now"]
+        world.stats = dict(meta["stats"])
+        rng = world.rng
+        snapshot.restore_rng(rng, cols)
+
+        # person dibuat tanpa __init__ (yang mengambil angka acak untuk spawn)
+        grid = world.grid if world.grid.blocked else None
+        people = world.people
+        for pid, cx, cy, ox, oy, threat, caught in zip(
+                cols["people.id"], cols["people.cell_x"], cols["people.cell_y"], cols["people.prev_x"],
+                cols["people.prev_y"], cols["people.threat"], cols["people.caught"]):
+            p = Person.__new__(Person)
+            p.id, p.rng, p.grid = pid, rng.stream(f"person:{pid}"), grid
+            p.cell_x, p.cell_y, p.prev_cell = cx, cy, (ox, oy)
+            p.threat, p.caught = threat, bool(caught)
+            people.append(p)
+        world.registry.load(people, [people[i] for i in cols["people.indexed"]])
+
+        def pid_at(i):
+            return None if i < 0 else people[i].id
+
+        for did, cx, cy, px, py, prev_px, prev_py, speed, locked, brain_target in zip(
+                cols["drones.id"], cols["drones.cell_x"], cols["drones.cell_y"], cols["drones.px"],
+                cols["drones.py"], cols["drones.prev_px"], cols["drones.prev_py"], cols["drones.speed"],
+                cols["drones.locked"], cols["drones.brain_target"]):
+            d = Drone(did, cx, cy, world.shared_targets, clock=world.clock, scan_cells=meta["scan_cells"],
+                      threshold=world.threshold, rng=rng.stream(f"drone:{did}"))
+            d.px, d.py, d.prev_px, d.prev_py, d.speed = px, py, prev_px, prev_py, speed
+            d.locked_pid, d.brain.target_id = pid_at(locked), pid_at(brain_target)
+            world.drones.append(d)
+        drones = world.drones
+
+        observers = [[] for _ in cols["targets.person"]]
+        for r, di, count, ts in zip(cols["observers.target"], cols["observers.drone"], cols["observers.count"],
+                                    cols["observers.seen"]):
+            observers[r].append((drones[di].id, count, None if math.isnan(ts) else ts))
+        for row, x, y, locked_by, ts, warning_only, by in zip(
+                cols["targets.person"], cols["targets.pos_x"], cols["targets.pos_y"], cols["targets.locked_by"],
+                cols["targets.ts"], cols["targets.warning_only"], observers):
+            world.shared_targets[people[row].id] = {
+                "pos": (x, y),
+                "locked_by": None if locked_by < 0 else drones[locked_by].id,
+                "by": Observers.from_entries(by),
+                "ts": ts,
+                "warning_only": bool(warning_only),
+            }
+
+        if world.velocities is not None:
+            flat = cols["velocity.state"]
+            world.velocities.set_state({people[i].id: list(flat[5 * k:5 * k + 5])
+                                        for k, i in enumerate(cols["velocity.person"])})
+        if meta["assign_cached"]:
+            xy = cols["assign.xy"]
+            world.assigner.set_state((
+                [drones[i].id for i in cols["assign.agents"]], [people[i].id for i in cols["assign.targets"]],
+                list(cols["assign.threats"]), list(zip(xy[0::2], xy[1::2])),
+                [pid_at(i) for i in cols["assign.result"]]))
+        if world.pathfinder is not None:
+            # flow field yang sempat di-cache ikut menentukan A* vs field di next_cell
+            for goal in meta["fields"]:
+                world.pathfinder.flow_field(tuple(goal))
+            world.pathfinder.astar_queries, world.pathfinder.fields_built = meta["pathfinder_stats"]
+        world._eligible_since = {people[i].id: t for i, t in zip(cols["eligible.person"], cols["eligible.tick"])}
+        world.capture_latencies = list(cols["capture_latencies"])
+        return world
+
+    def _assign_targets(self, pursuable):
+        """
+        pid -> drone id dari assignment global (biaya = jarak cell / threat).
+        Drone yang sedang memegang lock tetap pada targetnya; yang dibagi hanya
+        drone bebas x target yang belum di-lock, supaya tidak ada pindah target bolak-balik.
+        """
+        assignment = {d.locked_pid: d.id for d in self.drones if d.locked_pid}
+        drones = [d for d in self.drones if not d.locked_pid]
+        pursuable = [p for p in pursuable if p.id not in assignment]
+        assigned = self.assigner.assign([d.id for d in drones], [(d.cell_x, d.cell_y) for d in drones],
+                                        [p.id for p in pursuable], [(p.cell_x, p.cell_y) for p in pursuable],
+                                        [p.threat for p in pursuable])
+        assignment.update((pid, d.id) for d, pid in zip(drones, assigned) if pid is not None)
+        return assignment
+
+    def _swept_captures(self):
+        """Drone yang melewati target lock-nya dalam CAPTURE_RADIUS selama tick ini (pusat cell, px)."""
+        registry = self.registry
+        chasing, targets = [], []
+        for d in self.drones:
+            p = registry.get(d.locked_pid) if d.locked_pid else None
+            if p is not None and not p.caught:
+                chasing.append(d)
+                targets.append(p)
+        if not chasing:
+            return
+        half = CELL_SIZE // 2
+        hits = captures([(d.prev_px, d.prev_py) for d in chasing], [(d.px, d.py) for d in chasing],
+                        [(p.prev_cell[0] * CELL_SIZE + half, p.prev_cell[1] * CELL_SIZE + half) for p in targets],
+                        [(p.cell_x * CELL_SIZE + half, p.cell_y * CELL_SIZE + half) for p in targets],
+                        CAPTURE_RADIUS, targets=range(len(targets)))
+        for i, _j, _t in hits:
+            chasing[i].capture(targets[i], registry)
+
+    def step(self, n=1):
+        """Majukan simulasi n tick tetap."""
+        for _ in range(n):
+            self._tick()
+
+    def _tick(self):
+        shared_targets = self.shared_targets
+        registry = self.registry
+
+        eligible_since = self._eligible_since
+        threshold = self.threshold
+        x1, y1, x2, y2 = self.protected_zone
+        stats = self.stats
+        mark = self.profiler.mark
+
+        # update people (record target yang tertangkap sudah dihapus lewat brain.capture_occurred)
+        pursuable = []  # boleh dikejar: threat > threshold di dalam protected_zone
+        velocities = self.velocities
+        for p in self.people:
+            p.move()
+            registry.moved(p)
+            if p.caught or p.threat <= threshold:
+                continue
+            if velocities is not None:
+                velocities.observe(p.id, p.cell_x, p.cell_y)
+            if x1 <= p.cell_x <= x2 and y1 <= p.cell_y <= y2:
+                pursuable.append(p)
+                if p.id not in eligible_since:
+                    eligible_since[p.id] = self.tick
+        mark("people")
+
+        assignment = self._assign_targets(pursuable) if self.assigner else None
+        mark("assign")
+
+        # update drones (brain + movement)
+        pathfinder = self.pathfinder
+        if pathfinder is not None:
+            pathfinder.begin_tick()
+        prevs = [d.locked_pid for d in self.drones]
+        for d in self.drones:
+            action = d.update(registry, self.protected_zone, assignment, velocities, pathfinder,
+                              capture=not self.swept)
+            if action.startswith("WARN"):
+                stats["warnings"] += 1
+        if self.swept:
+            self._swept_captures()
+        for d, prev in zip(self.drones, prevs):
+            if prev is not None and d.locked_pid != prev:
+                target = registry.get(prev)
+                if target is not None and target.caught:
+                    stats["captures"] += 1
+                    if velocities is not None:
+                        velocities.forget(prev)
+                    since = eligible_since.pop(prev, None)
+                    if since is not None:
+                        self.capture_latencies.append(self.tick - since)
+                else:
+                    # lock lepas tanpa penangkapan
+                    stats["false_pursuits"] += 1
+        mark("brains")
+
+        # cleanup stale shared_targets older than STALE_TARGET_TTL (and not locked)
+        shared_targets.evict_stale(self.now, STALE_TARGET_TTL)
+        mark("cleanup")
+
+        self.tick += 1
+        self.now = self.tick * self.dt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Jalankan simulasi grid tanpa display.")
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--people", type=int, default=NUM_PEOPLE)
+    parser.add_argument("--drones", type=int, default=NUM_DRONES)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--load", help="lanjutkan dari file snapshot (World.snapshot)")
+    parser.add_argument("--save", help="simpan snapshot di akhir run")
+    parser.add_argument("--profile", help="ukur waktu per fase tiap tick dan export ke file JSON ini")
+    args = parser.parse_args()
+
+    if args.load:
+        world = World.restore(snapshot.load(args.load))
+    else:
+        world = World(num_people=args.people, num_drones=args.drones, seed=args.seed)
+    t0 = time.perf_counter()
+    if args.profile:
+        prof = world.profiler = Profiler(window=args.ticks)
+        for _ in range(args.ticks):
+            prof.begin()
+            world.step()
+            prof.end()
+    else:
+        world.step(args.ticks)
+    elapsed = time.perf_counter() - t0
+    if args.save:
+        snapshot.save(args.save, world.snapshot())
+    caught = sum(1 for p in world.people if p.caught)
+    print(f"{args.ticks} ticks in {elapsed:.3f}s ({args.ticks / elapsed:.0f} ticks/s), "
+          f"caught={caught}/{len(world.people)} shared_targets={len(world.shared_targets)} seed={world.rng.seed}")
+    if args.profile:
+        for name, s in world.profiler.summary().items():
+            print(f"  {name:8s} mean {s['mean']:.3f} ms  p99 {s['p99']:.3f} ms  {s['share']:.0%}")
+        world.profiler.export(args.profile, sim="ai2", seed=world.rng.seed, people=len(world.people))
+
+if __name__ == "__main__":
+    main()
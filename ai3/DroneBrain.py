@@ -1,80 +1,253 @@
 # --- DroneBrain.py ---
+"""
+Otak drone Eye X sebagai state machine berbasis event (tanpa pygame).
 
-import time
+- Rect: kotak ringan (x, y, w, h) pengganti pygame.Rect untuk objek simulasi.
+- TimerQueue: heap timer (waktu, urutan, brain, event). Satu TimerQueue bisa
+  dipakai bersama ribuan DroneBrain; run_until(t) hanya membangunkan brain
+  yang timernya jatuh tempo.
+- DroneBrain: status STANDBY/FOLLOWING/ALERT/ATTACKING. Transisi ada di tabel
+  TRANSITIONS (status, event) -> status baru; timer tiap status ada di
+  STATE_TIMERS dan dijadwalkan saat status dimasuki. Timer dari status lama
+  dibuang secara malas lewat nomor epoch.
+  Peluang per frame versi lama (1/150 deteksi, 1/300 objek hilang, @60 Hz)
+  dipertahankan: waktu tunggunya diambil sekali dari distribusi geometrik.
+  Posisi objek dimajukan tiap TRACK_INTERVAL (dan saat UI memintanya).
+
+Log memakai modul logging (logger "DroneBrain"), bukan print.
+
+Uji beban headless (dari root repo):  python -m ai3.DroneBrain --brains 5000 --seconds 600
+"""
+
+import argparse
+import heapq
+import logging
+import math
 import random
+import time
+
+from simcore.rng import WorldRNG
+
+log = logging.getLogger("DroneBrain")
+
+FRAME = 1 / 60          # detik per frame simulasi (laju polling versi lama)
+DETECT_CHANCE = 1 / 150  # peluang per frame objek terdeteksi saat STANDBY
+LOST_CHANCE = 1 / 300    # peluang per frame objek hilang saat FOLLOWING
+TRACK_INTERVAL = 0.5     # detik antar update posisi objek (batas layar hanya dicek di ujung tiap update)
+ATTACK_DURATION = 3      # detik simulasi aksi pertahanan
+STEP_VARIANCE = 8 / 3    # variansi langkah objek per frame per sumbu ({-2, 0, 2} seragam)
+
+# (status, event) -> status baru; event lain pada status itu diabaikan
+TRANSITIONS = {
+    ("STANDBY", "detect"): "FOLLOWING",
+    ("FOLLOWING", "consistent"): "ALERT",
+    ("FOLLOWING", "lost"): "STANDBY",
+    ("FOLLOWING", "exit"): "STANDBY",
+    ("ALERT", "exit"): "STANDBY",
+    ("ALERT", "SERANG"): "ATTACKING",
+    ("ALERT", "ABAIKAN"): "FOLLOWING",
+    ("ATTACKING", "done"): "STANDBY",
+}
+
+# pesan log per transisi
+MESSAGES = {
+    ("STANDBY", "detect"): "Orang asing terdeteksi. Beralih ke FOLLOWING.",
+    ("FOLLOWING", "consistent"): "Gerakan Konsisten. Mengirim Notifikasi ALERT!",
+    ("FOLLOWING", "lost"): "Objek hilang. Kembali ke STANDBY.",
+    ("ALERT", "SERANG"): "Perintah SERANG diterima!",
+    ("ALERT", "ABAIKAN"): "Perintah ABAIKAN diterima. Melanjutkan FOLLOWING.",
+    ("ATTACKING", "done"): "Aksi Pertahanan Selesai. Kembali ke STANDBY.",
+}
+EXIT_MESSAGE = "Objek keluar batas. Kembali ke STANDBY."
+
+# status -> nama method yang mengembalikan list (delay detik, event) saat status dimasuki
+STATE_TIMERS = {
+    "STANDBY": "_standby_timers",
+    "FOLLOWING": "_following_timers",
+    "ALERT": "_alert_timers",
+    "ATTACKING": "_attacking_timers",
+}
+
+
+def _frames_until(rng, chance):
+    """Jumlah frame sampai kejadian pertama dengan peluang `chance` per frame (geometrik, >= 1)."""
+    u = rng.random()
+    return max(1, math.ceil(math.log(1.0 - u) / math.log(1.0 - chance)))
+
+
+class Rect:
+    """Kotak (x, y, w, h); bisa di-unpack / dipakai sebagai tuple oleh pygame.draw.rect."""
+    __slots__ = ("x", "y", "w", "h")
+
+    def __init__(self, x, y, w, h):
+        self.x, self.y, self.w, self.h = x, y, w, h
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.w, self.h))
+
+    def __repr__(self):
+        return f"Rect({self.x}, {self.y}, {self.w}, {self.h})"
+
+
+class TimerQueue:
+    def __init__(self, now=0.0):
+        self.now = now
+        self._heap = []
+        self._seq = 0  # pemecah seri supaya urutan timer deterministik
+        self.fired = 0
+
+    def schedule(self, when, brain, event, epoch):
+        self._seq += 1
+        heapq.heappush(self._heap, (when, self._seq, brain, event, epoch))
+
+    def next_time(self):
+        return self._heap[0][0] if self._heap else None
+
+    def run_until(self, t):
+        """Jalankan semua timer dengan waktu <= t (berurutan), lalu set now = t."""
+        heap = self._heap
+        while heap and heap[0][0] <= t:
+            when, _seq, brain, event, epoch = heapq.heappop(heap)
+            if epoch != brain.epoch:
+                continue  # timer milik status yang sudah ditinggalkan
+            self.now = when
+            self.fired += 1
+            brain.handle(event, when)
+        if t > self.now:
+            self.now = t
+
+    def __len__(self):
+        return len(self._heap)
+
 
 class DroneBrain:
     """Mengelola status drone dan logika deteksi/keputusan."""
-    
+
     # Status yang mungkin
     STATUS = ["STANDBY", "FOLLOWING", "ALERT", "ATTACKING"]
-    
-    def __init__(self):
+
+    def __init__(self, rng=None, timers=None, screen_size=(800, 600), drone_id=None, on_transition=None):
+        """
+        rng: substream simcore.rng.WorldRNG, atau modul random global
+        timers: TimerQueue bersama; None = TimerQueue sendiri yang mulai dari time.time()
+        screen_size: batas layar (lebar, tinggi) untuk objek simulasi
+        on_transition: callback(brain, status_lama, event, waktu) setelah status berubah
+        """
+        self.rng = rng or random
+        self.timers = timers if timers is not None else TimerQueue(time.time())
+        self.screen_width, self.screen_height = screen_size
+        self.drone_id = drone_id
+        self.on_transition = on_transition
         self.status = "STANDBY"
         self.sim_person_rect = None # Objek simulasi (posisi)
         self.sim_object_timer = 0
-        self.last_alert_time = time.time()
+        self.last_alert_time = self.timers.now
         self.alert_interval = 10 # 10 detik konsistensi dianggap bahaya
+        self.epoch = 0
+        self._walk_time = 0  # waktu posisi objek terakhir dimajukan
+        self._enter(self.timers.now)
+
+    # ---------- mesin status ----------
+    def handle(self, event, now):
+        """Proses satu event (timer atau input) pada waktu now."""
+        if event == "track":
+            if self.status in ("FOLLOWING", "ALERT"):
+                self._track(now)
+            return
+        new = TRANSITIONS.get((self.status, event))
+        if new is None:
+            return
+        old = self.status
+        if (old, event) == ("STANDBY", "detect"):
+            self.sim_person_rect = Rect(self.rng.randint(50, self.screen_width - 150), self.screen_height - 150, 50, 100)
+            self.sim_object_timer = now
+            self._walk_time = now
+        elif event == "consistent":
+            self.last_alert_time = now
+        elif event == "SERANG":
+            self.last_alert_time = now  # Reset timer untuk durasi attack
+        elif event == "ABAIKAN":
+            self.sim_object_timer = now  # jendela konsistensi dimulai lagi
+        if new == "STANDBY":
+            self._clear_object()
+        if log.isEnabledFor(logging.INFO):
+            msg = EXIT_MESSAGE if event == "exit" else MESSAGES[(old, event)]
+            if event == "consistent":
+                msg = f"{msg} ({time.ctime()})"
+            log.info("LOGIKA: %s%s", f"[{self.drone_id}] " if self.drone_id is not None else "", msg)
+        self.status = new
+        self._enter(now)
+        if self.on_transition is not None:
+            self.on_transition(self, old, event, now)
+
+    def _enter(self, now):
+        """Masuk status sekarang: batalkan timer lama (epoch) dan jadwalkan timer status ini."""
+        self.epoch += 1
+        for delay, event in getattr(self, STATE_TIMERS[self.status])(now):
+            self.timers.schedule(now + delay, self, event, self.epoch)
+
+    def _standby_timers(self, now):
+        return [(_frames_until(self.rng, DETECT_CHANCE) * FRAME, "detect")]
+
+    def _following_timers(self, now):
+        return [(max(0.0, self.sim_object_timer + self.alert_interval - now), "consistent"),
+                (_frames_until(self.rng, LOST_CHANCE) * FRAME, "lost"),
+                (TRACK_INTERVAL, "track")]
 
-    def update_status(self, current_time, screen_width, screen_height):
-        """Logika utama untuk memperbarui status drone."""
-        
-        # Inisialisasi: Coba 'temukan' objek jika STANDBY
-        if self.status == "STANDBY" and self.sim_person_rect is None:
-            if random.randint(1, 150) == 1:
-                # Objek 'muncul' di sekitar batas bawah layar
-                self.sim_person_rect = pygame.Rect(random.randint(50, screen_width - 150), screen_height - 150, 50, 100)
-                self.status = "FOLLOWING"
-                self.sim_object_timer = current_time
-                print("LOGIKA: Orang asing terdeteksi. Beralih ke FOLLOWING.")
-                
-        # Logika KETIKA objek terdeteksi
-        if self.sim_person_rect is not None:
-            # Transisi ke ALERT (Simulasi Bahaya Konsisten)
-            if self.status == "FOLLOWING" and (current_time - self.sim_object_timer) > self.alert_interval:
-                self.status = "ALERT"
-                self.last_alert_time = current_time
-                print(f"LOGIKA: Gerakan Konsisten. Mengirim Notifikasi ALERT! ({time.ctime()})")
-            
-            # Logika Pergerakan Simulasi
-            if self.status in ["FOLLOWING", "ALERT"]:
-                # Pergerakan acak dalam batas
-                self.sim_person_rect.x += random.choice([-1, 0, 1]) * 2
-                self.sim_person_rect.y += random.choice([-1, 0, 1]) * 2
-                
-            # Logika Objek Keluar Batas
-            if self.sim_person_rect.x < 0 or self.sim_person_rect.x > screen_width or \
-               self.sim_person_rect.y < 0 or self.sim_person_rect.y > screen_height:
-                self.reset_to_standby()
-                print("LOGIKA: Objek keluar batas. Kembali ke STANDBY.")
-        
-        # Logika Aksi ATTACKING selesai
-        if self.status == "ATTACKING":
-            if (current_time - self.last_alert_time) > 3: # Simulasi aksi 3 detik
-                self.reset_to_standby()
-                print("LOGIKA: Aksi Pertahanan Selesai. Kembali ke STANDBY.")
-        
-        # Logika Objek Hilang (Kembali ke STANDBY jika FOLLOWING dan objek hilang)
-        # (Tambahan: Jika objek hilang secara acak)
-        elif self.status == "FOLLOWING" and random.randint(1, 300) == 1:
-             self.reset_to_standby()
-             print("LOGIKA: Objek hilang. Kembali ke STANDBY.")
-
-
-    def process_owner_command(self, command):
+    def _alert_timers(self, now):
+        return [(TRACK_INTERVAL, "track")]
+
+    def _attacking_timers(self, now):
+        return [(ATTACK_DURATION, "done")]
+
+    def _track(self, now):
+        """Majukan posisi objek sampai now; keluar batas -> event exit."""
+        if self._advance_object(now):
+            self.handle("exit", now)
+        else:
+            self.timers.schedule(now + TRACK_INTERVAL, self, "track", self.epoch)
+
+    def _advance_object(self, now):
+        """
+        Majukan random walk objek untuk frame yang lewat sejak update terakhir; True bila keluar batas.
+        Versi lama melangkah {-2,0,2} per sumbu per frame; jumlah n langkah itu diambil sekaligus
+        sebagai normal dengan variansi yang sama (n * 8/3), jadi biayanya tidak tergantung n.
+        Hanya posisi akhir yang dicek terhadap batas layar: objek yang keluar lalu masuk lagi
+        di tengah interval tidak dihitung keluar (versi lama mengecek tiap frame).
+        """
+        rect = self.sim_person_rect
+        if rect is None or self.status not in ("FOLLOWING", "ALERT"):
+            self._walk_time = now
+            return False
+        frames = int((now - self._walk_time) / FRAME)
+        if frames <= 0:
+            return False
+        self._walk_time += frames * FRAME
+        # Box-Muller: dua uniform -> dua normal independen (sumbu x dan y)
+        r = math.sqrt(-2.0 * math.log(1.0 - self.rng.random()) * frames * STEP_VARIANCE)
+        a = 2.0 * math.pi * self.rng.random()
+        rect.x += int(round(r * math.cos(a)))
+        rect.y += int(round(r * math.sin(a)))
+        return rect.x < 0 or rect.x > self.screen_width or rect.y < 0 or rect.y > self.screen_height
+
+    # ---------- API lama ----------
+    def update_status(self, current_time, screen_width=None, screen_height=None):
+        """Majukan waktu ke current_time: hanya timer yang jatuh tempo yang dijalankan."""
+        if screen_width is not None:
+            self.screen_width, self.screen_height = screen_width, screen_height
+        self.timers.run_until(current_time)
+
+    def process_owner_command(self, command, now=None):
         """Memproses perintah SERANG atau ABAIKAN dari pemilik."""
-        if self.status == "ALERT":
-            if command == "SERANG":
-                self.status = "ATTACKING"
-                self.last_alert_time = time.time() # Reset timer untuk durasi attack
-                print("LOGIKA: Perintah SERANG diterima!")
-            elif command == "ABAIKAN":
-                self.status = "FOLLOWING" # Kembali ke following, menunggu jika masih ada
-                print("LOGIKA: Perintah ABAIKAN diterima. Melanjutkan FOLLOWING.")
+        self.handle(command, self.timers.now if now is None else now)
 
     def reset_to_standby(self):
         """Mengatur ulang semua variabel ke kondisi awal."""
+        self._clear_object()
         self.status = "STANDBY"
+        self._enter(self.timers.now)
+
+    def _clear_object(self):
         self.sim_person_rect = None
         self.sim_object_timer = 0
 
@@ -82,7 +255,30 @@ class DroneBrain:
         return self.status
 
     def get_sim_object(self):
+        """Posisi objek simulasi saat ini (dimajukan sampai waktu timer terakhir)."""
+        if self._advance_object(self.timers.now):
+            self.handle("exit", self.timers.now)
         return self.sim_person_rect
-    
-# Catatan: Perintah 'pygame' harus diimpor di file utama untuk digunakan oleh self.sim_person_rect
-import pygame # Tambahkan impor pygame di sini karena Rect membutuhkan pygame
\ No newline at end of file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji beban DroneBrain tanpa display.")
+    parser.add_argument("--brains", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=600.0, help="waktu simulasi")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    rng = WorldRNG(args.seed)
+    timers = TimerQueue()
+    brains = [DroneBrain(rng.stream(f"brain:{i}"), timers, drone_id=i) for i in range(args.brains)]
+    t0 = time.perf_counter()
+    timers.run_until(args.seconds)
+    elapsed = time.perf_counter() - t0
+    counts = {s: 0 for s in DroneBrain.STATUS}
+    for b in brains:
+        counts[b.status] += 1
+    print(f"{args.brains} brains x {args.seconds:.0f}s sim in {elapsed:.3f}s "
+          f"({timers.fired / elapsed:.0f} events/s, {timers.fired} events), status={counts} seed={rng.seed}")
+
+if __name__ == "__main__":
+    main()
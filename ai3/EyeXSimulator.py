@@ -1,8 +1,26 @@
 # --- EyeXSimulator.py ---
 
+# Jalankan dari root repo:  python -m ai3.EyeXSimulator [--dirty] [--profile]
+
+import argparse
+import logging
 import pygame
 import time
+from datetime import datetime
+
+from simcore import paths
+
+paths.use("ai3")  # DroneBrain diimpor datar dari folder ai3
 from DroneBrain import DroneBrain # Mengimpor Logika Otak
+from simcore.dirty import DirtyRenderer
+from simcore.profiler import Profiler
+from simcore.perfhud import PerfHUD
+
+# --- Argumen ---
+parser = argparse.ArgumentParser(description="Eye X Drone Simulator")
+parser.add_argument("--dirty", action="store_true", help="gambar ulang hanya area yang berubah (dirty rect)")
+parser.add_argument("--profile", action="store_true", help="profiler per fase + HUD aktif sejak awal (F3 toggle)")
+args = parser.parse_args()
 
 # --- Konfigurasi Pygame ---
 pygame.init()
@@ -18,12 +36,21 @@ GRAY = (100, 100, 100)
 YELLOW = (255, 255, 0)
 FONT = pygame.font.Font(None, 36)
 
-# Inisialisasi Otak Drone
-drone_brain = DroneBrain()
+# Background statis (Simulasi Video Feed) + renderer
+background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+background.fill((50, 50, 70))
+pygame.draw.rect(background, GRAY, (50, 50, 700, 400), 1)
+renderer = DirtyRenderer(screen, args.dirty)
+profiler = Profiler(args.profile)
+hud = PerfHUD(profiler, pygame.font.Font(None, 18), 1000 / 60, pos=(60, 60))
+
+# Inisialisasi Otak Drone (log LOGIKA dari DroneBrain tampil di konsol)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+drone_brain = DroneBrain(screen_size=(SCREEN_WIDTH, SCREEN_HEIGHT))
 
 # --- Fungsi Gambar UI ---
 def draw_button(x, y, w, h, text, color):
-    pygame.draw.rect(screen, color, (x, y, w, h))
+    renderer.mark(pygame.draw.rect(screen, color, (x, y, w, h)))
     text_surface = FONT.render(text, True, BLACK)
     text_rect = text_surface.get_rect(center=(x + w // 2, y + h // 2))
     screen.blit(text_surface, text_rect)
@@ -39,34 +66,41 @@ def handle_input(pos):
         elif 500 <= pos[0] <= 630 and 500 <= pos[1] <= 550:
             drone_brain.process_owner_command("ABAIKAN")
 
+def profile_path():
+    return f"profile_eyex_sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
 # --- Loop Utama Badang Drone (Pygame) ---
 running = True
 clock = pygame.time.Clock()
 
 while running:
     current_time = time.time()
+    profiler.begin()
     
     for event in pygame.event.get():
+        if hud.handle(event, profile_path, sim="ai3"):
+            continue
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.MOUSEBUTTONDOWN:
             handle_input(event.pos)
+    profiler.mark("events")
 
-    # 1. Update Otak Drone
-    drone_brain.update_status(current_time, SCREEN_WIDTH, SCREEN_HEIGHT)
+    # 1. Update Otak Drone (hanya timer yang jatuh tempo yang dijalankan)
+    drone_brain.update_status(current_time)
+    profiler.mark("brain")
 
     # 2. Gambar Background (Simulasi Video Feed)
-    screen.fill((50, 50, 70))
-    pygame.draw.rect(screen, GRAY, (50, 50, 700, 400), 1)
+    renderer.begin(background)
 
     # 3. Gambar Objek Simulasi (dari Otak Drone)
     sim_object_rect = drone_brain.get_sim_object()
     if sim_object_rect is not None:
         # Gambar kotak pembatas
-        pygame.draw.rect(screen, YELLOW, sim_object_rect, 2)
+        renderer.mark(pygame.draw.rect(screen, YELLOW, tuple(sim_object_rect), 2))
         # Teks label
         person_text = FONT.render("PERSON (SIMULATED)", True, YELLOW)
-        screen.blit(person_text, (sim_object_rect.x, sim_object_rect.y - 20))
+        renderer.mark(screen.blit(person_text, (sim_object_rect.x, sim_object_rect.y - 20)))
 
     # 4. Gambar UI Status dan Tombol
     
@@ -74,16 +108,22 @@ while running:
     current_status = drone_brain.get_status()
     status_color = RED if current_status in ["ALERT", "ATTACKING"] else GREEN
     status_text = FONT.render(f"DRONE STATUS: {current_status}", True, status_color)
-    screen.blit(status_text, (10, SCREEN_HEIGHT - 80))
+    renderer.mark(screen.blit(status_text, (10, SCREEN_HEIGHT - 80)))
 
     # Tampilkan Tombol Kontrol hanya saat ALERT
     if current_status == "ALERT":
         draw_button(650, 500, 130, 50, "SERANG", RED)
         draw_button(500, 500, 130, 50, "ABAIKAN", GREEN)
+    profiler.mark("draw")
+    hud.draw(screen, renderer)
+    profiler.mark("hud")
 
-    pygame.display.flip()
+    renderer.present()
+    profiler.end("flip")
     clock.tick(60)
 
 # --- Penutupan ---
 pygame.quit()
+if profiler.frames:
+    print(f"[PROFILE] {profiler.export(profile_path(), sim='ai3')}")
 print("Sistem Eye X Nonaktif.")
\ No newline at end of file
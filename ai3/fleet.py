@@ -0,0 +1,163 @@
+# --- fleet.py ---
+"""
+Fleet mode Eye X: banyak DroneBrain dalam satu proses di atas asyncio.
+
+- FleetHost: N DroneBrain berbagi satu TimerQueue. Task timer tidur
+  (asyncio.sleep) sampai timer terdekat jatuh tempo. Setiap ALERT baru
+  dikirim ke queue alert. Perintah SERANG/ABAIKAN dari queue command
+  dirutekan kembali ke brain berdasarkan drone id.
+- Operator: klien operator pengganti di proses yang sama. Alert diproses satu
+  per satu (satu konsol), dengan waktu reaksi acak, lalu perintah dikirim.
+- Latensi alert -> perintah (detik simulasi) dilaporkan sebagai p50/p90/p99,
+  bersama perintah basi (drone sudah tidak ALERT saat perintah tiba) dan
+  antrian alert yang belum dijawab. Dari situ terlihat berapa drone yang
+  sanggup dilayani satu konsol operator.
+
+Waktu simulasi = waktu loop asyncio x speed, jadi 600 detik simulasi dengan
+--speed 100 selesai dalam ~6 detik.
+
+    python -m ai3.fleet --drones 10 50 200 --seconds 600 --speed 100   (dari root repo)
+"""
+
+import argparse
+import asyncio
+from collections import namedtuple
+
+from simcore import paths
+
+paths.use("ai3")  # DroneBrain diimpor datar dari folder ai3
+from DroneBrain import DroneBrain, TimerQueue
+from simcore.rng import WorldRNG
+from simcore.sweep import percentile
+
+Alert = namedtuple("Alert", "drone_id ts")
+Command = namedtuple("Command", "drone_id command alert_ts")
+
+REACTION_TIME = (1.0, 4.0)  # detik; waktu reaksi operator (seragam)
+ATTACK_RATIO = 0.5          # porsi alert yang dijawab SERANG (sisanya ABAIKAN)
+
+
+class Operator:
+    def __init__(self, rng, reaction=REACTION_TIME, attack_ratio=ATTACK_RATIO):
+        self.rng = rng
+        self.reaction = reaction
+        self.attack_ratio = attack_ratio
+        self.handled = 0
+
+    async def run(self, host):
+        """Jawab alert dari host.alerts satu per satu, kirim perintah ke host.commands."""
+        while True:
+            alert = await host.alerts.get()
+            await asyncio.sleep(self.rng.uniform(*self.reaction) / host.speed)
+            command = "SERANG" if self.rng.random() < self.attack_ratio else "ABAIKAN"
+            host.commands.put_nowait(Command(alert.drone_id, command, alert.ts))
+            self.handled += 1
+
+
+class FleetHost:
+    def __init__(self, num_drones, seed=None, speed=1.0, screen_size=(800, 600)):
+        """
+        num_drones: jumlah DroneBrain (id "D0".."D{n-1}")
+        seed: seed WorldRNG (None = acak; seed yang dipakai ada di self.rng.seed)
+        speed: detik simulasi per detik loop asyncio
+        """
+        self.rng = WorldRNG(seed)
+        self.speed = speed
+        self.timers = TimerQueue()
+        self.alerts = asyncio.Queue()
+        self.commands = asyncio.Queue()
+        self.brains = {}
+        for i in range(num_drones):
+            did = f"D{i}"
+            self.brains[did] = DroneBrain(self.rng.stream(f"brain:{did}"), self.timers, screen_size,
+                                          drone_id=did, on_transition=self._on_transition)
+        self.stats = {"alerts": 0, "commands": 0, "stale_commands": 0}
+        self.latencies = []  # detik simulasi dari ALERT sampai perintah diterapkan
+        self._t0 = None
+
+    def now(self):
+        """Waktu simulasi saat ini (detik sejak run dimulai)."""
+        return (asyncio.get_running_loop().time() - self._t0) * self.speed
+
+    def _on_transition(self, brain, old, event, now):
+        if brain.status == "ALERT":
+            self.stats["alerts"] += 1
+            self.alerts.put_nowait(Alert(brain.drone_id, now))
+
+    async def _run_timers(self, until):
+        timers = self.timers
+        while True:
+            now = self.now()
+            timers.run_until(min(now, until))
+            if now >= until:
+                return
+            nxt = timers.next_time()
+            wake = until if nxt is None else min(nxt, until)
+            await asyncio.sleep(max(0.0, wake - now) / self.speed)
+
+    async def _route_commands(self):
+        while True:
+            cmd = await self.commands.get()
+            now = self.now()
+            self.timers.run_until(now)  # majukan fleet dulu supaya status brain terkini
+            brain = self.brains.get(cmd.drone_id)
+            if brain is None or brain.status != "ALERT" or brain.last_alert_time != cmd.alert_ts:
+                self.stats["stale_commands"] += 1
+                continue
+            brain.process_owner_command(cmd.command, now)
+            self.stats["commands"] += 1
+            self.latencies.append(now - cmd.alert_ts)
+
+    async def run(self, seconds, operators=1):
+        """Jalankan fleet selama `seconds` detik simulasi dengan `operators` konsol; kembalikan report()."""
+        self._t0 = asyncio.get_running_loop().time()
+        ops = [Operator(self.rng.stream(f"operator:{i}")) for i in range(operators)]
+        tasks = [asyncio.create_task(self._route_commands())]
+        tasks += [asyncio.create_task(op.run(self)) for op in ops]
+        try:
+            await self._run_timers(seconds)
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return self.report()
+
+    def report(self):
+        lat = sorted(self.latencies)
+        counts = {s: 0 for s in DroneBrain.STATUS}
+        for b in self.brains.values():
+            counts[b.status] += 1
+        return {
+            "drones": len(self.brains),
+            **self.stats,
+            "backlog": self.alerts.qsize(),
+            "latency_p50": percentile(lat, 0.50),
+            "latency_p90": percentile(lat, 0.90),
+            "latency_p99": percentile(lat, 0.99),
+            "status": counts,
+        }
+
+
+def _fmt(v):
+    return "-" if v is None else f"{v:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fleet DroneBrain + operator pengganti di asyncio.")
+    parser.add_argument("--drones", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--operators", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=600.0, help="waktu simulasi")
+    parser.add_argument("--speed", type=float, default=100.0, help="detik simulasi per detik nyata")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    for n in args.drones:
+        host = FleetHost(n, seed=args.seed, speed=args.speed)
+        r = asyncio.run(host.run(args.seconds, args.operators))
+        print(f"drones={r['drones']:5d} alerts={r['alerts']:5d} commands={r['commands']:5d} "
+              f"stale={r['stale_commands']:4d} backlog={r['backlog']:4d} "
+              f"latency p50={_fmt(r['latency_p50'])}s p90={_fmt(r['latency_p90'])}s p99={_fmt(r['latency_p99'])}s "
+              f"seed={host.rng.seed}")
+
+if __name__ == "__main__":
+    main()
@@ -2,27 +2,37 @@
 drone_security_sim.py
 Simulasi Drone AI Penjaga Rumah 2D Interaktif
 Python 3.12 + Pygame
+
+State simulasi ada di c1_world.py (headless); file ini menangani input dan
+menggambar World.
+
+Jalankan dari root repo:  python -m ai4.c1 [--dirty] [--profile]
 """
 
+import argparse
 import pygame
-import random
-import math
-import csv
 from datetime import datetime
 
-# --- KONFIGURASI DASAR ---
-WIDTH, HEIGHT = 900, 600
-FPS = 30
-SAFE_ZONE = (300, 200, 300, 200)
+from simcore import paths
+
+paths.use("ai4")  # event_log, telemetry, c1_world diimpor datar dari folder ai4
+from event_log import EventLogger
+import telemetry
+from c1_world import World, WIDTH, HEIGHT, FPS, WHITE, BLACK, GREEN, YELLOW, RED, BLUE, GRAY
+from simcore.textcache import TextCache
+from simcore.dirty import DirtyRenderer
+from simcore.scheduler import FixedStep, lerp
+from simcore.replay import Recorder
+from simcore.profiler import Profiler
+from simcore.perfhud import PerfHUD
+
+RENDER_FPS = 60  # laju gambar; simulasi tetap maju FPS tick/detik (c1_world.FPS)
 
-# --- WARNA ---
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GREEN = (0, 200, 0)
-YELLOW = (255, 255, 0)
-RED = (255, 50, 50)
-BLUE = (0, 120, 255)
-GRAY = (100, 100, 100)
+# --- ARGUMEN ---
+parser = argparse.ArgumentParser(description="Simulasi Drone AI Penjaga Rumah (2D)")
+parser.add_argument("--dirty", action="store_true", help="gambar ulang hanya area yang berubah (dirty rect)")
+parser.add_argument("--profile", action="store_true", help="profiler per fase + HUD aktif sejak awal (F3 toggle)")
+args = parser.parse_args()
 
 # --- PYGAME SETUP ---
 pygame.init()
@@ -30,177 +40,40 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Simulasi Drone AI Penjaga Rumah (2D)")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("Arial", 18)
+text_cache = TextCache()
 
 # --- LOG SETUP ---
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 LOG_FILE = f"log_drone_sim_{timestamp}.csv"
-with open(LOG_FILE, "w", newline="") as f:
-    writer = csv.DictWriter(f, fieldnames=["tick", "event", "detail"])
-    writer.writeheader()
-
-# --- OBJEK DASAR ---
-class Entity:
-    def __init__(self, x, y, color):
-        self.x, self.y = x, y
-        self.color = color
-        self.caught = False
-
-    def draw(self):
-        pygame.draw.rect(screen, self.color, (self.x - 5, self.y - 5, 10, 10))
-
-    def distance_to(self, other):
-        return math.hypot(self.x - other.x, self.y - other.y)
-
-
-class Person(Entity):
-    def __init__(self, x, y, status="green"):
-        super().__init__(x, y, GREEN if status == "green" else
-                         (YELLOW if status == "yellow" else RED))
-        self.status = status
-        self.speed = 2
-
-    def move(self):
-        if self.caught:
-            return
-        dx, dy = random.choice([-1, 0, 1]), random.choice([-1, 0, 1])
-        self.x = min(max(10, self.x + dx * self.speed), WIDTH - 10)
-        self.y = min(max(10, self.y + dy * self.speed), HEIGHT - 10)
-
-    def update_color(self):
-        if self.status == "green":
-            self.color = GREEN
-        elif self.status == "yellow":
-            self.color = YELLOW
-        elif self.status == "red":
-            self.color = RED
-
-
-class Police(Entity):
-    def __init__(self, x, y, target):
-        super().__init__(x, y, BLACK)
-        self.speed = 4
-        self.target = target
-
-    def move(self):
-        if not self.target:
-            return
-        dx, dy = self.target.x - self.x, self.target.y - self.y
-        dist = math.hypot(dx, dy)
-        if dist > 2:
-            self.x += self.speed * dx / dist
-            self.y += self.speed * dy / dist
-        else:
-            self.target.caught = True
-            return True  # sudah menangkap
-
-
-class Drone(Entity):
-    def __init__(self, x, y):
-        super().__init__(x, y, BLUE)
-        self.home_x, self.home_y = x, y
-        self.speed = 3
-        self.target = None
-        self.state = "IDLE"
+event_log = EventLogger(LOG_FILE)  # ditulis oleh thread background, di-flush saat close()
+TELEMETRY_FILE = f"telemetry_drone_sim_{timestamp}.bin"
+telemetry_log = telemetry.TelemetryWriter(TELEMETRY_FILE)
+REPLAY_FILE = f"replay_drone_sim_{timestamp}.rpl"  # putar ulang: python -m simcore.replay FILE
 
-    def in_safe_zone(self, target):
-        zx, zy, zw, zh = SAFE_ZONE
-        return zx <= target.x <= zx + zw and zy <= target.y <= zy + zh
-
-    def move_toward(self, target):
-        dx, dy = target.x - self.x, target.y - self.y
-        dist = math.hypot(dx, dy)
-        if dist > 0:
-            self.x += self.speed * dx / dist
-            self.y += self.speed * dy / dist
-
-    def return_home(self):
-        home = Entity(self.home_x, self.home_y, BLUE)
-        if self.distance_to(home) > 5:
-            self.move_toward(home)
-        else:
-            self.state = "IDLE"
-
-    def act(self, people, polices, tick):
-        # Cari ancaman merah
-        reds = [p for p in people if p.status == "red" and not p.caught]
-        yellows = [p for p in people if p.status == "yellow" and not p.caught]
-
-        if self.state == "IDLE":
-            # Jika ada merah, serang
-            if reds:
-                self.target = reds[0]
-                self.state = "ATTACK"
-                print("[INFO] Drone menyerang penjahat!")
-            elif yellows:
-                for y in yellows:
-                    if self.in_safe_zone(y):
-                        self.target = y
-                        self.state = "FOLLOW"
-                        break
-
-        if self.state == "FOLLOW" and self.target:
-            if not self.in_safe_zone(self.target):
-                self.target = None
-                self.state = "RETURN"
-            else:
-                self.move_toward(self.target)
-                if random.random() < 0.01:
-                    print("[INFO] Drone mengikuti orang yang diawasi...")
-
-        elif self.state == "ATTACK" and self.target:
-            self.move_toward(self.target)
-            if self.distance_to(self.target) < 10:
-                self.target.caught = True
-                self.state = "WAIT_POLICE"
-                polices.append(Police(self.x, self.y, self.target))
-                print("[INFO] Drone menangkap penjahat, memanggil polisi.")
-                with open(LOG_FILE, "a", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=["tick", "event", "detail"])
-                    writer.writerow({"tick": tick, "event": "catch", "detail": "Drone menangkap penjahat"})
-
-        elif self.state == "WAIT_POLICE":
-            # Drone menunggu polisi sampai menangkap target
-            caught_target = any(p.caught for p in people if p.status == "red")
-            if caught_target:
-                self.state = "RETURN"
-                print("[INFO] Polisi sudah menangkap, drone kembali.")
-
-        elif self.state == "RETURN":
-            self.return_home()
-
-        elif self.state == "IDLE":
-            # Drone tetap di area aman
-            pass
+# --- INISIALISASI AWAL ---
+world = World(event_log=event_log, telemetry_log=telemetry_log)
+recorder = Recorder("ai4", world)  # seed + input spawn bertanda tick
 
+# background statis: warna dasar + garis zona aman
+background = pygame.Surface((WIDTH, HEIGHT)).convert()
+background.fill(GRAY)
+pygame.draw.rect(background, (0, 80, 0), world.safe_zone, 3)
+renderer = DirtyRenderer(screen, args.dirty)
+sched = FixedStep(FPS)
+# fase tick (people / assign / drones / police / telemetry) dicatat World, fase UI di loop utama
+profiler = world.profiler = Profiler(args.profile)
+hud = PerfHUD(profiler, pygame.font.SysFont("Consolas", 14), 1000 / RENDER_FPS, pos=(10, 40), text=text_cache)
 
-# --- FUNGSI UTILITAS ---
-def in_safe_zone(entity):
-    zx, zy, zw, zh = SAFE_ZONE
-    return zx <= entity.x <= zx + zw and zy <= entity.y <= zy + zh
 
+def profile_path():
+    return f"profile_drone_sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-def maybe_change_yellow_status(person):
-    """Ketika kuning masuk zona aman, ubah status"""
-    if person.status == "yellow" and in_safe_zone(person):
-        roll = random.random()
-        if roll < 0.3:
-            person.status = "red"
-        elif roll < 0.6:
-            person.status = "green"
-        else:
-            person.status = "yellow"
-        person.update_color()
 
+def draw_entity(entity, alpha=1.0):
+    # alpha < 1: interpolasi dari posisi tick sebelumnya (hanya drone yang menyimpannya per tick)
+    x, y = lerp(entity.prev_x, entity.x, alpha), lerp(entity.prev_y, entity.y, alpha)
+    renderer.mark(pygame.draw.rect(screen, entity.color, (x - 5, y - 5, 10, 10)))
 
-# --- INISIALISASI AWAL ---
-people = [
-    Person(random.randint(100, 800), random.randint(100, 500), "red"),
-    *[Person(random.randint(100, 800), random.randint(100, 500), "yellow") for _ in range(3)],
-    *[Person(random.randint(100, 800), random.randint(100, 500), "green") for _ in range(2)]
-]
-drones = [Drone(SAFE_ZONE[0] + 100, SAFE_ZONE[1] + 100),
-          Drone(SAFE_ZONE[0] + 200, SAFE_ZONE[1] + 150)]
-polices = []
 
 # Tombol spawn
 def draw_buttons():
@@ -211,18 +84,18 @@ def draw_buttons():
         "Spawn Drone": (500, 550, BLUE)
     }
     for text, (x, y, color) in buttons.items():
-        pygame.draw.rect(screen, color, (x, y, 120, 30))
-        label = font.render(text, True, BLACK)
-        screen.blit(label, (x + 5, y + 5))
+        renderer.mark(pygame.draw.rect(screen, color, (x, y, 120, 30)))
+        screen.blit(text_cache.render(font, text, BLACK), (x + 5, y + 5))
     return buttons
 
 
 # --- LOOP UTAMA ---
-tick = 0
 running = True
 while running:
-    tick += 1
+    profiler.begin()
     for event in pygame.event.get():
+        if hud.handle(event, profile_path, sim="ai4", seed=world.rng.seed):
+            continue
         if event.type == pygame.QUIT:
             running = False
 
@@ -230,49 +103,46 @@ while running:
         if event.type == pygame.MOUSEBUTTONDOWN:
             mx, my = event.pos
             if 50 <= mx <= 170 and 550 <= my <= 580:
-                people.append(Person(random.randint(50, 850), random.randint(50, 500), "green"))
+                recorder.input("spawn_person", "green")
             elif 200 <= mx <= 320 and 550 <= my <= 580:
-                people.append(Person(random.randint(50, 850), random.randint(50, 500), "yellow"))
+                recorder.input("spawn_person", "yellow")
             elif 350 <= mx <= 470 and 550 <= my <= 580:
-                people.append(Person(random.randint(50, 850), random.randint(50, 500), "red"))
+                recorder.input("spawn_person", "red")
             elif 500 <= mx <= 620 and 550 <= my <= 580:
-                drones.append(Drone(SAFE_ZONE[0] + random.randint(50, 250),
-                                    SAFE_ZONE[1] + random.randint(50, 150)))
+                recorder.input("spawn_drone")
 
-    # Update entitas
-    for p in people:
-        p.move()
-        maybe_change_yellow_status(p)
-        p.update_color()
+    profiler.mark("events")
 
-    for d in drones:
-        d.act(people, polices, tick)
-
-    for pol in polices[:]:
-        done = pol.move()
-        if done:
-            print("[INFO] Polisi menangkap penjahat dan keluar.")
-            polices.remove(pol)
-            # Hapus target yang ditangkap
-            people = [p for p in people if not p.caught]
+    # Update entitas
+    world.step(sched.advance())
 
     # --- DRAW ---
-    screen.fill(GRAY)
-    pygame.draw.rect(screen, (0, 80, 0), SAFE_ZONE, 3)
-    for p in people:
-        p.draw()
-    for d in drones:
-        d.draw()
-    for pol in polices:
-        pol.draw()
+    renderer.begin(background)
+    for p in world.people:
+        draw_entity(p)
+    for d in world.drones:
+        draw_entity(d, sched.alpha)
+    for pol in world.polices:
+        draw_entity(pol)
 
     draw_buttons()
-    info = font.render(f"Tick: {tick} | Drone: {len(drones)} | Orang: {len(people)} | Polisi: {len(polices)}",
-                       True, WHITE)
-    screen.blit(info, (10, 10))
-
-    pygame.display.flip()
-    clock.tick(FPS)
+    # tick berubah tiap frame; sisanya jarang berubah, jadi di-render terpisah lewat cache
+    tick_label = font.render(f"Tick: {world.tick}", True, WHITE)
+    renderer.mark(screen.blit(tick_label, (10, 10)))
+    counts = text_cache.render(font, f" | Drone: {len(world.drones)} | Orang: {len(world.people)} | Polisi: {len(world.polices)}", WHITE)
+    renderer.mark(screen.blit(counts, (10 + tick_label.get_width(), 10)))
+    profiler.mark("draw")
+    hud.draw(screen, renderer)
+    profiler.mark("hud")
+
+    renderer.present()
+    profiler.end("flip")
+    clock.tick(RENDER_FPS)
 
 pygame.quit()
-print(f"[INFO] Simulasi selesai. Log tersimpan di {LOG_FILE}")
+if profiler.frames:
+    print(f"[PROFILE] {profiler.export(profile_path(), sim='ai4', seed=world.rng.seed)}")
+event_log.close()
+recorder.save(REPLAY_FILE)
+telemetry_log.close()
+print(f"[INFO] Simulasi selesai. Log tersimpan di {LOG_FILE}, replay di {REPLAY_FILE}")
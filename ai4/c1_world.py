@@ -0,0 +1,607 @@
+"""
+c1_world.py
+State simulasi Drone AI Penjaga Rumah (ai4) tanpa pygame.
+c1.py hanya menangani input & menggambar World ini; World juga bisa dijalankan
+headless (mis. oleh simcore.sweep). World.snapshot() / World.restore(data)
+menyimpan & memulihkan state lengkap (simcore.snapshot).
+"""
+
+import heapq
+import random
+import math
+
+import telemetry
+
+from simcore.rng import WorldRNG
+from simcore.assign import Assigner
+from simcore.pursuit import VelocityEstimator, intercept
+from simcore.capture import captures
+from simcore import snapshot
+from simcore.snapshot import gc_paused
+from simcore.profiler import Profiler
+
+# --- KONFIGURASI DASAR ---
+WIDTH, HEIGHT = 900, 600
+FPS = 30
+SAFE_ZONE = (300, 200, 300, 200)
+ASSIGN_TOLERANCE = 8  # px; assignment drone->merah di-solve ulang bila ada posisi bergeser lebih dari ini
+CATCH_RADIUS = 10        # px; drone menangkap merah yang pernah lebih dekat dari ini
+POLICE_CATCH_RADIUS = 2  # px; polisi mengangkut person tertangkap dalam jarak ini
+TELEMETRY_STATE_EVERY = 1  # rekam state semua entitas tiap N tick ke log telemetri biner
+
+# --- WARNA ---
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GREEN = (0, 200, 0)
+YELLOW = (255, 255, 0)
+RED = (255, 50, 50)
+BLUE = (0, 120, 255)
+GRAY = (100, 100, 100)
+
+# nilai kolom threat di telemetri untuk tiap status person
+STATUS_THREAT = {"green": 0.0, "yellow": 0.5, "red": 1.0}
+STATUSES = tuple(STATUS_THREAT)  # kode status person di snapshot (index tuple ini)
+
+
+# --- OBJEK DASAR ---
+class Entity:
+    def __init__(self, x, y, color, eid=-1, rng=None):
+        self.id = eid             # diberikan World (urut per world)
+        self.rng = rng or random  # substream WorldRNG, atau modul random global
+        self.x, self.y = x, y
+        self.prev_x, self.prev_y = x, y  # posisi tick sebelumnya, untuk interpolasi render
+        self.color = color
+        self.caught = False
+
+    def distance_to(self, other):
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+
+class Person(Entity):
+    def __init__(self, x, y, status="green", eid=-1, rng=None):
+        super().__init__(x, y, GREEN if status == "green" else
+                         (YELLOW if status == "yellow" else RED), eid, rng)
+        self.status = status
+        self.speed = 2
+
+    def move(self):
+        self.prev_x, self.prev_y = self.x, self.y
+        if self.caught:
+            return
+        dx, dy = self.rng.choice([-1, 0, 1]), self.rng.choice([-1, 0, 1])
+        self.x = min(max(10, self.x + dx * self.speed), WIDTH - 10)
+        self.y = min(max(10, self.y + dy * self.speed), HEIGHT - 10)
+
+    def update_color(self):
+        if self.status == "green":
+            self.color = GREEN
+        elif self.status == "yellow":
+            self.color = YELLOW
+        elif self.status == "red":
+            self.color = RED
+
+
+class Police(Entity):
+    def __init__(self, x, y, target, eid=-1):
+        super().__init__(x, y, BLACK, eid)
+        self.speed = 4
+        self.target = target
+
+    def move(self, aim=None, capture=True):
+        """
+        aim: titik bidik (x, y) hasil intercept; None = posisi target.
+        capture: False = hanya bergerak; penangkapan diperiksa World (swept) setelah semua polisi bergerak.
+        """
+        self.prev_x, self.prev_y = self.x, self.y
+        if not self.target:
+            return
+        dx, dy = self.target.x - self.x, self.target.y - self.y
+        dist = math.hypot(dx, dy)
+        if capture and dist <= POLICE_CATCH_RADIUS:
+            self.target.caught = True
+            return True  # sudah menangkap (cek jarak titik di awal langkah)
+        if dist > 0:
+            if aim is not None:
+                dx, dy = aim[0] - self.x, aim[1] - self.y
+                dist = math.hypot(dx, dy) or 1.0
+            self.x += self.speed * dx / dist
+            self.y += self.speed * dy / dist
+
+
+class Drone(Entity):
+    def __init__(self, x, y, safe_zone=SAFE_ZONE, eid=-1, rng=None):
+        super().__init__(x, y, BLUE, eid, rng)
+        self.home_x, self.home_y = x, y
+        self.speed = 3
+        self.target = None
+        self.state = "IDLE"
+        self.safe_zone = safe_zone
+
+    def in_safe_zone(self, target):
+        zx, zy, zw, zh = self.safe_zone
+        return zx <= target.x <= zx + zw and zy <= target.y <= zy + zh
+
+    def move_toward(self, target, aim=None):
+        """aim: titik bidik (x, y) hasil intercept; None = posisi target."""
+        dx, dy = (aim[0] - self.x, aim[1] - self.y) if aim is not None else (target.x - self.x, target.y - self.y)
+        dist = math.hypot(dx, dy)
+        if dist > 0:
+            self.x += self.speed * dx / dist
+            self.y += self.speed * dy / dist
+
+    def return_home(self):
+        home = Entity(self.home_x, self.home_y, BLUE)
+        dist = self.distance_to(home)
+        if dist <= 5:
+            self.state = "IDLE"
+        elif dist <= self.speed:
+            self.x, self.y = self.home_x, self.home_y  # drone cepat: mendarat, jangan bolak-balik melewati home
+        else:
+            self.move_toward(home)
+
+    def capture(self, world):
+        """Target tertangkap: tunggu polisi di tempat (target yang sudah ditangkap drone lain: pulang)."""
+        if not world.catch(self.target):
+            self.target = None
+            self.state = "RETURN"
+            return
+        self.state = "WAIT_POLICE"
+        world.polices.append(Police(self.x, self.y, self.target, world.new_id()))
+        world.info("[INFO] Drone menangkap penjahat, memanggil polisi.")
+        world.record_catch(self, self.target)
+
+    def act(self, world):
+        # ancaman merah / kuning yang belum tertangkap (set dijaga World, tidak di-scan ulang)
+        reds = world.by_status["red"]
+        yellows = world.by_status["yellow"]
+
+        if self.state == "IDLE":
+            # Jika ada merah, serang
+            target = world.attack_target(self, reds)
+            if target:
+                self.target = target
+                self.state = "ATTACK"
+                world.info("[INFO] Drone menyerang penjahat!")
+            elif yellows:
+                for y in yellows:
+                    if self.in_safe_zone(y):
+                        self.target = y
+                        self.state = "FOLLOW"
+                        world.stats["warnings"] += 1
+                        break
+
+        if self.state == "FOLLOW" and self.target:
+            if not self.in_safe_zone(self.target):
+                if self.target.status != "red":
+                    world.stats["false_pursuits"] += 1
+                self.target = None
+                self.state = "RETURN"
+            else:
+                self.move_toward(self.target)
+                if self.rng.random() < 0.01:
+                    world.info("[INFO] Drone mengikuti orang yang diawasi...")
+
+        elif self.state == "ATTACK" and self.target:
+            if world.assigner is not None or self.target.caught:
+                # ikuti assignment global: pindah target, atau mundur bila merah sudah dikejar drone lain;
+                # tanpa assignment: target sudah ditangkap drone lain -> merah berikutnya, atau pulang
+                target = world.attack_target(self, reds)
+                if target is None:
+                    self.target = None
+                    self.state = "RETURN"
+                    return
+                self.target = target
+            self.move_toward(self.target, world.aim(self, self.target))
+            # swept: penangkapan diperiksa World setelah semua drone bergerak
+            if not world.swept and self.distance_to(self.target) < CATCH_RADIUS:
+                self.capture(world)
+
+        elif self.state == "WAIT_POLICE":
+            # target sudah diamankan dan polisi sudah dipanggil; polisi bisa saja selesai
+            # di tick yang sama, jadi jangan menunggu sampai ada merah tertangkap lagi
+            if self.target is None or self.target.caught:
+                self.state = "RETURN"
+                world.info("[INFO] Polisi sudah menangkap, drone kembali.")
+
+        elif self.state == "RETURN":
+            self.return_home()
+
+        elif self.state == "IDLE":
+            # Drone tetap di area aman
+            pass
+
+
+# --- FUNGSI UTILITAS ---
+def in_safe_zone(entity, safe_zone=SAFE_ZONE):
+    zx, zy, zw, zh = safe_zone
+    return zx <= entity.x <= zx + zw and zy <= entity.y <= zy + zh
+
+
+def maybe_change_yellow_status(person, safe_zone=SAFE_ZONE):
+    """Ketika kuning masuk zona aman, ubah status"""
+    if person.status == "yellow" and in_safe_zone(person, safe_zone):
+        roll = person.rng.random()
+        if roll < 0.3:
+            person.status = "red"
+        elif roll < 0.6:
+            person.status = "green"
+        else:
+            person.status = "yellow"
+        person.update_color()
+
+
+# --- WORLD ---
+class World:
+    def __init__(self, safe_zone=SAFE_ZONE, num_red=1, num_yellow=3, num_green=2, num_drones=2,
+                 event_log=None, telemetry_log=None, verbose=True, seed=None, assign=True, intercept=True,
+                 swept=True):
+        """
+        safe_zone: (x, y, w, h) zona aman
+        num_red / num_yellow / num_green / num_drones: populasi awal
+        event_log: event_log.EventLogger opsional (CSV catch)
+        telemetry_log: telemetry.TelemetryWriter opsional
+        verbose: cetak pesan [INFO] ke stdout
+        seed: seed WorldRNG (None = acak; seed yang dipakai ada di self.rng.seed)
+        assign: True = merah dibagi global antar drone (Hungarian); False = semua drone ambil merah pertama
+        intercept: True = drone/polisi membidik titik intercept (kecepatan merah diestimasi); False = posisi target
+        swept: True = penangkapan drone & polisi kontinu sepanjang tick (simcore.capture, semua sekaligus);
+               False = cek jarak titik di ujung langkah
+        """
+        self.safe_zone = safe_zone
+        self.event_log = event_log
+        self.telemetry_log = telemetry_log
+        self.verbose = verbose
+        self.tick = 0
+        self.rng = WorldRNG(seed)
+        self._spawn_rng = self.rng.stream("spawn")  # posisi spawn
+        self._next_id = 0
+        self.assigner = Assigner(ASSIGN_TOLERANCE) if assign else None
+        self._assigned = {}  # drone -> person merah hasil assignment tick ini
+        self.velocities = VelocityEstimator() if intercept else None  # id person merah -> kecepatan
+        self.swept = swept
+        # person belum tertangkap per status (dict sebagai ordered set, urut saat masuk status);
+        # diperbarui hanya saat spawn, ganti status, atau tertangkap
+        self.by_status = {"green": {}, "yellow": {}, "red": {}}
+        # heap (id, person) merah untuk drone tanpa assignment: merah dengan id terkecil O(1);
+        # entri yang sudah tidak merah / tertangkap dibuang malas saat dibaca
+        self._red_order = []
+        self.polices = []
+        # metrik untuk sweep/benchmark
+        self.stats = {"captures": 0, "false_pursuits": 0, "warnings": 0}
+        self.capture_latencies = []   # tick dari person menjadi merah sampai ditangkap drone
+        self._red_since = {}          # id person -> tick saat menjadi merah
+        # waktu per fase tick; UI memasang Profiler aktif di sini (mati = hampir tanpa biaya)
+        self.profiler = Profiler(enabled=False)
+
+        # --- INISIALISASI AWAL ---
+        self.people = []
+        for status, n in (("red", num_red), ("yellow", num_yellow), ("green", num_green)):
+            for _ in range(n):
+                self._add_person(self._new_person(100, 800, 100, 500, status))
+        zx, zy = safe_zone[0], safe_zone[1]
+        self.drones = [self._new_drone(zx + 100 + 100 * (i % 2) + 20 * (i // 2), zy + 100 + 50 * (i % 2))
+                       for i in range(num_drones)]
+
+    def info(self, msg):
+        if self.verbose:
+            print(msg)
+
+    def new_id(self):
+        eid = self._next_id
+        self._next_id += 1
+        return eid
+
+    def _new_person(self, x_lo, x_hi, y_lo, y_hi, status):
+        eid = self.new_id()
+        x, y = self._spawn_rng.randint(x_lo, x_hi), self._spawn_rng.randint(y_lo, y_hi)
+        return Person(x, y, status, eid, self.rng.stream(f"person:{eid}"))
+
+    def _new_drone(self, x, y):
+        eid = self.new_id()
+        return Drone(x, y, self.safe_zone, eid, self.rng.stream(f"drone:{eid}"))
+
+    def _add_person(self, person):
+        self.people.append(person)
+        self.by_status[person.status][person] = None
+        if person.status == "red":
+            self._red_since[person.id] = self.tick
+            heapq.heappush(self._red_order, (person.id, person))
+        return person
+
+    # ---------- input (tombol spawn) ----------
+    def spawn_person(self, status):
+        person = self._add_person(self._new_person(50, 850, 50, 500, status))
+        self._record_spawn(person, STATUS_THREAT[status])
+        return person
+
+    def spawn_drone(self):
+        zx, zy = self.safe_zone[0], self.safe_zone[1]
+        drone = self._new_drone(zx + self._spawn_rng.randint(50, 250), zy + self._spawn_rng.randint(50, 150))
+        self.drones.append(drone)
+        self._record_spawn(drone, 0.0)
+        return drone
+
+    # ---------- snapshot ----------
+    @gc_paused
+    def snapshot(self):
+        """State lengkap World sebagai bytes simcore.snapshot; World.restore(data) membangun ulang World yang sama."""
+        cached = self.assigner.state() if self.assigner is not None else None
+        # person yang sudah dikeluarkan dari self.people tapi masih dirujuk polisi / drone / cache assignment
+        rows = {p: i for i, p in enumerate(self.people)}
+        persons = list(self.people)
+        refs = [d.target for d in self.drones] + [pol.target for pol in self.polices]
+        if cached is not None:
+            refs += cached[1] + cached[4]
+        for p in refs:
+            if p is not None and p not in rows:
+                rows[p] = len(persons)
+                persons.append(p)
+        drows = {d: i for i, d in enumerate(self.drones)}
+        drones, polices = self.drones, self.polices
+        vel = self.velocities.state() if self.velocities is not None else {}
+        meta = {
+            "world": "ai4", "seed": self.rng.seed, "tick": self.tick, "next_id": self._next_id,
+            "safe_zone": list(self.safe_zone), "verbose": self.verbose, "assign": self.assigner is not None,
+            "intercept": self.velocities is not None, "swept": self.swept, "stats": self.stats,
+            "live": len(self.people), "assign_cached": cached is not None,
+        }
+        cols = {
+            "people.id": snapshot.ints([p.id for p in persons]),
+            "people.x": snapshot.ints([p.x for p in persons]),
+            "people.y": snapshot.ints([p.y for p in persons]),
+            "people.prev_x": snapshot.ints([p.prev_x for p in persons]),
+            "people.prev_y": snapshot.ints([p.prev_y for p in persons]),
+            "people.status": snapshot.ints([STATUSES.index(p.status) for p in persons]),
+            "people.caught": snapshot.flags([p.caught for p in persons]),
+            "people.speed": snapshot.ints([p.speed for p in persons]),
+            **{f"status.{status}": snapshot.ints([rows[p] for p in members])
+               for status, members in self.by_status.items()},
+            "drones.id": snapshot.ints([d.id for d in drones]),
+            "drones.x": snapshot.floats([d.x for d in drones]),
+            "drones.y": snapshot.floats([d.y for d in drones]),
+            "drones.prev_x": snapshot.floats([d.prev_x for d in drones]),
+            "drones.prev_y": snapshot.floats([d.prev_y for d in drones]),
+            "drones.home_x": snapshot.floats([d.home_x for d in drones]),
+            "drones.home_y": snapshot.floats([d.home_y for d in drones]),
+            "drones.speed": snapshot.floats([d.speed for d in drones]),
+            "drones.target": snapshot.ints([rows[d.target] if d.target is not None else -1 for d in drones]),
+            "drones.state": [d.state for d in drones],
+            "polices.id": snapshot.ints([pol.id for pol in polices]),
+            "polices.x": snapshot.floats([pol.x for pol in polices]),
+            "polices.y": snapshot.floats([pol.y for pol in polices]),
+            "polices.prev_x": snapshot.floats([pol.prev_x for pol in polices]),
+            "polices.prev_y": snapshot.floats([pol.prev_y for pol in polices]),
+            "polices.speed": snapshot.floats([pol.speed for pol in polices]),
+            "polices.target": snapshot.ints([rows[pol.target] for pol in polices]),
+            "velocity.id": snapshot.ints(list(vel)),
+            "velocity.state": snapshot.floats([v for st in vel.values() for v in st]),
+            "red_since.id": snapshot.ints(list(self._red_since)),
+            "red_since.tick": snapshot.ints(list(self._red_since.values())),
+            "capture_latencies": snapshot.ints(self.capture_latencies),
+            **snapshot.rng_columns(self.rng),
+        }
+        if cached is not None:
+            agents, targets, threats, xy, result = cached
+            cols.update({
+                "assign.agents": snapshot.ints([drows[d] for d in agents]),
+                "assign.targets": snapshot.ints([rows[p] for p in targets]),
+                "assign.threats": snapshot.floats(threats),
+                "assign.xy": snapshot.floats([v for pt in xy for v in pt]),
+                "assign.result": snapshot.ints([-1 if p is None else rows[p] for p in result]),
+            })
+        return snapshot.pack(meta, cols)
+
+    @classmethod
+    @gc_paused
+    def restore(cls, data, event_log=None, telemetry_log=None, verbose=None):
+        """
+        World baru dari bytes World.snapshot(); melanjutkan step persis seperti World asalnya.
+        Log tidak ikut snapshot, jadi event_log / telemetry_log dipasang ulang di sini;
+        verbose None = sama dengan World asal.
+        """
+        meta, cols = snapshot.unpack(data)
+        if meta.get("world") != "ai4":
+            raise ValueError(f"snapshot bukan World ai4: {meta.get('world')}")
+        world = cls(safe_zone=tuple(meta["safe_zone"]), num_red=0, num_yellow=0, num_green=0, num_drones=0,
+                    event_log=event_log, telemetry_log=telemetry_log,
+                    verbose=meta["verbose"] if verbose is None else verbose, seed=meta["seed"],
+                    assign=meta["assign"], intercept=meta["intercept"], swept=meta["swept"])
+        world.tick, world._next_id = meta["tick"], meta["next_id"]
+        world.stats = dict(meta["stats"])
+        rng = world.rng
+        snapshot.restore_rng(rng, cols)
+
+        persons = []
+        for eid, x, y, prev_x, prev_y, status, caught, speed in zip(
+                cols["people.id"], cols["people.x"], cols["people.y"], cols["people.prev_x"], cols["people.prev_y"],
+                cols["people.status"], cols["people.caught"], cols["people.speed"]):
+            p = Person(x, y, STATUSES[status], eid, rng.stream(f"person:{eid}"))
+            p.prev_x, p.prev_y, p.caught, p.speed = prev_x, prev_y, bool(caught), speed
+            persons.append(p)
+        world.people = persons[:meta["live"]]
+        for status in world.by_status:
+            world.by_status[status] = dict.fromkeys(persons[i] for i in cols[f"status.{status}"])
+        world._red_order = [(p.id, p) for p in world.by_status["red"]]
+        heapq.heapify(world._red_order)
+
+        def person_at(i):
+            return None if i < 0 else persons[i]
+
+        for eid, x, y, prev_x, prev_y, home_x, home_y, speed, target, state in zip(
+                cols["drones.id"], cols["drones.x"], cols["drones.y"], cols["drones.prev_x"], cols["drones.prev_y"],
+                cols["drones.home_x"], cols["drones.home_y"], cols["drones.speed"], cols["drones.target"],
+                cols["drones.state"]):
+            d = Drone(x, y, world.safe_zone, eid, rng.stream(f"drone:{eid}"))
+            d.prev_x, d.prev_y, d.home_x, d.home_y, d.speed = prev_x, prev_y, home_x, home_y, speed
+            d.target, d.state = person_at(target), state
+            world.drones.append(d)
+        for eid, x, y, prev_x, prev_y, speed, target in zip(
+                cols["polices.id"], cols["polices.x"], cols["polices.y"], cols["polices.prev_x"],
+                cols["polices.prev_y"], cols["polices.speed"], cols["polices.target"]):
+            pol = Police(x, y, persons[target], eid)
+            pol.prev_x, pol.prev_y, pol.speed = prev_x, prev_y, speed
+            world.polices.append(pol)
+
+        if world.velocities is not None:
+            flat = cols["velocity.state"]
+            world.velocities.set_state({eid: list(flat[5 * k:5 * k + 5]) for k, eid in enumerate(cols["velocity.id"])})
+        if meta["assign_cached"]:
+            xy = cols["assign.xy"]
+            world.assigner.set_state((
+                [world.drones[i] for i in cols["assign.agents"]], [persons[i] for i in cols["assign.targets"]],
+                list(cols["assign.threats"]), list(zip(xy[0::2], xy[1::2])),
+                [person_at(i) for i in cols["assign.result"]]))
+        world._red_since = dict(zip(cols["red_since.id"], cols["red_since.tick"]))
+        world.capture_latencies = list(cols["capture_latencies"])
+        return world
+
+    # ---------- assignment ----------
+    def attack_target(self, drone, reds):
+        """Merah yang harus diserang drone ini (None = tidak ada)."""
+        if self.assigner is None:
+            # merah pertama menurut urutan spawn
+            order = self._red_order
+            while order and order[0][1] not in reds:
+                heapq.heappop(order)
+            return order[0][1] if order else None
+        target = self._assigned.get(drone)
+        return target if target is not None and not target.caught else None
+
+    def _assign_targets(self):
+        """Bagi merah yang belum tertangkap ke drone IDLE/ATTACK (biaya = jarak / threat)."""
+        drones = [d for d in self.drones if d.state in ("IDLE", "ATTACK")]
+        reds = list(self.by_status["red"])
+        assigned = self.assigner.assign(drones, [(d.x, d.y) for d in drones],
+                                        reds, [(p.x, p.y) for p in reds], [STATUS_THREAT["red"]] * len(reds))
+        self._assigned = dict(zip(drones, assigned))
+
+    def aim(self, pursuer, target):
+        """Titik intercept pursuer terhadap target (None = bidik posisi target)."""
+        if self.velocities is None:
+            return None
+        vx, vy = self.velocities.velocity(target.id)
+        return intercept(target.x, target.y, vx, vy, pursuer.x, pursuer.y, pursuer.speed)
+
+    # ---------- status ----------
+    def catch(self, person):
+        """Tandai person tertangkap dan keluarkan dari set status; False bila sudah ditangkap drone lain."""
+        if person.caught:
+            return False
+        person.caught = True
+        self.by_status[person.status].pop(person, None)
+        if self.velocities is not None:
+            self.velocities.forget(person.id)  # sudah diam; polisi cukup membidik posisinya
+        return True
+
+    def _status_changed(self, person, old):
+        if not person.caught:
+            del self.by_status[old][person]
+            self.by_status[person.status][person] = None
+            if person.status == "red":
+                heapq.heappush(self._red_order, (person.id, person))
+        if person.status == "red":
+            self._red_since[person.id] = self.tick
+
+    # ---------- event ----------
+    def record_catch(self, drone, target):
+        self.stats["captures"] += 1
+        since = self._red_since.pop(target.id, None)
+        if since is not None:
+            self.capture_latencies.append(self.tick - since)
+        if self.event_log:
+            self.event_log.log(self.tick, "catch", "Drone menangkap penjahat")
+        if self.telemetry_log:
+            self.telemetry_log.record(self.tick, telemetry.EVENT_CATCH, drone.id, target.id,
+                                      target.x, target.y, STATUS_THREAT[target.status])
+
+    def _record_spawn(self, entity, threat):
+        if self.telemetry_log:
+            self.telemetry_log.record(self.tick, telemetry.EVENT_SPAWN, entity.id,
+                                      x=entity.x, y=entity.y, threat=threat)
+
+    def record_telemetry_state(self):
+        """Rekam posisi semua person, drone dan polisi pada tick ini ke log telemetri."""
+        tl, tick = self.telemetry_log, self.tick
+        people, drones, polices = self.people, self.drones, self.polices
+        tl.record_many(tick, telemetry.EVENT_PERSON_STATE, [p.id for p in people],
+                       [p.x for p in people], [p.y for p in people],
+                       [STATUS_THREAT[p.status] for p in people])
+        tl.record_many(tick, telemetry.EVENT_DRONE_STATE, [d.id for d in drones],
+                       [d.x for d in drones], [d.y for d in drones],
+                       other=[d.target.id if d.target else -1 for d in drones])
+        tl.record_many(tick, telemetry.EVENT_POLICE_STATE, [pol.id for pol in polices],
+                       [pol.x for pol in polices], [pol.y for pol in polices],
+                       other=[pol.target.id for pol in polices])
+
+    # ---------- capture (swept) ----------
+    def _swept_hits(self, pursuers, radius):
+        """
+        Pengejar yang melewati targetnya sendiri dalam radius selama tick ini (urut waktu kontak).
+        Target yang dikejar beberapa pengejar hanya ditangkap oleh kontak paling awal.
+        """
+        if not pursuers:
+            return []
+        targets = list(dict.fromkeys(pu.target for pu in pursuers))
+        index = {t: j for j, t in enumerate(targets)}
+        hits = captures([(pu.prev_x, pu.prev_y) for pu in pursuers], [(pu.x, pu.y) for pu in pursuers],
+                        [(t.prev_x, t.prev_y) for t in targets], [(t.x, t.y) for t in targets],
+                        radius, targets=[index[pu.target] for pu in pursuers])
+        return [pursuers[i] for i, _j, _t in hits]
+
+    def _swept_drone_captures(self):
+        attackers = [d for d in self.drones if d.state == "ATTACK" and d.target and not d.target.caught]
+        for d in self._swept_hits(attackers, CATCH_RADIUS):
+            d.capture(self)
+
+    # ---------- update ----------
+    def step(self, n=1):
+        for _ in range(n):
+            self._tick()
+
+    def _tick(self):
+        self.tick += 1
+        mark = self.profiler.mark
+
+        # Update entitas
+        for p in self.people:
+            old = p.status
+            p.move()
+            maybe_change_yellow_status(p, self.safe_zone)
+            p.update_color()
+            if p.status != old:
+                self._status_changed(p, old)
+        mark("people")
+
+        if self.velocities is not None:
+            for p in self.by_status["red"]:
+                self.velocities.observe(p.id, p.x, p.y)
+        if self.assigner is not None:
+            self._assign_targets()
+        mark("assign")
+        for d in self.drones:
+            d.prev_x, d.prev_y = d.x, d.y
+            d.act(self)
+        if self.swept:
+            self._swept_drone_captures()
+        mark("drones")
+
+        if self.swept:
+            polices = self.polices[:]
+            for pol in polices:
+                pol.move(self.aim(pol, pol.target), capture=False)
+            done = self._swept_hits(polices, POLICE_CATCH_RADIUS)
+        else:
+            done = [pol for pol in self.polices[:] if pol.move(self.aim(pol, pol.target))]
+        for pol in done:
+            self.info("[INFO] Polisi menangkap penjahat dan keluar.")
+            if self.telemetry_log:
+                self.telemetry_log.record(self.tick, telemetry.EVENT_POLICE_CATCH, pol.id, pol.target.id,
+                                          pol.target.x, pol.target.y, STATUS_THREAT[pol.target.status])
+            self.polices.remove(pol)
+            # Hapus target yang ditangkap
+            self.people = [p for p in self.people if not p.caught]
+        mark("police")
+
+        if self.telemetry_log and self.tick % TELEMETRY_STATE_EVERY == 0:
+            self.record_telemetry_state()
+        mark("telemetry")
@@ -0,0 +1,80 @@
+"""
+event_log.py
+Logger event CSV dengan buffer di memori dan thread penulis di background.
+
+Loop utama hanya menambah baris ke ring buffer (tanpa I/O disk). Thread
+penulis membuka file sekali, lalu mem-flush buffer secara periodik
+(flush_interval) atau saat buffer mencapai flush_size baris. close()
+(dipanggil juga lewat atexit) menjamin semua baris tersisa ditulis.
+Jika penulis tertinggal sampai buffer penuh, baris tertua dibuang dan
+dihitung di `dropped` supaya loop utama tetap tidak pernah menunggu.
+"""
+
+import atexit
+import csv
+import threading
+from collections import deque
+
+FIELDNAMES = ["tick", "event", "detail"]
+
+
+class EventLogger:
+    def __init__(self, path, capacity=65536, flush_size=1024, flush_interval=1.0):
+        self.path = path
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._buf = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="event-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, tick, event, detail=""):
+        """Catat satu event; tidak pernah menunggu I/O disk."""
+        with self._lock:
+            if len(self._buf) == self._buf.maxlen:
+                self.dropped += 1
+            self._buf.append((tick, event, detail))
+            pending = len(self._buf)
+        if pending >= self.flush_size:
+            self._wake.set()
+
+    def close(self):
+        """Flush semua event tersisa lalu hentikan thread penulis."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _drain(self):
+        with self._lock:
+            rows = list(self._buf)
+            self._buf.clear()
+        return rows
+
+    def _run(self):
+        with open(self.path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDNAMES)
+            f.flush()
+            while True:
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                closing = self._closed  # baca sebelum drain: semua event sebelum close() pasti ikut ter-drain
+                rows = self._drain()
+                if rows:
+                    writer.writerows(rows)
+                    f.flush()
+                if closing:
+                    break
@@ -0,0 +1,242 @@
+"""
+telemetry.py
+Log telemetri biner kolumnar (append-only) + reader memory-mapped.
+
+Format file:
+- header file : MAGIC (4 byte) + versi (uint16) + padding        = 8 byte
+- lalu blok-blok berurutan, masing-masing:
+    header blok : b"BLK0", jumlah record n (uint32), tick_min (int64), tick_max (int64)
+    kolom       : tick int64[n], entity int32[n], other int32[n],
+                  x float32[n], y float32[n], threat float32[n], event uint8[n]
+    padding     : sampai kelipatan 8 byte
+Setiap record punya lebar tetap (29 byte); kolom disimpan bersebelahan per blok
+sehingga reader bisa langsung memetakan kolom ke array NumPy tanpa parsing teks.
+Tick di dalam file harus tidak menurun, jadi slice per rentang tick cukup
+memakai searchsorted pada tick_min/tick_max blok.
+
+Kolom:
+- entity : id entitas subjek (drone/person/polisi), -1 jika tidak ada
+- other  : id entitas terkait (mis. target yang ditangkap), -1 jika tidak ada
+- threat : tingkat ancaman person (lihat STATUS_THREAT di c1.py)
+"""
+
+import atexit
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"DTEL"
+VERSION = 1
+_FILE_HEADER = struct.Struct("<4sH2x")
+_BLOCK_HEADER = struct.Struct("<4sIqq")
+_BLOCK_MAGIC = b"BLK0"
+
+# (nama kolom, dtype) — urutan ini juga urutan kolom di dalam blok
+COLUMNS = (
+    ("tick", np.dtype("<i8")),
+    ("entity", np.dtype("<i4")),
+    ("other", np.dtype("<i4")),
+    ("x", np.dtype("<f4")),
+    ("y", np.dtype("<f4")),
+    ("threat", np.dtype("<f4")),
+    ("event", np.dtype("u1")),
+)
+RECORD_SIZE = sum(dt.itemsize for _, dt in COLUMNS)
+
+# --- kode event ---
+EVENT_CATCH = 1          # drone menangkap person
+EVENT_POLICE_CATCH = 2   # polisi menyelesaikan penangkapan
+EVENT_SPAWN = 3          # entitas baru (tombol spawn)
+EVENT_PERSON_STATE = 10  # sampel state person per tick
+EVENT_DRONE_STATE = 11   # sampel state drone per tick
+EVENT_POLICE_STATE = 12  # sampel state polisi per tick
+
+EVENT_NAMES = {
+    EVENT_CATCH: "catch",
+    EVENT_POLICE_CATCH: "police_catch",
+    EVENT_SPAWN: "spawn",
+    EVENT_PERSON_STATE: "person_state",
+    EVENT_DRONE_STATE: "drone_state",
+    EVENT_POLICE_STATE: "police_state",
+}
+
+
+def _block_nbytes(n):
+    size = _BLOCK_HEADER.size + n * RECORD_SIZE
+    return size + (-size % 8)
+
+
+class TelemetryWriter:
+    """Menulis record ke buffer blok; blok penuh langsung di-append ke file.
+    Blok yang belum penuh ditulis saat close() (juga lewat atexit)."""
+
+    def __init__(self, path, block_size=4096):
+        self.path = path
+        self.block_size = block_size
+        self._cols = {name: np.empty(block_size, dtype=dt) for name, dt in COLUMNS}
+        self._n = 0
+        self.last_tick = None
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        exists = size >= _FILE_HEADER.size  # lebih pendek = header pun belum lengkap: mulai ulang
+        if exists:
+            # lanjutkan file lama: tick baru tidak boleh lebih kecil dari tick terakhir
+            with TelemetryReader(path) as r:
+                if len(r.block_tick_max):
+                    self.last_tick = int(r.block_tick_max[-1])
+                end = r.end
+        if not exists or end < size:
+            # buang ekor blok yang terpotong (proses mati saat menulis), kalau tidak
+            # blok baru ditulis setelah sampah dan tidak pernah terbaca reader
+            with open(path, "r+b" if exists else "wb") as f:
+                f.truncate(end if exists else 0)
+        self._f = open(path, "ab")
+        if not exists:
+            self._f.write(_FILE_HEADER.pack(MAGIC, VERSION))
+        atexit.register(self.close)
+
+    def record(self, tick, event, entity=-1, other=-1, x=0.0, y=0.0, threat=0.0):
+        """Tambah satu record."""
+        if self.last_tick is not None and tick < self.last_tick:
+            raise ValueError(f"tick {tick} < tick terakhir {self.last_tick}")
+        self.last_tick = tick
+        i = self._n
+        c = self._cols
+        c["tick"][i] = tick
+        c["event"][i] = event
+        c["entity"][i] = entity
+        c["other"][i] = other
+        c["x"][i] = x
+        c["y"][i] = y
+        c["threat"][i] = threat
+        self._n = i + 1
+        if self._n == self.block_size:
+            self.flush()
+
+    def record_many(self, tick, event, entity, x, y, threat=0.0, other=-1):
+        """Tambah banyak record dengan tick & event yang sama (mis. state per tick semua person)."""
+        if self.last_tick is not None and tick < self.last_tick:
+            raise ValueError(f"tick {tick} < tick terakhir {self.last_tick}")
+        self.last_tick = tick
+        entity = np.asarray(entity)
+        n = len(entity)
+        values = {"entity": entity, "other": np.asarray(other), "x": np.asarray(x), "y": np.asarray(y),
+                  "threat": np.asarray(threat)}
+        start = 0
+        while start < n:
+            take = min(n - start, self.block_size - self._n)
+            dst = slice(self._n, self._n + take)
+            self._cols["tick"][dst] = tick
+            self._cols["event"][dst] = event
+            for name, v in values.items():
+                self._cols[name][dst] = v[start:start + take] if np.ndim(v) else v
+            self._n += take
+            start += take
+            if self._n == self.block_size:
+                self.flush()
+
+    def flush(self):
+        """Tulis blok yang sedang terisi (jika ada) ke file."""
+        n = self._n
+        if n == 0:
+            return
+        ticks = self._cols["tick"][:n]
+        header = _BLOCK_HEADER.pack(_BLOCK_MAGIC, n, int(ticks[0]), int(ticks[n - 1]))
+        parts = [header] + [self._cols[name][:n].tobytes() for name, _ in COLUMNS]
+        pad = _block_nbytes(n) - _BLOCK_HEADER.size - n * RECORD_SIZE
+        parts.append(b"\0" * pad)
+        self._f.write(b"".join(parts))
+        self._f.flush()
+        self._n = 0
+
+    def close(self):
+        if self._f.closed:
+            return
+        self.flush()
+        self._f.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TelemetryReader:
+    """Membaca file telemetri lewat memory map; kolom dikembalikan sebagai view NumPy."""
+
+    def __init__(self, path):
+        self.path = path
+        size = os.path.getsize(path)
+        if size < _FILE_HEADER.size:
+            raise ValueError(f"{path}: bukan file telemetri")
+        self._mm = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version = _FILE_HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: header telemetri tidak dikenal")
+        offsets, counts, tmin, tmax = [], [], [], []
+        pos = _FILE_HEADER.size
+        while pos + _BLOCK_HEADER.size <= size:
+            bmagic, n, t0, t1 = _BLOCK_HEADER.unpack_from(self._mm, pos)
+            if bmagic != _BLOCK_MAGIC or pos + _block_nbytes(n) > size:
+                break  # blok terakhir terpotong (mis. proses mati saat menulis)
+            offsets.append(pos)
+            counts.append(n)
+            tmin.append(t0)
+            tmax.append(t1)
+            pos += _block_nbytes(n)
+        self.block_offsets = np.array(offsets, dtype=np.int64)
+        self.block_counts = np.array(counts, dtype=np.int64)
+        self.block_tick_min = np.array(tmin, dtype=np.int64)
+        self.block_tick_max = np.array(tmax, dtype=np.int64)
+        self.end = pos  # offset byte setelah blok utuh terakhir
+
+    def __len__(self):
+        return int(self.block_counts.sum())
+
+    def close(self):
+        self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def block(self, i):
+        """Kolom-kolom blok ke-i sebagai dict nama -> array (view ke file, tanpa salin)."""
+        n = int(self.block_counts[i])
+        pos = int(self.block_offsets[i]) + _BLOCK_HEADER.size
+        cols = {}
+        for name, dt in COLUMNS:
+            nbytes = n * dt.itemsize
+            cols[name] = self._mm[pos:pos + nbytes].view(dt)
+            pos += nbytes
+        return cols
+
+    def iter_blocks(self, tick_lo=None, tick_hi=None):
+        """Stream blok demi blok; jika rentang diberikan, hanya record dengan tick_lo <= tick < tick_hi."""
+        lo_blk, hi_blk = self._block_range(tick_lo, tick_hi)
+        for i in range(lo_blk, hi_blk):
+            cols = self.block(i)
+            ticks = cols["tick"]
+            a = 0 if tick_lo is None else int(np.searchsorted(ticks, tick_lo, side="left"))
+            b = len(ticks) if tick_hi is None else int(np.searchsorted(ticks, tick_hi, side="left"))
+            if a == 0 and b == len(ticks):
+                yield cols
+            elif a < b:
+                yield {name: col[a:b] for name, col in cols.items()}
+
+    def slice(self, tick_lo=None, tick_hi=None):
+        """Semua record dalam rentang tick [tick_lo, tick_hi) sebagai dict kolom (disalin & digabung)."""
+        parts = list(self.iter_blocks(tick_lo, tick_hi))
+        if not parts:
+            return {name: np.empty(0, dtype=dt) for name, dt in COLUMNS}
+        return {name: np.concatenate([p[name] for p in parts]) for name, _ in COLUMNS}
+
+    def _block_range(self, tick_lo, tick_hi):
+        lo = 0 if tick_lo is None else int(np.searchsorted(self.block_tick_max, tick_lo, side="left"))
+        hi = len(self.block_offsets) if tick_hi is None else int(
+            np.searchsorted(self.block_tick_min, tick_hi, side="left"))
+        return lo, hi
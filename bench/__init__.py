@@ -0,0 +1,16 @@
+"""
+bench
+Benchmark hot path per tick semua simulator, headless, pada populasi
+berjenjang (10 -> 100k person, 1 -> 1k drone).
+
+- cases.py: cara membangun world tiap simulator dan satu tick hot path-nya.
+- run.py: runner (satu proses baru per case), metrik ticks/s, latensi tick
+  p50/p99 dan peak RSS, baseline JSON di bench/baselines/, dan compare
+  terhadap baseline untuk mendeteksi regresi antar versi.
+
+Angka baseline hanya bermakna di mesin yang sama; baselines/baseline.json
+adalah titik awal, buat ulang dengan --out di mesin sendiri sebelum compare.
+
+    python -m bench.run --out bench/baselines/local.json
+    python -m bench.run --compare bench/baselines/local.json
+"""
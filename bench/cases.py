@@ -0,0 +1,101 @@
+"""
+cases.py
+Satu case benchmark = simulator x skala populasi. build() mengembalikan
+(world, tick) dengan tick() memajukan tepat satu tick hot path:
+
+- ai1       : a_world.World.step -> Drone.scan / Drone.move tiap drone
+- ai1-array : a_array.ArrayWorld.step (mode array NumPy untuk crowd besar)
+- ai2       : world.World.step -> DroneBrain.decide per drone + sweep stale shared_targets
+- ai3       : DroneBrain.update_status tiap brain (satu frame, 1/60 detik); jumlah brain = kolom
+              person (satu brain per objek yang diikuti), karena satu brain hanya butuh mikrodetik
+- ai4       : c1_world.World.step -> Drone.act + maybe_change_yellow_status
+
+`assign` (1/0) diteruskan ke simcore.scenarios.build_world, jadi biaya
+assignment global drone->target bisa dipisahkan dari sisa tick.
+
+World ai2 / ai4 punya snapshot (simcore.snapshot), jadi world yang sudah
+di-warm-up bisa disimpan dan dipakai ulang antar run (warm start).
+"""
+
+import os
+import time
+
+from simcore import paths, snapshot
+from simcore.rng import WorldRNG
+from simcore.scenarios import build_world
+
+SIMS = ("ai1", "ai1-array", "ai2", "ai3", "ai4")
+SNAPSHOT_SIMS = ("ai2", "ai4")
+
+# nama skala -> (person, drone)
+SCALES = {
+    "xs": (10, 1),
+    "s": (100, 3),
+    "m": (1000, 10),
+    "l": (10000, 100),
+    "xl": (100000, 1000),
+}
+DEFAULT_SCALES = ("xs", "s", "m")
+
+FRAME = 1 / 60  # detik per tick untuk ai3 (laju polling EyeXSimulator)
+
+
+def _ai3(brains, seed):
+    paths.use("ai3")
+    from DroneBrain import DroneBrain, TimerQueue
+    rng = WorldRNG(seed)
+    fleet = [DroneBrain(rng.stream(f"brain:{i}"), TimerQueue(0.0), drone_id=i) for i in range(brains)]
+    clock = [0.0]
+
+    def tick():
+        clock[0] += FRAME
+        now = clock[0]
+        for brain in fleet:
+            brain.update_status(now)
+    return fleet, tick
+
+
+def build(sim, people, drones, seed=0, assign=1):
+    """(world, tick) untuk satu case; assign diabaikan untuk ai3."""
+    if sim == "ai3":
+        return _ai3(people, seed)
+    world = build_world(sim, {"people": people, "drones": drones, "seed": seed, "assign": assign})
+    return world, world.step
+
+
+def _world_class(sim):
+    if sim == "ai2":
+        paths.use("ai2")
+        import world
+        return world.World
+    paths.use("ai4")
+    import c1_world
+    return c1_world.World
+
+
+def warm(sim, people, drones, seed=0, warmup=0, cache_dir=None, assign=1, budget=None):
+    """
+    build() lalu jalankan `warmup` tick supaya drone sudah mengejar / state tidak kosong.
+    budget: detik maksimum warm-up; berhenti lebih awal setelah tick yang melewatinya.
+    Mengembalikan (world, tick, jumlah tick warm-up yang benar-benar dijalankan).
+    Untuk ai2 / ai4 dengan cache_dir, world hasil warm-up lengkap disimpan sebagai
+    snapshot dan run berikutnya langsung me-restore-nya.
+    """
+    path = None
+    if cache_dir and sim in SNAPSHOT_SIMS:
+        path = os.path.join(cache_dir, f"{sim}-p{people}-d{drones}-s{seed}-a{assign}-w{warmup}.snap")
+        if os.path.exists(path):
+            world = _world_class(sim).restore(snapshot.load(path))
+            return world, world.step, warmup
+    world, tick = build(sim, people, drones, seed, assign)
+    start = time.perf_counter()
+    done = 0
+    while done < warmup:
+        tick()
+        done += 1
+        if budget is not None and time.perf_counter() - start > budget:
+            break
+    if path is not None and done == warmup:
+        os.makedirs(cache_dir, exist_ok=True)
+        snapshot.save(path, world.snapshot())
+    return world, tick, done
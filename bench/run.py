@@ -0,0 +1,254 @@
+"""
+run.py
+Runner benchmark: tiap case (simulator x skala) dijalankan di proses baru
+supaya peak RSS tidak tercampur case lain, lalu hasilnya disimpan sebagai
+baseline JSON atau dibandingkan dengan baseline lama.
+
+Metrik per case:
+- ticks_per_sec : tick / total waktu tick (tanpa build & warm-up)
+- p50_ms, p99_ms: latensi satu tick
+- peak_rss_mb   : RSS maksimum proses case (build + warm-up + run)
+- ticks         : total tick terukur dari semua ulangan
+
+Warm-up dan pengukuran masing-masing berhenti setelah tick pertama yang
+melewati --budget detik (atau setelah --warmup / --ticks tick). Satu tick
+tidak bisa dipotong di tengah, jadi tiap run juga punya batas keras
+--timeout detik (build + warm-up + ukur): proses yang melewatinya dihentikan
+dan case dilaporkan "timeout" tanpa angka, tanpa mengulang sisa --repeat.
+Contoh: xl dengan assignment global bisa butuh detik per tick; bandingkan
+dengan --assign 0 untuk memisahkan biaya assignment.
+
+Tiap case diulang --repeat kali (proses baru tiap kali) dan yang dilaporkan
+median-nya, supaya satu run yang kebetulan terganggu proses lain tidak jadi
+baseline.
+
+Contoh:
+    python -m bench.run                                   # semua sim, skala xs,s,m
+    python -m bench.run --sims ai2,ai4 --scales m,l --out bench/baselines/local.json
+    python -m bench.run --compare bench/baselines/local.json   # ulangi case baseline, exit 1 bila regresi
+    python -m bench.run --sims ai4 --scales xl --assign 0 --timeout 600
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from bench.cases import DEFAULT_SCALES, SCALES, SIMS, warm
+from simcore.sweep import percentile
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS tidak dilaporkan
+    resource = None
+
+VERSION = 1
+TOLERANCE = 0.2  # perubahan relatif yang masih dianggap noise saat compare
+TIMEOUT = 120.0  # detik maksimum satu run (build + warm-up + ukur)
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024  # macOS: byte, Linux: KiB
+
+
+def run_case(sim, scale, ticks, budget, seed=0, warmup=0, cache_dir=None, assign=1):
+    """Jalankan satu case di proses ini; dipanggil di proses worker baru."""
+    people, drones = SCALES[scale]
+    _world, tick, warmed = warm(sim, people, drones, seed, warmup, cache_dir, assign, budget)
+    clock = time.perf_counter
+    lat = []
+    start = clock()
+    for _ in range(ticks):
+        t0 = clock()
+        tick()
+        lat.append(clock() - t0)
+        if clock() - start > budget:
+            break
+    total = sum(lat)
+    lat.sort()
+    return {
+        "sim": sim, "scale": scale, "people": people, "drones": drones, "seed": seed, "assign": assign,
+        "warmup": warmed, "ticks": len(lat),
+        "ticks_per_sec": len(lat) / total if total > 0 else float("inf"),
+        "p50_ms": percentile(lat, 0.50) * 1e3,
+        "p99_ms": percentile(lat, 0.99) * 1e3,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _timed_out(sim, scale, seed, assign):
+    people, drones = SCALES[scale]
+    return {"sim": sim, "scale": scale, "people": people, "drones": drones, "seed": seed, "assign": assign,
+            "warmup": None, "ticks": 0, "ticks_per_sec": None, "p50_ms": None, "p99_ms": None,
+            "peak_rss_mb": None, "timeout": True}
+
+
+def _worker(conn, args):
+    with conn:
+        conn.send(run_case(*args))
+
+
+def _run_isolated(ctx, args, timeout):
+    """run_case(*args) di proses baru; None bila melewati timeout (proses dihentikan)."""
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_worker, args=(send, args))
+    proc.start()
+    send.close()
+    try:
+        if not recv.poll(timeout):
+            proc.terminate()
+            return None
+        try:
+            return recv.recv()
+        except EOFError:
+            raise RuntimeError(f"case {args[:2]} gagal (lihat traceback worker di atas)") from None
+    finally:
+        proc.join()
+        recv.close()
+
+
+def merge_repeats(runs):
+    """Gabungkan beberapa run satu case: median ticks/s & latensi, RSS maksimum."""
+    merged = dict(runs[0])
+    for key in ("ticks_per_sec", "p50_ms", "p99_ms"):
+        merged[key] = statistics.median(r[key] for r in runs)
+    rss = [r["peak_rss_mb"] for r in runs if r["peak_rss_mb"] is not None]
+    merged["peak_rss_mb"] = max(rss) if rss else None
+    merged["ticks"] = sum(r["ticks"] for r in runs)
+    merged["repeat"] = len(runs)
+    return merged
+
+
+def run_suite(cases, ticks, budget, seed=0, warmup=0, cache_dir=None, repeat=1, progress=None, assign=1,
+              timeout=TIMEOUT):
+    """cases: list (sim, scale); dijalankan berurutan, satu proses baru per run."""
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for sim, scale in cases:
+        runs = []
+        for _ in range(repeat):
+            run = _run_isolated(ctx, (sim, scale, ticks, budget, seed, warmup, cache_dir, assign), timeout)
+            if run is None:
+                break
+            runs.append(run)
+        r = merge_repeats(runs) if len(runs) == repeat else _timed_out(sim, scale, seed, assign)
+        results.append(r)
+        if progress:
+            progress(r)
+    return results
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """
+    Bandingkan dengan baseline (case dicocokkan lewat sim + people + drones + assign).
+    Mengembalikan list baris: hasil + speed / p99 relatif terhadap baseline + flag regresi.
+    Case yang timeout dianggap regresi bila baseline-nya punya angka.
+    """
+    base = {(b["sim"], b["people"], b["drones"], b.get("assign", 1)): b for b in baseline["results"]}
+    rows = []
+    for r in results:
+        b = base.get((r["sim"], r["people"], r["drones"], r.get("assign", 1)))
+        if b is None or b.get("timeout"):
+            rows.append({**r, "speed": None, "p99": None, "regression": False})
+            continue
+        if r.get("timeout"):
+            rows.append({**r, "speed": None, "p99": None, "regression": True})
+            continue
+        speed = r["ticks_per_sec"] / b["ticks_per_sec"] - 1.0
+        p99 = r["p99_ms"] / b["p99_ms"] - 1.0 if b["p99_ms"] else 0.0
+        rows.append({**r, "speed": speed, "p99": p99, "regression": speed < -tolerance or p99 > tolerance})
+    return rows
+
+
+def _fmt(v, spec=".1f"):
+    return "-" if v is None else format(v, spec)
+
+
+def _print_row(r):
+    print(f"{r['sim']:10s}{r['scale']:>4s}{r['people']:>8d}{r['drones']:>7d}{r['ticks']:>7d}"
+          f"{_fmt(r['ticks_per_sec']):>12s}{_fmt(r['p50_ms'], '.3f'):>10s}{_fmt(r['p99_ms'], '.3f'):>10s}"
+          f"{_fmt(r['peak_rss_mb']):>9s}{'  timeout' if r.get('timeout') else ''}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot path per tick semua simulator.")
+    parser.add_argument("--sims", help=f"daftar sim dipisah koma (default: {','.join(SIMS)})")
+    parser.add_argument("--scales", help=f"skala dipisah koma dari {','.join(SCALES)} "
+                                         f"(default: {','.join(DEFAULT_SCALES)})")
+    parser.add_argument("--ticks", type=int, default=200, help="tick maksimum per case")
+    parser.add_argument("--budget", type=float, default=5.0, help="detik maksimum warm-up dan pengukuran per run")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT,
+                        help="batas keras detik per run (build + warm-up + ukur); lewat = case timeout")
+    parser.add_argument("--assign", type=int, choices=(0, 1), default=1,
+                        help="assignment global drone->target (0 = greedy lama)")
+    parser.add_argument("--warmup", type=int, default=20, help="tick sebelum pengukuran")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="run per case (dilaporkan median)")
+    parser.add_argument("--warm-cache", help="folder snapshot world hasil warm-up (ai2/ai4)")
+    parser.add_argument("--out", help="simpan hasil sebagai baseline JSON")
+    parser.add_argument("--compare", help="baseline JSON pembanding; case yang sama dijalankan ulang")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        cfg = baseline["config"]
+        args.ticks, args.budget, args.warmup, args.seed = cfg["ticks"], cfg["budget"], cfg["warmup"], cfg["seed"]
+        args.repeat = cfg.get("repeat", args.repeat)
+        args.assign = cfg.get("assign", 1)
+    if args.sims or args.scales or baseline is None:
+        sims = args.sims.split(",") if args.sims else list(SIMS)
+        scales = args.scales.split(",") if args.scales else list(DEFAULT_SCALES)
+        for name in sims:
+            if name not in SIMS:
+                parser.error(f"sim tidak dikenal: {name}")
+        for name in scales:
+            if name not in SCALES:
+                parser.error(f"skala tidak dikenal: {name}")
+        cases = [(sim, scale) for sim in sims for scale in scales]
+    else:
+        cases = [(b["sim"], b["scale"]) for b in baseline["results"]]
+
+    print(f"{'sim':10s}{'scale':>4s}{'people':>8s}{'drones':>7s}{'ticks':>7s}"
+          f"{'ticks/s':>12s}{'p50 ms':>10s}{'p99 ms':>10s}{'rss MB':>9s}")
+    results = run_suite(cases, args.ticks, args.budget, args.seed, args.warmup, args.warm_cache, args.repeat,
+                        _print_row, args.assign, args.timeout)
+
+    if args.out:
+        data = {
+            "version": VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} cpu)",
+            "config": {"ticks": args.ticks, "budget": args.budget, "warmup": args.warmup, "seed": args.seed,
+                       "repeat": args.repeat, "assign": args.assign},
+            "results": results,
+        }
+        with open(args.out, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"[INFO] baseline tersimpan di {args.out}")
+
+    if baseline is not None:
+        rows = compare(results, baseline, args.tolerance)
+        print(f"\nvs {args.compare} ({baseline.get('created')}, toleransi {args.tolerance:.0%})")
+        for r in rows:
+            speed = "-" if r["speed"] is None else f"{r['speed']:+.1%}"
+            p99 = "-" if r["p99"] is None else f"{r['p99']:+.1%}"
+            flag = "  REGRESI" if r["regression"] else ""
+            print(f"{r['sim']:10s}{r['scale']:>4s}  ticks/s {speed:>8s}  p99 {p99:>8s}{flag}")
+        if any(r["regression"] for r in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
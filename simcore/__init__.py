@@ -0,0 +1,13 @@
+"""
+simcore
+Infrastruktur bersama untuk semua simulator (ai1, ai2, ai3, ai4).
+
+Setiap folder aiN tetap berupa kumpulan skrip yang saling import secara datar
+(mis. `from brain import DroneBrain`); modul di sini memasukkan folder aiN
+yang dibutuhkan ke sys.path lewat simcore.paths.
+
+Front-end dijalankan sebagai modul dari root repo (mis. `python -m ai2.main`),
+jadi simcore selalu bisa diimpor; tiap entry point memanggil
+paths.use("aiN") sendiri sebelum import datar, modul world tidak mengubah
+sys.path.
+"""
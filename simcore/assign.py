@@ -0,0 +1,285 @@
+"""
+assign.py
+Alokasi drone -> target secara global (bukan greedy per drone).
+
+- hungarian(cost): assignment biaya minimum untuk matriks n x m (Hungarian /
+  Kuhn-Munkres dengan potensial, O(n^2 m)).
+- Assigner: tahap assignment yang dijalankan sekali per tick oleh World.
+  Biaya pasangan = jarak / threat (target dekat & berbahaya lebih dulu).
+  Hasil solve terakhir dipakai ulang selama himpunan drone/target dan threat
+  sama serta tidak ada posisi yang bergeser lebih dari `tolerance`, jadi
+  pergerakan kecil tidak memicu solve ulang tiap tick.
+
+Pasangan di luar `reach` bernilai BLOCKED (inf) di matriks biaya dan tidak
+pernah dipilih. Di dalam Hungarian, BLOCKED diganti big-M sedikit di atas
+jumlah semua biaya layak: cukup besar supaya solver memaksimalkan jumlah
+pasangan layak lebih dulu, tapi tidak sebesar 1e18 yang merusak presisi
+potensial u / v.
+
+Ukuran solve dibatasi supaya crowd besar tetap murah:
+- tiap agent hanya melihat CANDIDATES target termurahnya (dihitung per chunk
+  baris, matriks biaya penuh n x m tidak pernah dibuat sekaligus). Dengan
+  agent <= CANDIDATES ini tetap optimal: pada assignment optimal tiap baris
+  pasti mendapat salah satu dari n kolom termurahnya;
+- sampai HUNGARIAN_MAX agent, Hungarian dijalankan pada gabungan kandidat
+  (<= n * CANDIDATES kolom); di atas itu dipakai greedy biaya termurah
+  (O(n * CANDIDATES log)), karena Hungarian murni Python O(n^2 m);
+- agent yang semua kandidatnya sudah diambil agent lain diulang dengan
+  target yang tersisa dan kandidat dua kali lebih banyak (drone yang
+  berkumpul berebut kandidat yang sama), jadi tidak ada agent menganggur
+  selama masih ada target layak.
+"""
+
+import heapq
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: matriks biaya dibangun dengan list biasa
+    np = None
+
+MIN_THREAT = 1e-3  # threat 0 tidak membuat biaya tak hingga
+BLOCKED = math.inf  # biaya pasangan di luar jangkauan (tidak pernah dipilih)
+CANDIDATES = 8      # target termurah per agent yang ikut solve (agent <= CANDIDATES: tetap optimal)
+HUNGARIAN_MAX = 64  # di atas jumlah agent ini dipakai greedy
+_CHUNK = 1 << 22    # elemen matriks biaya per chunk baris
+
+
+def hungarian(cost):
+    """
+    cost: list baris (n x m). Mengembalikan list kolom per baris; bila n > m,
+    baris yang tidak kebagian kolom bernilai -1.
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    if n == 0 or m == 0:
+        return [-1] * n
+    if n > m:
+        cols = hungarian([list(col) for col in zip(*cost)])
+        rows = [-1] * n
+        for j, i in enumerate(cols):
+            if i >= 0:
+                rows[i] = j
+        return rows
+
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)    # p[j] = baris (1-based) yang memegang kolom j
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while True:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+            if j0 == 0:
+                break
+    result = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            result[p[j] - 1] = j - 1
+    return result
+
+
+def _cost_matrix(agent_xy, target_xy, threats, reach):
+    if np is not None:
+        a = np.asarray(agent_xy, dtype=np.float64).reshape(-1, 2)
+        t = np.asarray(target_xy, dtype=np.float64).reshape(-1, 2)
+        dx = t[None, :, 0] - a[:, None, 0]
+        dy = t[None, :, 1] - a[:, None, 1]
+        cost = np.hypot(dx, dy) / np.maximum(np.asarray(threats, dtype=np.float64), MIN_THREAT)
+        if reach is not None:
+            cost[(np.abs(dx) > reach) | (np.abs(dy) > reach)] = BLOCKED
+        return cost
+    cost = []
+    for ax, ay in agent_xy:
+        row = []
+        for (tx, ty), threat in zip(target_xy, threats):
+            if reach is not None and (abs(tx - ax) > reach or abs(ty - ay) > reach):
+                row.append(BLOCKED)
+            else:
+                row.append(math.hypot(tx - ax, ty - ay) / max(threat, MIN_THREAT))
+        cost.append(row)
+    return cost
+
+
+def _take(seq, idx):
+    return seq[idx] if np is not None else [seq[i] for i in idx]
+
+
+def _nearest(agent_xy, target_xy, threats, reach, k):
+    """Per agent: list (biaya, index target) untuk k target termurah yang layak, urut biaya."""
+    n, m = len(agent_xy), len(target_xy)
+    k = min(k, m)
+    if np is None:
+        return [[(c, j) for c, j in heapq.nsmallest(k, zip(row, range(m))) if c < BLOCKED]
+                for row in _cost_matrix(agent_xy, target_xy, threats, reach)]
+    # urutan biaya^2 = urutan biaya: sqrt hanya untuk k kandidat terpilih
+    tx, ty = target_xy[:, 0], target_xy[:, 1]
+    inv2 = 1.0 / np.maximum(threats, MIN_THREAT) ** 2
+    out = []
+    step = max(1, _CHUNK // m)
+    for start in range(0, n, step):
+        a = agent_xy[start:start + step]
+        dx = tx[None, :] - a[:, 0, None]
+        dy = ty[None, :] - a[:, 1, None]
+        cost2 = (dx * dx + dy * dy) * inv2
+        if reach is not None:
+            cost2[(np.abs(dx) > reach) | (np.abs(dy) > reach)] = BLOCKED
+        part = np.argpartition(cost2, k - 1, axis=1)[:, :k] if k < m else np.broadcast_to(np.arange(m), cost2.shape)
+        part_cost = np.take_along_axis(cost2, part, axis=1)
+        order = np.argsort(part_cost, axis=1, kind="stable")
+        for js, cs in zip(np.take_along_axis(part, order, axis=1).tolist(),
+                          np.sqrt(np.take_along_axis(part_cost, order, axis=1)).tolist()):
+            out.append([(c, j) for c, j in zip(cs, js) if c < BLOCKED])
+    return out
+
+
+def _hungarian_pairs(agent_xy, target_xy, threats, reach, cand):
+    """Hungarian pada gabungan kolom kandidat; (agent, target) yang layak saja."""
+    union = sorted({j for row in cand for _c, j in row})
+    if not union:
+        return []
+    cost = _cost_matrix(agent_xy, _take(target_xy, union), _take(threats, union), reach)
+    sub = cost.tolist() if np is not None else cost
+    # big-M: lebih mahal dari assignment layak mana pun, tapi tetap dalam skala biaya
+    big = 1.0 + sum(c for row in sub for c in row if c < BLOCKED)
+    sub = [[c if c < BLOCKED else big for c in row] for row in sub]
+    return [(i, union[j]) for i, j in enumerate(hungarian(sub)) if j >= 0 and sub[i][j] < big]
+
+
+def _greedy_pairs(cand):
+    """Pasangan kandidat termurah lebih dulu; tiap agent / target paling banyak sekali."""
+    pairs, used_i, used_j = [], set(), set()
+    for _c, i, j in sorted((c, i, j) for i, row in enumerate(cand) for c, j in row):
+        if i not in used_i and j not in used_j:
+            used_i.add(i)
+            used_j.add(j)
+            pairs.append((i, j))
+    return pairs
+
+
+def solve(agent_xy, target_xy, threats, reach=None):
+    """Index target per agent (-1 = tidak dapat target / semua di luar jangkauan)."""
+    n, m = len(agent_xy), len(target_xy)
+    result = [-1] * n
+    if n == 0 or m == 0:
+        return result
+    if np is not None:
+        agent_xy = np.asarray(agent_xy, dtype=np.float64).reshape(-1, 2)
+        target_xy = np.asarray(target_xy, dtype=np.float64).reshape(-1, 2)
+        threats = np.asarray(threats, dtype=np.float64)
+    else:
+        threats = list(threats)
+    rows, cols = list(range(n)), list(range(m))
+    k = CANDIDATES
+    while rows and cols:
+        a_xy, t_xy, t_threat = _take(agent_xy, rows), _take(target_xy, cols), _take(threats, cols)
+        cand = _nearest(a_xy, t_xy, t_threat, reach, min(len(rows), k))
+        if len(rows) <= HUNGARIAN_MAX:
+            pairs = _hungarian_pairs(a_xy, t_xy, t_threat, reach, cand)
+        else:
+            pairs = _greedy_pairs(cand)
+        for i, j in pairs:
+            result[rows[i]] = cols[j]
+        if not pairs or len(rows) <= CANDIDATES:
+            break  # solve eksak: agent sisa memang tidak punya target layak
+        taken_i, taken_j = {i for i, _j in pairs}, {j for _i, j in pairs}
+        # agent tanpa kandidat layak sama sekali tidak akan dapat target di putaran berikutnya
+        rows = [r for i, r in enumerate(rows) if i not in taken_i and cand[i]]
+        cols = [c for j, c in enumerate(cols) if j not in taken_j]
+        k *= 2  # agent sisa berebut kandidat yang sama (mis. berkumpul di satu titik): perlebar
+    return result
+
+
+class Assigner:
+    def __init__(self, tolerance=0.0, reach=None):
+        """
+        tolerance: pergeseran posisi maksimum (per sumbu) yang belum memicu solve ulang
+        reach: bila diisi, pasangan dengan |dx| atau |dy| > reach tidak boleh dipilih
+        """
+        self.tolerance = tolerance
+        self.reach = reach
+        self.solves = 0  # jumlah solve penuh (untuk profiling)
+        self._key = None
+        self._xy = None
+        self._result = None
+
+    def assign(self, agent_keys, agent_xy, target_keys, target_xy, threats):
+        """
+        agent_keys / target_keys: identitas stabil (objek, id, index) untuk cache antar tick
+        *_xy: (x, y) per agent / target; threats: threat per target
+        Mengembalikan list target key (atau None) sejajar dengan agent_keys.
+        """
+        agent_keys, target_keys, threats = list(agent_keys), list(target_keys), list(threats)
+        key = (agent_keys, target_keys, threats)
+        if np is not None:
+            xy = np.concatenate([np.asarray(agent_xy, dtype=np.float64).reshape(-1, 2),
+                                 np.asarray(target_xy, dtype=np.float64).reshape(-1, 2)])
+        else:
+            xy = [tuple(pt) for pt in agent_xy] + [tuple(pt) for pt in target_xy]
+        if key == self._key and self._within_tolerance(xy):
+            return self._result
+        cols = solve(agent_xy, target_xy, threats, self.reach)
+        self.solves += 1
+        self._key, self._xy = key, xy
+        self._result = [target_keys[j] if j >= 0 else None for j in cols]
+        return self._result
+
+    def _within_tolerance(self, xy):
+        tol = self.tolerance
+        if np is not None:
+            return bool((np.abs(xy - self._xy) <= tol).all())
+        for (x0, y0), (x1, y1) in zip(self._xy, xy):
+            if abs(x1 - x0) > tol or abs(y1 - y0) > tol:
+                return False
+        return True
+
+    def reset(self):
+        """Paksa solve penuh pada panggilan berikutnya."""
+        self._key = None
+
+    def state(self):
+        """Cache solve terakhir (agent_keys, target_keys, threats, xy, result), atau None; untuk snapshot."""
+        if self._key is None:
+            return None
+        xy = self._xy.tolist() if np is not None else [list(pt) for pt in self._xy]
+        return (*self._key, xy, list(self._result))
+
+    def set_state(self, state):
+        if state is None:
+            self._key = self._xy = self._result = None
+            return
+        agent_keys, target_keys, threats, xy, result = state
+        self._key = (list(agent_keys), list(target_keys), list(threats))
+        self._xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2) if np is not None else [tuple(pt) for pt in xy]
+        self._result = list(result)
@@ -0,0 +1,144 @@
+"""
+capture.py
+Deteksi penangkapan kontinu (swept): pengejar dan target dianggap bergerak
+lurus dari posisi awal ke posisi akhir tick secara bersamaan, dan tertangkap
+bila jarak keduanya pernah < radius di sepanjang tick, bukan hanya di ujung
+langkah. Drone yang cepat atau tick yang besar tidak lagi "menembus" target
+dan berosilasi di sekitarnya.
+
+- contact_time(p0, p1, q0, q1, radius): waktu kontak pertama t di [0, 1]
+  untuk satu pasangan (None = tidak bersentuhan). Gerak relatif
+  r(t) = (q0 - p0) + t * ((q1 - q0) - (p1 - p0)); akar terkecil |r(t)| = radius.
+- broad_phase(...): kandidat pasangan dari semua pengejar x semua target
+  (bounding box sapuan yang diperbesar radius harus bertumpuk), satu
+  perhitungan tervektorisasi per chunk.
+- captures(...): broad phase + narrow phase batch, lalu pasangan dipilih
+  urut waktu kontak; tiap pengejar menangkap paling banyak satu target dan
+  tiap target ditangkap paling banyak sekali. `targets` membatasi tiap
+  pengejar ke targetnya sendiri (tanpa broad phase).
+
+Karena waktu kontak dihitung analitik, hasilnya tidak bergantung pada besar
+langkah: untuk gerak lurus, satu tick besar dan banyak tick kecil yang
+menempuh lintasan sama menghasilkan penangkapan yang sama.
+
+Semua posisi berupa pasangan (x, y); array (n, 2) bila NumPy ada.
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: broad/narrow phase jatuh ke loop biasa
+    np = None
+
+# batas elemen matriks kandidat (pengejar x target) per chunk supaya memori tetap kecil
+_PAIR_CHUNK = 1 << 22
+
+
+def contact_time(p0, p1, q0, q1, radius):
+    """Waktu kontak pertama t di [0, 1] antara pengejar p0->p1 dan target q0->q1 (None = tidak)."""
+    rx, ry = q0[0] - p0[0], q0[1] - p0[1]
+    c = rx * rx + ry * ry - radius * radius
+    if c < 0:
+        return 0.0
+    dx = (q1[0] - q0[0]) - (p1[0] - p0[0])
+    dy = (q1[1] - q0[1]) - (p1[1] - p0[1])
+    a = dx * dx + dy * dy
+    b = 2.0 * (rx * dx + ry * dy)
+    if a == 0 or b >= 0:
+        return None  # tidak bergerak relatif, atau menjauh
+    disc = b * b - 4.0 * a * c
+    if disc < 0:
+        return None
+    t = (-b - math.sqrt(disc)) / (2.0 * a)
+    return t if t <= 1.0 else None
+
+
+def _contact_times(p0, p1, q0, q1, radius):
+    """contact_time untuk baris-baris yang sejajar (n, 2); NaN = tidak bersentuhan."""
+    r = q0 - p0
+    d = (q1 - q0) - (p1 - p0)
+    c = np.einsum("ij,ij->i", r, r) - radius * radius
+    a = np.einsum("ij,ij->i", d, d)
+    b = 2.0 * np.einsum("ij,ij->i", r, d)
+    disc = b * b - 4.0 * a * c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (-b - np.sqrt(np.maximum(disc, 0.0))) / (2.0 * a)
+    t = np.where((a > 0) & (b < 0) & (disc >= 0) & (t <= 1.0), t, np.nan)
+    t[c < 0] = 0.0
+    return t
+
+
+def _sweep_boxes(a0, a1, pad):
+    return np.minimum(a0, a1) - pad, np.maximum(a0, a1) + pad
+
+
+def broad_phase(p0, p1, q0, q1, radius):
+    """(i, j) kandidat: kotak sapuan pengejar i (diperbesar radius) bertumpuk dengan kotak sapuan target j."""
+    if np is None:
+        pairs_i, pairs_j = [], []
+        for i, (a0, a1) in enumerate(zip(p0, p1)):
+            lo = (min(a0[0], a1[0]) - radius, min(a0[1], a1[1]) - radius)
+            hi = (max(a0[0], a1[0]) + radius, max(a0[1], a1[1]) + radius)
+            for j, (b0, b1) in enumerate(zip(q0, q1)):
+                if (max(b0[0], b1[0]) >= lo[0] and min(b0[0], b1[0]) <= hi[0]
+                        and max(b0[1], b1[1]) >= lo[1] and min(b0[1], b1[1]) <= hi[1]):
+                    pairs_i.append(i)
+                    pairs_j.append(j)
+        return pairs_i, pairs_j
+    plo, phi = _sweep_boxes(p0, p1, radius)
+    qlo, qhi = _sweep_boxes(q0, q1, 0.0)
+    n, m = len(p0), len(q0)
+    if n == 0 or m == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    chunk = max(1, _PAIR_CHUNK // m)
+    found_i, found_j = [], []
+    for start in range(0, n, chunk):
+        lo, hi = plo[start:start + chunk, None, :], phi[start:start + chunk, None, :]
+        overlap = np.all((qhi[None, :, :] >= lo) & (qlo[None, :, :] <= hi), axis=2)
+        ii, jj = np.nonzero(overlap)
+        found_i.append(ii + start)
+        found_j.append(jj)
+    return np.concatenate(found_i), np.concatenate(found_j)
+
+
+def captures(p0, p1, q0, q1, radius, targets=None):
+    """
+    p0 / p1: posisi awal / akhir tick pengejar (n, 2); q0 / q1: target (m, 2).
+    targets: None = semua pasangan pengejar x target; selain itu index target
+             per pengejar (-1 / None = tidak mengejar).
+    Mengembalikan list (i, j, t) urut t: pengejar i menangkap target j pada waktu t di [0, 1].
+    """
+    if np is None:
+        if targets is None:
+            cand = zip(*broad_phase(p0, p1, q0, q1, radius))
+        else:
+            cand = ((i, j) for i, j in enumerate(targets) if j is not None and j >= 0)
+        hits = []
+        for i, j in cand:
+            t = contact_time(p0[i], p1[i], q0[j], q1[j], radius)
+            if t is not None:
+                hits.append((t, i, j))
+    else:
+        p0, p1 = np.asarray(p0, dtype=np.float64).reshape(-1, 2), np.asarray(p1, dtype=np.float64).reshape(-1, 2)
+        q0, q1 = np.asarray(q0, dtype=np.float64).reshape(-1, 2), np.asarray(q1, dtype=np.float64).reshape(-1, 2)
+        if targets is None:
+            ii, jj = broad_phase(p0, p1, q0, q1, radius)
+        else:
+            tj = np.array([-1 if j is None else j for j in targets], dtype=np.intp)
+            ii = np.flatnonzero(tj >= 0)
+            jj = tj[ii]
+        if len(ii) == 0:
+            return []
+        t = _contact_times(p0[ii], p1[ii], q0[jj], q1[jj], radius)
+        ok = ~np.isnan(t)
+        hits = list(zip(t[ok].tolist(), ii[ok].tolist(), jj[ok].tolist()))
+    hits.sort()
+    result, used_i, used_j = [], set(), set()
+    for t, i, j in hits:
+        if i in used_i or j in used_j:
+            continue
+        used_i.add(i)
+        used_j.add(j)
+        result.append((i, j, t))
+    return result
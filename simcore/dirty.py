@@ -0,0 +1,53 @@
+"""
+dirty.py
+Renderer dirty-rectangle opsional untuk UI pygame.
+
+Alih-alih screen.fill + display.flip tiap frame, DirtyRenderer:
+- begin(background): menghapus hanya area yang digambar frame sebelumnya
+  (blit potongan background ke rect lama);
+- mark(rect): mencatat bounding box yang digambar frame ini (pygame.draw.* dan
+  Surface.blit sudah mengembalikan Rect, jadi cukup dibungkus: mark(draw...));
+- present(): pygame.display.update(rect lama + rect baru).
+Biaya per frame sebanding dengan jumlah/ukuran entitas, bukan luas layar.
+
+Dengan enabled=False perilakunya sama dengan cara lama (blit background penuh +
+flip), sehingga front-end cukup memakai satu jalur kode. Background baru (mis.
+layer statis dibangun ulang setelah resize) otomatis memicu satu frame penuh.
+"""
+
+import pygame
+
+
+class DirtyRenderer:
+    def __init__(self, screen, enabled=True):
+        self.screen = screen
+        self.enabled = enabled
+        self._background = None
+        self._prev = []   # rect yang digambar frame sebelumnya
+        self._rects = []  # rect yang digambar frame ini
+        self._full = True
+
+    def begin(self, background):
+        """Mulai frame: pulihkan background di area yang kotor (atau seluruh layar)."""
+        if not self.enabled or background is not self._background:
+            self.screen.blit(background, (0, 0))
+            self._background = background
+            self._full = True
+        else:
+            for r in self._prev:
+                self.screen.blit(background, r, r)
+        self._rects = []
+
+    def mark(self, rect):
+        """Catat area yang baru digambar; mengembalikan rect apa adanya."""
+        self._rects.append(rect)
+        return rect
+
+    def present(self):
+        """Tampilkan frame: update rect lama + baru, atau flip penuh bila perlu."""
+        if self._full:
+            pygame.display.flip()
+            self._full = False
+        else:
+            pygame.display.update(self._prev + self._rects)
+        self._prev = self._rects
@@ -0,0 +1,17 @@
+"""
+paths.py
+Lokasi repo dan helper untuk mengimpor modul dari folder aiN.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use(subdir):
+    """Tambahkan folder simulator (mis. "ai2") ke sys.path supaya import datarnya jalan."""
+    path = os.path.join(ROOT, subdir)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return path
@@ -0,0 +1,124 @@
+"""
+perfhud.py
+Overlay HUD pygame untuk simcore.profiler.Profiler.
+
+Panel kecil semi-transparan: satu baris per fase berisi mean / p99 (ms),
+bar porsi terhadap budget frame, dan histogram mini bucket log
+(profiler.HIST_EDGES_MS) dari jendela bergulir. Panel dibangun ulang hanya
+tiap `refresh` detik (teks lewat TextCache), jadi HUD sendiri hampir tidak
+menambah waktu frame; di antara refresh hanya satu blit.
+
+Tombol yang dipakai front-end (lihat handle()):
+- F3: nyalakan / matikan profiler + HUD
+- F4: export jendela profiler ke file JSON
+"""
+
+import time
+
+import pygame
+
+from simcore.profiler import FRAME, HIST_EDGES_MS
+from simcore.textcache import TextCache
+
+TOGGLE_KEY = pygame.K_F3
+EXPORT_KEY = pygame.K_F4
+REFRESH = 0.25  # detik antar pembaruan panel
+ROW_H = 16
+NAME_W = 64
+NUM_W = 110
+BAR_W = 90
+HIST_W = 4 * (len(HIST_EDGES_MS) + 1)
+PAD = 6
+BG = (0, 0, 0, 170)
+TEXT = (230, 230, 230)
+BAR = (80, 170, 240)
+BAR_OVER = (230, 80, 60)
+HIST = (200, 200, 120)
+
+
+class PerfHUD:
+    def __init__(self, profiler, font, budget_ms, pos=(8, 8), text=None, refresh=REFRESH):
+        """
+        profiler: simcore.profiler.Profiler yang dipakai loop utama
+        font: pygame font untuk teks panel
+        budget_ms: waktu frame target (mis. 1000 / RENDER_FPS); bar penuh = budget
+        pos: pojok kiri atas panel
+        text: TextCache opsional untuk berbagi surface teks
+        """
+        self.profiler = profiler
+        self.font = font
+        self.budget_ms = budget_ms
+        self.pos = pos
+        self.text = text or TextCache()
+        self.refresh = refresh
+        self._surface = None
+        self._built = 0.0
+
+    @property
+    def visible(self):
+        return self.profiler.enabled
+
+    def handle(self, event, export_path=None, **meta):
+        """
+        Proses KEYDOWN F3 / F4; mengembalikan True bila event dipakai HUD.
+        export_path: callable tanpa argumen -> path file export (dipanggil saat F4).
+        """
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == TOGGLE_KEY:
+            self.profiler.toggle()
+            self._surface = None
+            return True
+        if event.key == EXPORT_KEY and export_path is not None and self.profiler.frames:
+            path = self.profiler.export(export_path(), **meta)
+            print(f"[PROFILE] {path}")
+            return True
+        return False
+
+    def draw(self, screen, renderer=None):
+        """Gambar panel (bila profiler aktif); renderer: DirtyRenderer opsional untuk mark area."""
+        if not self.profiler.enabled:
+            return None
+        now = time.perf_counter()
+        if self._surface is None or now - self._built >= self.refresh:
+            self._surface = self._build()
+            self._built = now
+        rect = screen.blit(self._surface, self.pos)
+        if renderer is not None:
+            renderer.mark(rect)
+        return rect
+
+    def _build(self):
+        summary = self.profiler.summary()
+        names = [name for name in summary if name != FRAME]
+        width = NAME_W + NUM_W + BAR_W + HIST_W + 4 * PAD
+        surf = pygame.Surface((width, ROW_H * (len(names) + 2) + 2 * PAD), pygame.SRCALPHA)
+        surf.fill(BG)
+        frame = summary.get(FRAME)
+        head = (f"frame {frame['mean']:.2f} ms  p99 {frame['p99']:.2f}  max {frame['max']:.1f}"
+                if frame else "profiler: menunggu frame...")
+        surf.blit(self.text.render(self.font, head, TEXT), (PAD, PAD))
+        surf.blit(self.text.render(self.font, "fase        mean / p99 ms", TEXT), (PAD, PAD + ROW_H))
+        for row, name in enumerate(names, 2):
+            s = summary[name]
+            y = PAD + row * ROW_H
+            x = PAD
+            surf.blit(self.text.render(self.font, name, TEXT), (x, y))
+            x += NAME_W + PAD
+            surf.blit(self.text.render(self.font, f"{s['mean']:6.2f} / {s['p99']:6.2f}", TEXT), (x, y))
+            x += NUM_W + PAD
+            frac = s["mean"] / self.budget_ms if self.budget_ms > 0 else 0.0
+            pygame.draw.rect(surf, BAR_OVER if frac > 1 else BAR, (x, y + 3, int(BAR_W * min(frac, 1.0)), ROW_H - 6))
+            x += BAR_W + PAD
+            self._draw_histogram(surf, self.profiler.histogram(name), x, y)
+        return surf
+
+    @staticmethod
+    def _draw_histogram(surf, counts, x, y):
+        top = max(counts)
+        if not top:
+            return
+        for i, c in enumerate(counts):
+            h = int((ROW_H - 4) * c / top)
+            if h:
+                pygame.draw.rect(surf, HIST, (x + 4 * i, y + ROW_H - 2 - h, 3, h))
@@ -0,0 +1,150 @@
+"""
+profiler.py
+Profiler per fase untuk loop utama simulator (UI maupun World headless).
+
+Waktu diukur bergaya stopwatch lap: begin() memulai frame, mark(fase)
+mencatat waktu sejak mark sebelumnya ke fase itu, end(fase) menutup lap
+terakhir dan frame. World memanggil mark di dalam tick (mis. "people",
+"brains", "cleanup"), UI di sekitarnya ("events", "draw", "flip"), jadi satu
+frame terbagi habis ke fase-fase tanpa blok with / indentasi baru. Fase yang
+muncul beberapa kali dalam satu frame (beberapa tick per frame) dijumlahkan.
+
+Dengan enabled=False setiap mark hanya satu cek atribut, jadi instrumentasi
+boleh tetap terpasang di hot path. Bisa dinyalakan / dimatikan saat jalan.
+
+Per fase disimpan jendela bergulir `window` frame terakhir (ms per frame,
+0 bila fase tidak terjadi di frame itu), sehingga rata-rata semua fase
+berjumlah sama dengan rata-rata waktu frame. Dari jendela itu dihitung
+summary() (mean / p50 / p99 / max / porsi frame) dan histogram() dengan
+bucket log tetap HIST_EDGES_MS. export() menulis semuanya ke file JSON.
+"""
+
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+
+from simcore.sweep import percentile
+
+WINDOW = 600  # frame (10 detik pada 60 FPS)
+FRAME = "frame"  # nama seri total waktu frame
+# batas atas bucket histogram (ms); bucket terakhir = di atas 66 ms
+HIST_EDGES_MS = (0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 66)
+
+
+class Profiler:
+    def __init__(self, enabled=True, window=WINDOW, clock=time.perf_counter):
+        self.window = window
+        self.clock = clock
+        self.frames = 0  # frame yang sudah ditutup end() (total, bukan hanya jendela)
+        self._series = {}  # fase -> deque ms per frame (urutan fase = urutan di dalam frame)
+        self._frame = {}  # fase -> detik, frame berjalan
+        self._last = None
+        self._start = None
+        self.enabled = enabled
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        self._enabled = bool(value)
+        self._frame = {}
+        self._start = self._last = self.clock() if value else None
+
+    def toggle(self):
+        self.enabled = not self._enabled
+        return self._enabled
+
+    def begin(self):
+        """Mulai frame baru; waktu sejak end() sebelumnya (mis. clock.tick) tidak dihitung."""
+        if not self._enabled:
+            return
+        self._frame = {}
+        self._start = self._last = self.clock()
+
+    def mark(self, phase):
+        """Catat waktu sejak mark / begin sebelumnya sebagai fase `phase`."""
+        if not self._enabled:
+            return
+        now = self.clock()
+        frame = self._frame
+        frame[phase] = frame.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def end(self, phase=None):
+        """Tutup frame (mark(phase) dulu bila diberikan) dan masukkan ke jendela bergulir."""
+        if not self._enabled:
+            return
+        if phase is not None:
+            self.mark(phase)
+        frame = self._frame
+        series = self._series
+        if any(name not in series for name in frame):
+            # fase baru disisipkan sesuai urutannya di frame ini (mis. fase World di antara events dan draw),
+            # diisi 0 untuk frame sebelumnya supaya semua seri sejajar dengan FRAME
+            order = list(frame) + [name for name in series if name not in frame]
+            pad = [0.0] * len(series.get(FRAME, ()))
+            self._series = series = {name: series[name] if name in series else deque(pad, maxlen=self.window)
+                                    for name in order}
+        series.setdefault(FRAME, deque(maxlen=self.window)).append((self._last - self._start) * 1e3)
+        for name, values in series.items():
+            if name != FRAME:
+                values.append(frame.get(name, 0.0) * 1e3)
+        self.frames += 1
+        self._frame = {}
+
+    def reset(self):
+        self._series = {}
+        self.frames = 0
+        self.enabled = self._enabled
+
+    def phases(self):
+        """Nama fase dalam jendela (tanpa FRAME), urut seperti di dalam frame."""
+        return [name for name in self._series if name != FRAME]
+
+    def samples(self, phase):
+        """ms per frame fase `phase` di jendela, lama -> baru."""
+        return list(self._series.get(phase, ()))
+
+    def histogram(self, phase, edges=HIST_EDGES_MS):
+        """Jumlah frame per bucket: len(edges) + 1 bucket, bucket i = (edges[i-1], edges[i]]."""
+        counts = [0] * (len(edges) + 1)
+        for v in self._series.get(phase, ()):
+            counts[bisect_left(edges, v)] += 1
+        return counts
+
+    def summary(self):
+        """
+        fase -> {"mean", "p50", "p99", "max" (ms), "share" (porsi rata-rata frame)};
+        FRAME ikut sebagai entri terakhir. Kosong bila belum ada frame.
+        """
+        total = self._series.get(FRAME)
+        if not total:
+            return {}
+        frame_mean = sum(total) / len(total)
+        out = {}
+        for name in self.phases() + [FRAME]:
+            values = sorted(self._series[name])
+            mean = sum(values) / len(values)
+            out[name] = {"mean": mean, "p50": percentile(values, 0.50), "p99": percentile(values, 0.99),
+                         "max": values[-1], "share": mean / frame_mean if frame_mean > 0 else 0.0}
+        return out
+
+    def export(self, path, **meta):
+        """Tulis summary, histogram, dan sampel jendela ke file JSON; meta = info tambahan (sim, seed, dst.)."""
+        data = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "frames": self.frames,
+            "window": self.window,
+            "meta": meta,
+            "hist_edges_ms": list(HIST_EDGES_MS),
+            "summary": self.summary(),
+            "histogram": {name: self.histogram(name) for name in self._series},
+            "samples_ms": {name: list(values) for name, values in self._series.items()},
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
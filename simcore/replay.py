@@ -0,0 +1,131 @@
+"""
+replay.py
+Rekam sesi simulator (ai2 / ai4) lalu putar ulang headless secepat mungkin.
+
+Simulasi sudah deterministik terhadap seed WorldRNG, jadi yang perlu direkam
+hanya:
+- nama simulator, seed, dan config (parameter simcore.scenarios.build_world);
+- input pengguna bertanda tick: nama method World + argumennya
+  (mis. ("spawn_person", ["red"]), ("raise_threat_near", [3, 7])).
+
+- Recorder: dipasang di UI; input dijalankan lewat Recorder.input(...) supaya
+  tercatat pada tick World saat itu (sebelum step berikutnya). save() menulis
+  file JSON ber-gzip (beberapa ratus byte untuk sesi berjam-jam).
+- Player: bangun World dari rekaman, jalankan step sambil menyisipkan input
+  pada tick-nya. Setiap `snapshot_every` tick disimpan World.snapshot()
+  (bytes simcore.snapshot), jadi seek(tick) mundur hanya perlu restore
+  snapshot terdekat lalu maju beberapa tick, bukan mengulang sesi dari awal.
+
+Putar ulang dari command line:
+    python -m simcore.replay replay_grid_sim_20260101_120000.rpl
+    python -m simcore.replay rekaman.rpl --seek 48000 --save-snapshot t48000.snap
+"""
+
+import argparse
+import gzip
+import json
+import time
+
+from simcore import snapshot
+from simcore.scenarios import build_world
+
+VERSION = 1
+SNAPSHOT_EVERY = 1000  # tick antar snapshot saat playback
+
+
+class Recorder:
+    def __init__(self, sim, world, config=None):
+        """
+        sim: nama simulator di simcore.scenarios ("ai2", "ai4")
+        world: World yang sedang berjalan (seed diambil dari world.rng.seed)
+        config: parameter build_world yang menghasilkan World yang sama (tanpa "seed")
+        """
+        self.sim = sim
+        self.world = world
+        self.config = dict(config or {})
+        self.seed = world.rng.seed
+        self.inputs = []  # [tick, method, args]
+
+    def input(self, method, *args):
+        """Jalankan world.<method>(*args) dan catat pada tick sekarang; mengembalikan hasil method."""
+        self.inputs.append([self.world.tick, method, list(args)])
+        return getattr(self.world, method)(*args)
+
+    def to_dict(self):
+        return {"version": VERSION, "sim": self.sim, "seed": self.seed, "config": self.config,
+                "ticks": self.world.tick, "inputs": self.inputs}
+
+    def save(self, path):
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        return path
+
+
+def load(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != VERSION:
+        raise ValueError(f"versi rekaman tidak dikenal: {data.get('version')}")
+    return data
+
+
+class Player:
+    def __init__(self, replay, snapshot_every=SNAPSHOT_EVERY):
+        """replay: path file rekaman atau dict hasil load()/Recorder.to_dict()."""
+        self.replay = load(replay) if isinstance(replay, str) else replay
+        self.snapshot_every = snapshot_every
+        self._inputs = {}  # tick -> [(method, args)] (urutan rekaman)
+        for tick, method, args in self.replay["inputs"]:
+            self._inputs.setdefault(tick, []).append((method, args))
+        self.world = build_world(self.replay["sim"], {**self.replay["config"], "seed": self.replay["seed"]})
+        self._snapshots = {self.world.tick: self.world.snapshot()}
+
+    @property
+    def end(self):
+        """Tick terakhir sesi yang direkam."""
+        return self.replay["ticks"]
+
+    def step(self, n=1):
+        world = self.world
+        for _ in range(n):
+            for method, args in self._inputs.get(world.tick, ()):
+                getattr(world, method)(*args)
+            world.step(1)
+            if world.tick % self.snapshot_every == 0 and world.tick not in self._snapshots:
+                self._snapshots[world.tick] = world.snapshot()
+        return world
+
+    def run(self, until=None):
+        """Maju sampai tick `until` (default akhir rekaman) secepat mungkin."""
+        until = self.end if until is None else until
+        return self.step(max(0, until - self.world.tick))
+
+    def seek(self, tick):
+        """World pada tick tertentu; mundur lewat snapshot terdekat sebelum tick itu."""
+        if tick < self.world.tick:
+            base = max(t for t in self._snapshots if t <= tick)
+            self.world = type(self.world).restore(self._snapshots[base])
+        return self.run(tick)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Putar ulang rekaman sesi simulator tanpa display.")
+    parser.add_argument("path")
+    parser.add_argument("--seek", type=int, help="berhenti di tick ini (default: akhir rekaman)")
+    parser.add_argument("--snapshot-every", type=int, default=SNAPSHOT_EVERY)
+    parser.add_argument("--save-snapshot", help="simpan World pada tick akhir sebagai file snapshot")
+    args = parser.parse_args()
+
+    player = Player(args.path, args.snapshot_every)
+    rep = player.replay
+    print(f"{rep['sim']} seed={rep['seed']} config={rep['config']} ticks={rep['ticks']} inputs={len(rep['inputs'])}")
+    t0 = time.perf_counter()
+    world = player.seek(player.end if args.seek is None else args.seek)
+    elapsed = time.perf_counter() - t0
+    print(f"tick {world.tick} in {elapsed:.3f}s ({world.tick / elapsed if elapsed > 0 else 0:.0f} ticks/s) "
+          f"stats={world.stats}")
+    if args.save_snapshot:
+        snapshot.save(args.save_snapshot, world.snapshot())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+rng.py
+RNG deterministik per world dengan substream per entitas.
+
+- WorldRNG(seed): akar RNG satu world. seed=None memilih seed acak yang tetap
+  disimpan di .seed supaya run bisa diulang.
+- WorldRNG.stream(name): substream untuk satu entitas (mis. "person:P3").
+  Substream diturunkan dari (seed, crc32(name)), jadi urutan angka acak satu
+  entitas tidak berubah walau entitas lain ditambah/dihapus.
+- Stream punya method yang sama dengan modul `random` (random, choice,
+  randint, randrange, uniform), sehingga kelas entitas bisa memakai
+  `rng or random`. Angka diambil per blok dari NumPy Generator (PCG64), blok
+  membesar bertahap sampai MAX_BLOCK; tanpa NumPy dipakai random.Random.
+  Generator baru dibuat saat angka pertama diminta, jadi membuat (atau
+  memulihkan) ribuan stream tetap murah.
+- State: urutan blok tetap, jadi posisi stream cukup satu angka, yaitu berapa
+  angka yang sudah dipakai (Stream.state()). set_state(n) melompat ke posisi
+  itu lewat PCG64.advance tanpa membangkitkan ulang angka sebelumnya.
+  WorldRNG.state() / set_state() melakukan hal yang sama untuk semua
+  substream (dipakai simcore.snapshot). Pengambilan langsung dari
+  WorldRNG.numpy(name) tidak ikut terhitung.
+"""
+
+import os
+import random
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: fallback ke random.Random per stream
+    np = None
+
+FIRST_BLOCK = 16
+MAX_BLOCK = 1024
+
+
+def _stream_key(name):
+    return zlib.crc32(name.encode("utf-8"))
+
+
+class Stream:
+    __slots__ = ("_seed", "_key", "_gen", "_rnd", "_buf", "_i", "_block", "_drawn", "_skip")
+
+    def __init__(self, seed, key):
+        self._seed = seed
+        self._key = key
+        self._gen = None
+        self._rnd = None
+        self._buf = []
+        self._i = 0
+        self._block = FIRST_BLOCK
+        self._drawn = 0  # angka yang sudah diambil dari generator (termasuk isi _buf)
+        self._skip = 0   # posisi awal di blok berikutnya (setelah set_state)
+
+    @property
+    def generator(self):
+        """numpy.random.Generator stream ini (None tanpa NumPy); dibuat saat pertama dipakai."""
+        if np is None:
+            return None
+        if self._gen is None:
+            self._gen = np.random.Generator(np.random.PCG64(np.random.SeedSequence(self._seed, spawn_key=(self._key,))))
+            if self._drawn:
+                self._gen.bit_generator.advance(self._drawn)  # satu double = satu langkah PCG64
+        return self._gen
+
+    def _draw(self, n):
+        # method, bukan lambda, supaya Stream bisa di-deepcopy / pickle bersama world
+        gen = self.generator
+        if gen is not None:
+            out = gen.random(n).tolist()
+        else:
+            if self._rnd is None:
+                self._rnd = random.Random((self._seed << 32) ^ self._key)
+                for _ in range(self._drawn):
+                    self._rnd.random()
+            out = [self._rnd.random() for _ in range(n)]
+        self._drawn += n
+        return out
+
+    def random(self):
+        """float di [0, 1)."""
+        i = self._i
+        if i >= len(self._buf):
+            self._buf = self._draw(self._block)
+            self._block = min(MAX_BLOCK, self._block * 2)
+            i, self._skip = self._skip, 0
+        self._i = i + 1
+        return self._buf[i]
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def randrange(self, start, stop=None):
+        if stop is None:
+            start, stop = 0, start
+        return start + int(self.random() * (stop - start))
+
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def state(self):
+        """Jumlah angka yang sudah dipakai stream ini."""
+        return self._drawn - len(self._buf) + self._i + self._skip
+
+    def set_state(self, used):
+        """Lompat ke posisi setelah `used` angka; blok yang sedang berjalan diambil ulang saat dibutuhkan."""
+        start, block = 0, FIRST_BLOCK
+        while block < MAX_BLOCK and start + block <= used:
+            start += block
+            block *= 2
+        if block == MAX_BLOCK:
+            start += (used - start) // MAX_BLOCK * MAX_BLOCK
+        self._gen = None
+        self._rnd = None
+        self._buf = []
+        self._i = 0
+        self._block = block
+        self._drawn = start
+        self._skip = used - start
+
+
+class WorldRNG:
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        self.seed = seed
+        self._streams = {}
+
+    def stream(self, name):
+        """Substream bernama; pemanggilan ulang dengan nama sama mengembalikan objek yang sama."""
+        s = self._streams.get(name)
+        if s is None:
+            s = self._streams[name] = Stream(self.seed, _stream_key(name))
+        return s
+
+    def state(self):
+        """(nama substream, jumlah angka terpakai) untuk semua substream yang pernah dibuat."""
+        names = list(self._streams)
+        return names, [s.state() for s in self._streams.values()]
+
+    def set_state(self, names, used):
+        streams, seed = self._streams, self.seed
+        for name, n in zip(names, used):
+            s = streams.get(name)
+            if s is None:
+                s = streams[name] = Stream(seed, _stream_key(name))
+            if n or s.state():
+                s.set_state(n)
+
+    def numpy(self, name):
+        """numpy.random.Generator untuk pengambilan batch (butuh NumPy)."""
+        return self.stream(name).generator
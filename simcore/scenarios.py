@@ -0,0 +1,116 @@
+"""
+scenarios.py
+Adaptor headless per simulator: bangun World dari dict parameter, jalankan
+sejumlah tick, lalu kembalikan metrik yang seragam:
+
+- captures            : jumlah penangkapan oleh drone
+- capture_latencies   : list tick dari target "aktif" sampai tertangkap
+                        (ai1: sejak spawn; ai2: sejak masuk protected_zone dengan
+                        threat > threshold; ai4: sejak status menjadi merah)
+- false_pursuits      : kejaran yang berakhir tanpa penangkapan
+                        (ai1: ganti target; ai2: lock dilepas; ai4: FOLLOW keluar zona)
+- warnings_per_tick   : ai2 WARN / tick, ai4 FOLLOW baru / tick, ai1 selalu 0
+- ticks_per_sec       : kecepatan simulasi (wall clock)
+
+Parameter "assign" (1/0) menyalakan/mematikan assignment global drone->target
+(simcore.assign), dan "intercept" (1/0) pursuit prediktif (simcore.pursuit),
+untuk membandingkan dengan perilaku lama. Untuk ai2, "obstacles" (1/0) memasang
+tembok + rumah (world.OBSTACLES) beserta pathfinding drone, atau grid kosong.
+"swept" (1/0) memilih deteksi penangkapan kontinu (simcore.capture) atau cek
+jarak titik lama.
+
+Setiap World memakai simcore.rng.WorldRNG dari "seed", jadi satu skenario
+selalu menghasilkan angka yang sama di proses mana pun.
+"""
+
+import time
+
+from simcore import paths
+
+# parameter yang diterima tiap simulator (selain "seed")
+SIM_PARAMS = {
+    "ai1": {"people", "drones", "threshold", "assign", "intercept", "swept"},
+    "ai1-array": {"people", "drones", "threshold", "assign", "intercept", "swept"},
+    "ai2": {"people", "drones", "threshold", "scan_cells", "zone_size", "assign", "intercept", "obstacles", "swept"},
+    "ai4": {"people", "drones", "zone_size", "assign", "intercept", "swept"},
+}
+
+
+def build_world(sim, params):
+    """World headless untuk sim dengan parameter params."""
+    if sim not in SIM_PARAMS:
+        raise ValueError(f"simulator tidak dikenal: {sim} (pilihan: {', '.join(SIM_PARAMS)})")
+    unknown = set(params) - SIM_PARAMS[sim] - {"seed"}
+    if unknown:
+        raise ValueError(f"parameter tidak dikenal untuk {sim}: {sorted(unknown)}")
+    seed = params.get("seed")
+    assign = bool(params.get("assign", 1))
+    intercept = bool(params.get("intercept", 1))
+    swept = bool(params.get("swept", 1))
+
+    if sim in ("ai1", "ai1-array"):
+        paths.use("ai1")
+        import a_world
+        kwargs = {"num_people": params.get("people", a_world.NUM_PEOPLE),
+                  "num_drones": params.get("drones", a_world.NUM_DRONES),
+                  "threshold": params.get("threshold", a_world.THREAT_THRESHOLD),
+                  "assign": assign, "intercept": intercept, "swept": swept}
+        if sim == "ai1":
+            return a_world.World(verbose=False, seed=seed, **kwargs)
+        import a_array
+        return a_array.ArrayWorld(seed=seed, **kwargs)
+
+    if sim == "ai2":
+        paths.use("ai2")
+        import world
+        zone = world.PROTECTED_ZONE
+        if "zone_size" in params:
+            # persegi zone_size x zone_size cell di tengah zona default
+            n = params["zone_size"]
+            cx, cy = (zone[0] + zone[2] + 1) / 2, (zone[1] + zone[3] + 1) / 2
+            x1, y1 = max(0, int(cx - n / 2)), max(2, int(cy - n / 2))
+            zone = (x1, y1, min(world.GRID_W - 1, x1 + n - 1), min(world.GRID_H - 1, y1 + n - 1))
+        return world.World(num_people=params.get("people", world.NUM_PEOPLE),
+                           num_drones=params.get("drones", world.NUM_DRONES),
+                           protected_zone=zone,
+                           threshold=params.get("threshold", world.THREAT_THRESHOLD),
+                           scan_cells=params.get("scan_cells", world.SCAN_CELLS),
+                           seed=seed, assign=assign, intercept=intercept,
+                           obstacles=world.OBSTACLES if params.get("obstacles", 1) else [], swept=swept)
+
+    if sim == "ai4":
+        paths.use("ai4")
+        import c1_world
+        zone = c1_world.SAFE_ZONE
+        if "zone_size" in params:
+            n = params["zone_size"]
+            cx, cy = zone[0] + zone[2] / 2, zone[1] + zone[3] / 2
+            zone = (int(cx - n / 2), int(cy - n / 2), n, n)
+        kwargs = {}
+        if "people" in params:
+            # rasio awal c1.py: 1 merah : 3 kuning : 2 hijau
+            n = params["people"]
+            kwargs["num_red"] = max(1, n // 6)
+            kwargs["num_yellow"] = n // 2
+            kwargs["num_green"] = max(0, n - kwargs["num_red"] - kwargs["num_yellow"])
+        return c1_world.World(safe_zone=zone, num_drones=params.get("drones", 2), verbose=False, seed=seed,
+                              assign=assign, intercept=intercept, swept=swept, **kwargs)
+
+
+def run_scenario(sim, params, ticks):
+    """Jalankan satu skenario; aman dipanggil di proses worker."""
+    world = build_world(sim, params)
+    t0 = time.perf_counter()
+    world.step(ticks)
+    elapsed = time.perf_counter() - t0
+    return {
+        "sim": sim,
+        "params": dict(params),
+        "ticks": ticks,
+        "elapsed": elapsed,
+        "ticks_per_sec": ticks / elapsed if elapsed > 0 else float("inf"),
+        "captures": world.stats["captures"],
+        "capture_latencies": list(world.capture_latencies),
+        "false_pursuits": world.stats["false_pursuits"],
+        "warnings_per_tick": world.stats["warnings"] / ticks if ticks else 0.0,
+    }
@@ -0,0 +1,60 @@
+"""
+scheduler.py
+Penjadwal fixed-timestep: simulasi maju dengan laju tick tetap, terlepas dari
+laju render.
+
+Pola pemakaian di loop UI:
+    sched = FixedStep(TICK_RATE)
+    while running:
+        clock.tick(RENDER_FPS)            # batasi laju render saja
+        world.step(sched.advance())       # 0..n tick sesuai waktu nyata yang lewat
+        alpha = sched.alpha               # posisi di antara tick terakhir dan berikutnya
+        x = lerp(prev_x, x, alpha)        # interpolasi posisi untuk digambar
+
+Frame yang berat tidak memperlambat simulasi (tick yang tertinggal dikejar),
+dan simulasi yang cepat tidak memaksa redraw tambahan. Ketertinggalan dibatasi
+max_lag detik supaya jeda panjang (mis. jendela di-drag) tidak memicu
+ledakan tick.
+"""
+
+import time
+
+
+def lerp(a, b, t):
+    return a + (b - a) * t
+
+
+class FixedStep:
+    def __init__(self, tick_rate, max_lag=0.25, clock=time.perf_counter):
+        """
+        tick_rate: tick simulasi per detik
+        max_lag: ketertinggalan maksimum (detik) yang masih dikejar
+        clock: sumber waktu (detik)
+        """
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max(1, int(max_lag * tick_rate))
+        self.clock = clock
+        self._last = None
+        self._acc = 0.0
+
+    def advance(self):
+        """Jumlah tick yang harus dijalankan sekarang."""
+        now = self.clock()
+        if self._last is None:
+            self._last = now
+            return 1  # frame pertama: satu tick supaya ada state untuk digambar
+        self._acc += now - self._last
+        self._last = now
+        steps = int(self._acc / self.dt)
+        if steps > self.max_steps:
+            # terlalu jauh tertinggal: buang sisa waktu daripada menumpuk tick
+            steps = self.max_steps
+            self._acc = 0.0
+        else:
+            self._acc -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraksi [0, 1) antara tick terakhir dan tick berikutnya, untuk interpolasi."""
+        return min(1.0, self._acc / self.dt)
@@ -0,0 +1,147 @@
+"""
+snapshot.py
+Encoding biner ringkas untuk snapshot state World (checkpoint, fork what-if,
+warm start benchmark, seek di simcore.replay).
+
+Snapshot = meta (dict JSON kecil: tick, stats, config world) + tabel kolom.
+Satu kolom = satu atribut untuk semua entitas sejenis (mis. "people.x"),
+disimpan sebagai array bertipe tetap, jadi menyimpan / memuat 100k entitas
+hanya menyalin beberapa blok byte, bukan mengurai objek satu per satu.
+Referensi antar entitas (target drone, lock, dsb.) disimpan sebagai index
+baris tabel, -1 = tidak ada.
+
+Format (little-endian):
+- header     : MAGIC (4 byte) + versi (uint16) + jumlah kolom (uint16) + panjang meta (uint32)
+- meta       : JSON utf-8, padding sampai kelipatan 8 byte
+- per kolom  : nama (maks. NAME_BYTES = 24 byte utf-8, dipadding nol) + typecode (1 byte) + padding 3 byte
+               + jumlah elemen (uint32) + panjang data (uint64), lalu data
+               dengan padding sampai kelipatan 8 byte
+
+Typecode kolom: "q" int64, "d" float64, "B" uint8 (modul array standar,
+tanpa NumPy), dan "s" list string (utf-8, dipisah byte nol).
+
+Encoding / decoding kolom sendiri hanya belasan milidetik untuk 100k
+entitas (kolom string paling mahal); sisa waktu restore adalah membuat objek Python per entitas. Method
+snapshot / restore World dibungkus gc_paused; tanpa itu garbage collector
+siklik berulang kali menyapu ratusan ribu objek yang baru dibuat.
+"""
+
+import functools
+import gc
+import json
+import struct
+import sys
+from array import array
+
+MAGIC = b"WSNP"
+VERSION = 1
+NAME_BYTES = 24  # panjang maksimum nama kolom (utf-8)
+_HEADER = struct.Struct("<4sHHI")
+_COLUMN = struct.Struct(f"<{NAME_BYTES}sc3xIQ")
+_TYPECODES = ("q", "d", "B")
+
+
+def gc_paused(fn):
+    """Decorator: matikan gc siklik selama fn berjalan (objek yang dibuat tidak membentuk siklus sampah)."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            if enabled:
+                gc.enable()
+    return wrapper
+
+
+def ints(values):
+    return array("q", values)
+
+
+def floats(values):
+    return array("d", values)
+
+
+def flags(values):
+    return array("B", [1 if v else 0 for v in values])
+
+
+def _pad(n):
+    return b"\0" * (-n % 8)
+
+
+def pack(meta, columns):
+    """
+    meta: dict yang bisa di-JSON-kan
+    columns: nama -> array.array ("q" / "d" / "B") atau list string
+    Mengembalikan bytes snapshot. ValueError bila nama kolom lebih dari NAME_BYTES byte
+    (struct akan memotongnya diam-diam, lalu restore gagal atau dua nama bertabrakan).
+    """
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    parts = [_HEADER.pack(MAGIC, VERSION, len(columns), len(meta_bytes)), meta_bytes, _pad(len(meta_bytes))]
+    for name, col in columns.items():
+        raw_name = name.encode("utf-8")
+        if len(raw_name) > NAME_BYTES:
+            raise ValueError(f"nama kolom {name!r} lebih dari {NAME_BYTES} byte utf-8")
+        if isinstance(col, array):
+            if col.typecode not in _TYPECODES:
+                raise ValueError(f"kolom {name}: typecode {col.typecode!r} tidak didukung")
+            if sys.byteorder == "big" and col.itemsize > 1:
+                col = array(col.typecode, col)
+                col.byteswap()
+            typecode, data = col.typecode, col.tobytes()
+        else:
+            typecode, data = "s", "\0".join(col).encode("utf-8")
+        parts += [_COLUMN.pack(raw_name, typecode.encode("ascii"), len(col), len(data)),
+                  data, _pad(len(data))]
+    return b"".join(parts)
+
+
+def unpack(data):
+    """Kebalikan pack(): (meta, kolom nama -> array.array / list string)."""
+    view = memoryview(data)
+    magic, version, ncols, meta_len = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("bukan snapshot World atau versinya tidak dikenal")
+    pos = _HEADER.size
+    meta = json.loads(bytes(view[pos:pos + meta_len]).decode("utf-8"))
+    pos += meta_len + (-meta_len % 8)
+    columns = {}
+    for _ in range(ncols):
+        raw_name, typecode, count, nbytes = _COLUMN.unpack_from(view, pos)
+        pos += _COLUMN.size
+        chunk = view[pos:pos + nbytes]
+        pos += nbytes + (-nbytes % 8)
+        typecode = typecode.decode("ascii")
+        name = raw_name.rstrip(b"\0").decode("utf-8")
+        if typecode == "s":
+            columns[name] = bytes(chunk).decode("utf-8").split("\0") if count else []
+        else:
+            col = array(typecode)
+            col.frombytes(chunk)
+            if sys.byteorder == "big" and col.itemsize > 1:
+                col.byteswap()
+            columns[name] = col
+    return meta, columns
+
+
+def rng_columns(rng, prefix="rng"):
+    """Kolom posisi semua substream simcore.rng.WorldRNG."""
+    names, used = rng.state()
+    return {f"{prefix}.name": names, f"{prefix}.used": ints(used)}
+
+
+def restore_rng(rng, columns, prefix="rng"):
+    rng.set_state(columns[f"{prefix}.name"], columns[f"{prefix}.used"])
+
+
+def save(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return f.read()
@@ -0,0 +1,125 @@
+"""
+sweep.py
+Runner Monte Carlo paralel: jalankan grid parameter x seed secara headless di
+process pool, lalu gabungkan metrik per kombinasi parameter.
+
+Contoh:
+    python -m simcore.sweep ai2 -p people=12,50,200 -p drones=1,3,5 -p seed=0..19 --ticks 3000
+    python -m simcore.sweep ai4 -p drones=1,2,4 -p zone_size=200,300 -p seed=0..9 --out hasil.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from simcore.scenarios import SIM_PARAMS, run_scenario
+
+
+def parse_values(text):
+    """"1,2,5" -> [1, 2, 5]; "0..9" -> [0..9]; angka diubah ke int/float bila bisa."""
+    values = []
+    for part in text.split(","):
+        if ".." in part:
+            lo, hi = part.split("..")
+            values.extend(range(int(lo), int(hi) + 1))
+            continue
+        for cast in (int, float):
+            try:
+                values.append(cast(part))
+                break
+            except ValueError:
+                pass
+        else:
+            values.append(part)
+    return values
+
+
+def expand_grid(grid):
+    """{key: [values]} -> list dict parameter (produk kartesius)."""
+    keys = list(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def aggregate(runs):
+    """Gabungkan hasil run_scenario per kombinasi parameter (semua seed digabung)."""
+    groups = {}
+    for r in runs:
+        key = tuple(sorted((k, v) for k, v in r["params"].items() if k != "seed"))
+        groups.setdefault(key, []).append(r)
+    rows = []
+    for key, rs in groups.items():
+        lat = sorted(itertools.chain.from_iterable(r["capture_latencies"] for r in rs))
+        rows.append({
+            "params": dict(key),
+            "runs": len(rs),
+            "captures_mean": statistics.fmean(r["captures"] for r in rs),
+            "capture_latency_mean": statistics.fmean(lat) if lat else None,
+            "capture_latency_p50": percentile(lat, 0.50),
+            "capture_latency_p95": percentile(lat, 0.95),
+            "false_pursuits_mean": statistics.fmean(r["false_pursuits"] for r in rs),
+            "warnings_per_tick": statistics.fmean(r["warnings_per_tick"] for r in rs),
+            "ticks_per_sec": statistics.fmean(r["ticks_per_sec"] for r in rs),
+        })
+    return rows
+
+
+def run_sweep(sim, grid, ticks, workers=None):
+    """Jalankan semua kombinasi grid di process pool. Mengembalikan (runs, rows teragregasi)."""
+    combos = expand_grid(grid)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_scenario, sim, params, ticks) for params in combos]
+        runs = [f.result() for f in futures]
+    return runs, aggregate(runs)
+
+
+def _fmt(v):
+    if v is None:
+        return "-"
+    return f"{v:.2f}" if isinstance(v, float) else str(v)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep parameter simulasi secara paralel.")
+    parser.add_argument("sim", choices=sorted(SIM_PARAMS))
+    parser.add_argument("-p", "--param", action="append", default=[], metavar="KEY=V1,V2|A..B",
+                        help="nilai parameter (boleh diulang); kunci: seed, " +
+                             ", ".join(sorted(set().union(*SIM_PARAMS.values()))))
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", help="simpan hasil (runs + agregat) ke file JSON")
+    args = parser.parse_args()
+
+    grid = {}
+    for item in args.param:
+        key, _, text = item.partition("=")
+        grid[key] = parse_values(text)
+    grid.setdefault("seed", [0])
+
+    runs, rows = run_sweep(args.sim, grid, args.ticks, args.workers)
+
+    cols = ["runs", "captures_mean", "capture_latency_p50", "capture_latency_p95",
+            "false_pursuits_mean", "warnings_per_tick", "ticks_per_sec"]
+    print("params".ljust(40) + "".join(c.rjust(22) for c in cols))
+    for row in rows:
+        label = " ".join(f"{k}={v}" for k, v in row["params"].items()) or "(default)"
+        print(label.ljust(40) + "".join(_fmt(row[c]).rjust(22) for c in cols))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"sim": args.sim, "ticks": args.ticks, "grid": grid, "results": rows, "runs": runs},
+                      f, indent=2)
+        print(f"[INFO] hasil tersimpan di {args.out}")
+
+
+if __name__ == "__main__":
+    main()
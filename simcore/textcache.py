@@ -0,0 +1,76 @@
+"""
+textcache.py
+Cache hasil font.render untuk UI pygame.
+
+- TextCache: LRU (text, color, font, antialias) -> Surface. String yang sama
+  (label id person/drone, teks tombol, status bar yang jarang berubah) hanya
+  di-rasterisasi sekali.
+- TextPanel: panel multi-baris (mis. daftar shared targets) yang disimpan di
+  satu surface; tiap frame hanya baris yang teksnya berubah yang digambar ulang.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, color, font, antialias)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._cache[key] = surf
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._cache.clear()
+
+
+class TextPanel:
+    def __init__(self, font, size, color, line_height, cache=None):
+        """
+        size: (w, h) area panel; baris di luar tinggi panel tidak digambar
+        line_height: jarak antar baris (px)
+        cache: TextCache opsional untuk berbagi surface teks
+        """
+        self.font = font
+        self.color = color
+        self.line_height = line_height
+        self.cache = cache or TextCache()
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self._lines = []
+
+    def update(self, lines):
+        """Set isi panel; hanya baris yang berubah yang dihapus & digambar ulang."""
+        w, h = self.surface.get_size()
+        max_lines = h // self.line_height
+        lines = list(lines)[:max_lines]
+        old = self._lines
+        for i in range(max(len(lines), len(old))):
+            new_line = lines[i] if i < len(lines) else None
+            old_line = old[i] if i < len(old) else None
+            if new_line == old_line:
+                continue
+            row = pygame.Rect(0, i * self.line_height, w, self.line_height)
+            self.surface.fill((0, 0, 0, 0), row)
+            if new_line is not None:
+                self.surface.blit(self.cache.render(self.font, new_line, self.color), row.topleft)
+        self._lines = lines
+        return self.surface
+
+    def used_rect(self):
+        """Area panel yang berisi teks (untuk blit/update parsial)."""
+        return pygame.Rect(0, 0, self.surface.get_width(), len(self._lines) * self.line_height)
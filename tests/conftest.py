@@ -0,0 +1,12 @@
+"""
+Test headless (tanpa pygame display).
+
+Jalankan dari root repo:  python -m pytest -q
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)  # repo root, juga bila pytest dijalankan dari folder lain
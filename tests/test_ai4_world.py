@@ -0,0 +1,50 @@
+"""World ai4 (c1_world): metrik penangkapan dan pemilihan target tanpa assignment global."""
+
+import pytest
+
+from simcore import paths
+
+paths.use("ai4")
+from c1_world import World  # noqa: E402
+
+
+def _world(**kwargs):
+    return World(num_red=3, num_yellow=0, num_green=0, num_drones=3, verbose=False, **kwargs)
+
+
+def test_second_capture_of_same_person_is_not_counted():
+    world = _world(seed=0, assign=False, swept=False)
+    first, second = world.drones[0], world.drones[1]
+    target = next(iter(world.by_status["red"]))
+    first.target = second.target = target
+    first.capture(world)
+    second.capture(world)
+    assert world.stats["captures"] == 1
+    assert len(world.polices) == 1
+    assert first.state == "WAIT_POLICE"
+    assert second.state == "RETURN" and second.target is None
+
+
+@pytest.mark.parametrize("swept", [True, False])
+def test_captures_match_people_caught(swept):
+    for seed in range(4):
+        world = _world(seed=seed, assign=False, swept=swept)
+        world.step(3000)
+        assert world.stats["captures"] == 3
+        assert not world.by_status["red"]
+
+
+def test_greedy_attack_target_is_lowest_red_id():
+    """Tanpa assignment drone menyerang merah dengan id terkecil (heap, bukan scan semua merah)."""
+    world = World(num_red=5, num_yellow=20, num_green=5, num_drones=3, seed=2, assign=False, verbose=False)
+    drone = world.drones[0]
+    for tick in range(2000):
+        if tick % 150 == 0:
+            world.spawn_person("red")
+        reds = world.by_status["red"]
+        expected = min(reds, key=lambda p: p.id, default=None)
+        assert world.attack_target(drone, reds) is expected
+        world.step()
+        if tick == 1000:
+            world = type(world).restore(world.snapshot())
+            drone = world.drones[0]
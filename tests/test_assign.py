@@ -0,0 +1,110 @@
+"""simcore.assign: Hungarian dan solve() dibandingkan dengan brute force."""
+
+import itertools
+import math
+import random
+
+import pytest
+
+from simcore import assign
+
+
+def _brute(cost):
+    """(jumlah pasangan layak terbanyak, biaya minimum di antaranya) lewat semua permutasi."""
+    n, m = len(cost), len(cost[0])
+    best = None
+    for perm in itertools.permutations(range(max(n, m)), n):
+        pairs = [(i, j) for i, j in enumerate(perm) if j < m and math.isfinite(cost[i][j])]
+        key = (-len(pairs), sum(cost[i][j] for i, j in pairs))
+        if best is None or key < best:
+            best = key
+    return best
+
+
+def _score(cost, result):
+    pairs = [(i, j) for i, j in enumerate(result) if j >= 0]
+    assert len({j for _i, j in pairs}) == len(pairs)  # tiap kolom paling banyak sekali
+    return -len(pairs), sum(cost[i][j] for i, j in pairs)
+
+
+def _check(expected, got):
+    assert got[0] == expected[0]
+    assert got[1] == pytest.approx(expected[1], abs=1e-9)
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure"])
+def numpy(request, monkeypatch):
+    if request.param and assign.np is None:
+        pytest.skip("NumPy tidak terpasang")
+    if not request.param:
+        monkeypatch.setattr(assign, "np", None)
+    return request.param
+
+
+def test_hungarian_matches_brute_force():
+    rng = random.Random(1)
+    for _ in range(500):
+        n, m = rng.randint(1, 5), rng.randint(1, 5)
+        cost = [[rng.uniform(0, 100) for _ in range(m)] for _ in range(n)]
+        _check(_brute(cost), _score(cost, assign.hungarian(cost)))
+
+
+def test_solve_matches_brute_force(numpy):
+    rng = random.Random(2)
+    for _ in range(300):
+        n, m = rng.randint(1, 4), rng.randint(1, 7)  # m > n: kolom kandidat ikut dipangkas
+        agents = [(rng.uniform(0, 50), rng.uniform(0, 50)) for _ in range(n)]
+        targets = [(rng.uniform(0, 50), rng.uniform(0, 50)) for _ in range(m)]
+        threats = [rng.choice([0.0, 0.4, 1.0]) for _ in range(m)]
+        cost = [list(row) for row in assign._cost_matrix(agents, targets, threats, None)]
+        _check(_brute(cost), _score(cost, assign.solve(agents, targets, threats)))
+
+
+def test_solve_with_blocked_pairs_matches_brute_force(numpy):
+    """Pasangan di luar reach (ai2: Assigner(reach=scan_cells)) tidak boleh merusak optimalitas."""
+    rng = random.Random(3)
+    for _ in range(1500):
+        n, m = rng.randint(1, 4), rng.randint(1, 6)
+        agents = [(rng.randint(0, 20), rng.randint(0, 20)) for _ in range(n)]
+        targets = [(rng.randint(0, 20), rng.randint(0, 20)) for _ in range(m)]
+        threats = [rng.choice([0.4, 0.7, 1.0]) for _ in range(m)]
+        cost = [list(row) for row in assign._cost_matrix(agents, targets, threats, 6)]
+        result = assign.solve(agents, targets, threats, reach=6)
+        assert all(j < 0 or math.isfinite(cost[i][j]) for i, j in enumerate(result))
+        _check(_brute(cost), _score(cost, result))
+
+
+def test_solve_all_blocked(numpy):
+    assert assign.solve([(0, 0), (1, 1)], [(50, 50)], [1.0], reach=5) == [-1, -1]
+
+
+def test_assigner_reuses_result_within_tolerance(numpy):
+    a = assign.Assigner(tolerance=2.0)
+    first = a.assign(["d0", "d1"], [(0, 0), (10, 0)], ["p0", "p1"], [(1, 0), (9, 0)], [1.0, 1.0])
+    assert first == ["p0", "p1"]
+    a.assign(["d0", "d1"], [(1, 0), (10, 1)], ["p0", "p1"], [(1, 0), (9, 0)], [1.0, 1.0])
+    assert a.solves == 1
+    a.assign(["d0", "d1"], [(5, 0), (10, 0)], ["p0", "p1"], [(1, 0), (9, 0)], [1.0, 1.0])
+    assert a.solves == 2
+
+
+@pytest.mark.parametrize("n", [assign.CANDIDATES + 4, assign.HUNGARIAN_MAX + 10])
+def test_large_solve_assigns_every_agent(numpy, n):
+    """Di atas CANDIDATES / HUNGARIAN_MAX: hasil tetap valid, dan drone yang berkumpul tetap kebagian target."""
+    rng = random.Random(n)
+    agents = [(100.0, 100.0)] * (n // 2) + [(rng.uniform(0, 900), rng.uniform(0, 600)) for _ in range(n - n // 2)]
+    targets = [(rng.uniform(0, 900), rng.uniform(0, 600)) for _ in range(5 * n)]
+    result = assign.solve(agents, targets, [1.0] * len(targets))
+    assert -1 not in result
+    assert len(set(result)) == n
+
+
+def test_large_solve_respects_reach(numpy):
+    n = assign.HUNGARIAN_MAX + 10
+    agents = [(float(i), 0.0) for i in range(n)]
+    targets = [(float(i), 3.0) for i in range(0, n, 2)]
+    result = assign.solve(agents, targets, [1.0] * len(targets), reach=5)
+    for i, j in enumerate(result):
+        if j >= 0:
+            assert abs(targets[j][0] - agents[i][0]) <= 5
+    assert sorted(j for j in result if j >= 0) == list(range(len(targets)))
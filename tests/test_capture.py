@@ -0,0 +1,94 @@
+"""simcore.capture: waktu kontak analitik, broad phase, dan penangkapan swept di World ai4."""
+
+import math
+import random
+
+import pytest
+
+from simcore import capture, paths
+
+
+def _sampled_contact(p0, p1, q0, q1, radius, steps=20000):
+    """Waktu kontak pertama lewat sampling rapat (pembanding contact_time)."""
+    for k in range(steps + 1):
+        t = k / steps
+        px, py = p0[0] + t * (p1[0] - p0[0]), p0[1] + t * (p1[1] - p0[1])
+        qx, qy = q0[0] + t * (q1[0] - q0[0]), q0[1] + t * (q1[1] - q0[1])
+        if math.hypot(qx - px, qy - py) < radius:
+            return t
+    return None
+
+
+def test_contact_time_tunnelling():
+    # drone cepat melewati target diam: titik akhir jauh, tapi lintasan menembus radius
+    t = capture.contact_time((0, 0), (100, 0), (50, 1), (50, 1), 5)
+    assert t == pytest.approx((50 - math.sqrt(24)) / 100)
+    assert capture.contact_time((0, 0), (100, 0), (50, 10), (50, 10), 5) is None
+
+
+def test_contact_time_already_inside_and_receding():
+    assert capture.contact_time((0, 0), (10, 0), (1, 0), (1, 0), 5) == 0.0
+    assert capture.contact_time((0, 0), (-10, 0), (20, 0), (30, 0), 5) is None
+
+
+def test_contact_time_matches_sampling():
+    rng = random.Random(7)
+    for _ in range(300):
+        p0, p1, q0, q1 = [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(4)]
+        t = capture.contact_time(p0, p1, q0, q1, 8)
+        ref = _sampled_contact(p0, p1, q0, q1, 8)
+        if ref is None:
+            assert t is None or t > 1 - 1e-3
+        else:
+            assert t is not None and t == pytest.approx(ref, abs=1e-3)
+
+
+def _random_paths(rng, n):
+    starts = [(rng.uniform(0, 200), rng.uniform(0, 200)) for _ in range(n)]
+    ends = [(x + rng.uniform(-20, 20), y + rng.uniform(-20, 20)) for x, y in starts]
+    return starts, ends
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_broad_phase_keeps_every_contact(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(capture, "np", None)
+    elif capture.np is None:
+        pytest.skip("NumPy tidak terpasang")
+    rng = random.Random(3)
+    p0, p1 = _random_paths(rng, 40)
+    q0, q1 = _random_paths(rng, 60)
+    ii, jj = capture.broad_phase(p0, p1, q0, q1, 6)
+    pairs = set(zip(list(ii), list(jj)))
+    contacts = {(i, j) for i in range(40) for j in range(60)
+                if capture.contact_time(p0[i], p1[i], q0[j], q1[j], 6) is not None}
+    assert contacts <= pairs
+    assert len(pairs) < 40 * 60  # benar-benar memangkas
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_captures_earliest_contact_wins(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(capture, "np", None)
+    elif capture.np is None:
+        pytest.skip("NumPy tidak terpasang")
+    # dua pengejar menuju target yang sama; yang kontak lebih dulu menang, tiap target sekali
+    p0, p1 = [(0, 0), (80, 0)], [(60, 0), (40, 0)]
+    q0 = q1 = [(50, 0)]
+    hits = capture.captures(p0, p1, q0, q1, 5)
+    assert [(i, j) for i, j, _t in hits] == [(1, 0)]
+    assert capture.captures(p0, p1, q0, q1, 5, targets=[0, None])[0][:2] == (0, 0)
+
+
+def test_ai4_greedy_drones_release_caught_targets():
+    """assign=False + swept: drone yang targetnya ditangkap drone lain tidak boleh mengejar selamanya."""
+    paths.use("ai4")
+    from c1_world import World
+
+    world = World(num_red=3, num_drones=3, seed=1, assign=False, verbose=False)
+    world.step(3000)
+    for _ in range(3):
+        world.spawn_person("red")
+    world.step(3000)
+    assert not any(d.state == "ATTACK" and d.target.caught for d in world.drones)
+    assert not world.by_status["red"]  # merah baru juga tertangkap
@@ -0,0 +1,117 @@
+"""ai3 DroneBrain: tabel transisi, timer per status lewat TimerQueue (jam disuntik), dan epoch timer basi."""
+
+import pytest
+
+from simcore import paths
+
+paths.use("ai3")
+import DroneBrain as brain_mod  # noqa: E402
+from DroneBrain import ATTACK_DURATION, FRAME, TRANSITIONS, DroneBrain, TimerQueue  # noqa: E402
+
+ALERT_AFTER = 10  # DroneBrain.alert_interval
+
+
+class ZeroRng:
+    """random() selalu 0: objek tidak bergerak (Box-Muller r = 0), posisi spawn di batas bawah."""
+
+    def random(self):
+        return 0.0
+
+    def randint(self, a, b):
+        return a
+
+
+@pytest.fixture
+def brain(monkeypatch):
+    # deteksi satu frame setelah STANDBY dimasuki; objek tidak pernah hilang sendiri
+    monkeypatch.setattr(brain_mod, "_frames_until",
+                        lambda rng, chance: 1 if chance == brain_mod.DETECT_CHANCE else 10 ** 6)
+    log = []
+    b = DroneBrain(ZeroRng(), TimerQueue(0.0), drone_id=1,
+                   on_transition=lambda br, old, event, now: log.append((old, event, br.status, now)))
+    b.log = log
+    return b
+
+
+def _force(brain, status, now):
+    """Masukkan brain ke status tertentu lewat jalur tabel dari STANDBY."""
+    path = {"STANDBY": [], "FOLLOWING": ["detect"], "ALERT": ["detect", "consistent"],
+            "ATTACKING": ["detect", "consistent", "SERANG"]}[status]
+    for event in path:
+        brain.handle(event, now)
+    assert brain.status == status
+
+
+@pytest.mark.parametrize("status", DroneBrain.STATUS)
+def test_transition_table(brain, status):
+    events = {event for _s, event in TRANSITIONS} | {"track", "bogus"}
+    for event in sorted(events):
+        _force(brain, status, 0.0)
+        epoch = brain.epoch
+        brain.handle(event, 0.0)
+        expected = TRANSITIONS.get((status, event), status)
+        assert brain.status == expected, (status, event)
+        if (status, event) not in TRANSITIONS:
+            assert brain.epoch == epoch  # event diabaikan: timer status ini tetap berlaku
+        brain.reset_to_standby()
+
+
+def test_timers_drive_standby_following_alert_attacking(brain):
+    timers = brain.timers
+    timers.run_until(FRAME / 2)
+    assert brain.status == "STANDBY"
+    timers.run_until(FRAME)
+    assert brain.status == "FOLLOWING" and brain.get_sim_object() is not None
+    timers.run_until(FRAME + ALERT_AFTER - 0.01)
+    assert brain.status == "FOLLOWING"
+    timers.run_until(FRAME + ALERT_AFTER)
+    assert brain.status == "ALERT"
+
+    t = FRAME + ALERT_AFTER + 2
+    timers.run_until(t)
+    brain.process_owner_command("SERANG")
+    assert brain.status == "ATTACKING" and brain.last_alert_time == t
+    timers.run_until(t + ATTACK_DURATION - 0.01)
+    assert brain.status == "ATTACKING"
+    timers.run_until(t + ATTACK_DURATION)
+    assert brain.status == "STANDBY" and brain.get_sim_object() is None
+    assert [(old, event, new) for old, event, new, _t in brain.log] == [
+        ("STANDBY", "detect", "FOLLOWING"), ("FOLLOWING", "consistent", "ALERT"),
+        ("ALERT", "SERANG", "ATTACKING"), ("ATTACKING", "done", "STANDBY")]
+
+
+def test_commands_outside_alert_are_ignored(brain):
+    brain.timers.run_until(FRAME)
+    assert brain.status == "FOLLOWING"
+    brain.process_owner_command("SERANG")
+    brain.process_owner_command("ABAIKAN")
+    assert brain.status == "FOLLOWING"
+    brain.timers.run_until(FRAME + ALERT_AFTER)
+    assert brain.status == "ALERT"  # jendela konsistensi tidak terganggu
+
+
+def test_abaikan_restarts_consistency_window(brain):
+    timers = brain.timers
+    timers.run_until(FRAME + ALERT_AFTER)
+    assert brain.status == "ALERT"
+    t = FRAME + ALERT_AFTER + 4
+    timers.run_until(t)
+    brain.process_owner_command("ABAIKAN")
+    assert brain.status == "FOLLOWING" and brain.sim_object_timer == t
+    timers.run_until(t + ALERT_AFTER - 0.01)
+    assert brain.status == "FOLLOWING"  # bukan langsung ALERT lagi dari jendela lama
+    timers.run_until(t + ALERT_AFTER)
+    assert brain.status == "ALERT"
+
+
+def test_stale_epoch_timers_are_ignored(brain):
+    timers = brain.timers
+    timers.run_until(1.0)  # FOLLOWING sejak FRAME: "consistent" terjadwal di FRAME + 10
+    brain.handle("lost", 1.0)  # kembali ke STANDBY; timer FOLLOWING lama tetap di heap
+    timers.run_until(1.0 + FRAME)  # deteksi lagi: FOLLOWING baru, konsisten di 1 + FRAME + 10
+    assert brain.status == "FOLLOWING"
+    timers.run_until(FRAME + ALERT_AFTER + 0.5)
+    assert brain.status == "FOLLOWING"  # "consistent" epoch lama dibuang
+    assert [event for _old, event, _new, _t in brain.log] == ["detect", "lost", "detect"]
+    timers.run_until(1.0 + FRAME + ALERT_AFTER)
+    assert brain.status == "ALERT"
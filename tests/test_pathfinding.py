@@ -0,0 +1,144 @@
+"""ai2 pathfinding: A* dan FlowField dibandingkan dengan Dijkstra, sudut obstacle, dan cache Pathfinder."""
+
+import heapq
+import math
+import random
+
+import pytest
+
+from simcore import paths
+
+paths.use("ai2")
+from pathfinding import SQRT2, FlowField, Grid, Pathfinder, astar  # noqa: E402
+
+
+def _free(grid, x, y):
+    return 0 <= x < grid.width and 0 <= y < grid.height and (x, y) not in grid.blocked
+
+
+def _moves(grid, cell):
+    """Langkah legal (cell, biaya) ditulis ulang dari aturan: 8 arah, diagonal tidak memotong sudut."""
+    x, y = cell
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            if (dx or dy) and _free(grid, x + dx, y + dy):
+                if dx and dy and not (_free(grid, x + dx, y) and _free(grid, x, y + dy)):
+                    continue
+                yield (x + dx, y + dy), SQRT2 if dx and dy else 1.0
+
+
+def _dijkstra(grid, start):
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, cur = heapq.heappop(heap)
+        if d > dist[cur]:
+            continue
+        for n, cost in _moves(grid, cur):
+            if d + cost < dist.get(n, math.inf):
+                dist[n] = d + cost
+                heapq.heappush(heap, (d + cost, n))
+    return dist
+
+
+def _path_cost(grid, path):
+    """Biaya jalur; gagal bila ada langkah yang tidak legal."""
+    total = 0.0
+    for a, b in zip(path, path[1:]):
+        legal = dict(_moves(grid, a))
+        assert b in legal, f"langkah ilegal {a} -> {b}"
+        total += legal[b]
+    return total
+
+
+def _random_grid(rng, width=16, height=12, density=0.3):
+    grid = Grid(width, height)
+    grid.blocked.update((x, y) for x in range(width) for y in range(height) if rng.random() < density)
+    return grid
+
+
+def test_astar_cost_matches_dijkstra():
+    rng = random.Random(5)
+    for _ in range(40):
+        grid = _random_grid(rng)
+        free = sorted(set((x, y) for x in range(grid.width) for y in range(grid.height)) - grid.blocked)
+        start = rng.choice(free)
+        dist = _dijkstra(grid, start)
+        for goal in rng.sample(free, 10):
+            path = astar(grid, start, goal)
+            if goal not in dist:
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert _path_cost(grid, path) == pytest.approx(dist[goal], abs=1e-9)
+
+
+def test_no_corner_cutting():
+    grid = Grid(3, 3)
+    grid.blocked.add((1, 0))
+    assert (1, 1) not in dict(grid.neighbors((0, 0)))
+    assert astar(grid, (0, 0), (1, 1)) == [(0, 0), (0, 1), (1, 1)]
+    # celah diagonal di antara dua blok tidak bisa dilewati sama sekali
+    grid.blocked.add((0, 1))
+    assert astar(grid, (0, 0), (1, 1)) is None
+    assert FlowField(grid, (1, 1)).step((0, 0)) is None
+
+
+def test_flow_field_steps_reach_goal():
+    rng = random.Random(9)
+    for _ in range(20):
+        grid = _random_grid(rng)
+        free = sorted(set((x, y) for x in range(grid.width) for y in range(grid.height)) - grid.blocked)
+        goal = rng.choice(free)
+        field = FlowField(grid, goal)
+        dist = _dijkstra(grid, goal)  # graf simetris: jarak ke goal = jarak dari goal
+        for cell in free:
+            if cell not in dist:
+                assert field.step(cell) is None
+                continue
+            path = [cell]
+            while path[-1] != goal:
+                path.append(field.step(path[-1]))
+                assert len(path) <= len(free)
+            assert _path_cost(grid, path) == pytest.approx(dist[cell], abs=1e-9)
+            assert field.dist[cell] == pytest.approx(dist[cell], abs=1e-9)
+
+
+def _follow(pf, start, goal, limit=100):
+    path = [start]
+    while path[-1] != goal and len(path) < limit:
+        pf.begin_tick()
+        path.append(pf.next_cell(path[-1], goal))
+    return path
+
+
+def test_pathfinder_cache_invalidated_by_obstacles():
+    grid = Grid(10, 5)
+    pf = Pathfinder(grid)
+    field = pf.flow_field((9, 2))
+    assert pf.flow_field((9, 2)) is field  # dari cache
+    wall = (5, 0, 5, 3)  # tembok dengan celah hanya di y=4
+    grid.block_rect(wall)
+    rebuilt = pf.flow_field((9, 2))
+    assert rebuilt is not field and pf.fields_built == 2
+    path = _follow(pf, (0, 2), (9, 2))
+    assert path[-1] == (9, 2) and (5, 4) in path
+    assert not set(path) & grid.blocked
+
+    grid.unblock_rect(wall)
+    assert pf.flow_field((9, 2)) is not rebuilt
+    assert len(_follow(pf, (0, 2), (9, 2))) == 10  # garis lurus lagi
+
+
+def test_pathfinder_follows_new_goal():
+    grid = Grid(10, 10)
+    pf = Pathfinder(grid)
+    pf.begin_tick()
+    pf.next_cell((0, 0), (9, 0))
+    assert pf.next_cell((0, 1), (9, 0)) == (1, 0)  # query kedua ke goal sama -> flow field
+    assert pf.cached_goals() == [(9, 0)]
+    pf.begin_tick()
+    assert pf.next_cell((0, 0), (0, 9)) == (0, 1)  # goal pindah: bukan langkah ke goal lama
+    assert pf.next_cell((1, 0), (0, 9)) in ((0, 1), (1, 1))
+    assert pf.cached_goals() == [(9, 0), (0, 9)]
+    assert _follow(pf, (5, 5), (0, 9))[-1] == (0, 9)
@@ -0,0 +1,56 @@
+"""WorldRNG: dua run dengan seed yang sama identik bit per bit untuk semua simulator headless."""
+
+import struct
+
+import pytest
+
+from simcore.scenarios import build_world
+
+TICKS = 400
+PARAMS = {"people": 30, "drones": 3}
+
+
+def _floats(values):
+    return struct.pack(f"{len(values)}d", *values)  # bit per bit, bukan == (0.0 == -0.0)
+
+
+def _state(sim, world):
+    """Byte state lengkap World setelah step (snapshot bila ada, kalau tidak posisi + target + metrik)."""
+    if sim in ("ai2", "ai4"):
+        return world.snapshot()
+    stats = repr((world.tick, world.stats, world.capture_latencies)).encode()
+    if sim == "ai1-array":
+        return b"".join([world.pos.tobytes(), world.drone_pos.tobytes(), world.caught.tobytes(),
+                         world.drone_target.tobytes(), stats])
+    people, drones = world.people, world.drones
+    index = {p: i for i, p in enumerate(people)}
+    return b"".join([_floats([v for p in people for v in (p.x, p.y, p.threat)]),
+                     bytes(p.caught for p in people),
+                     _floats([v for d in drones for v in (d.x, d.y)]),
+                     repr([index.get(d.target, -1) for d in drones]).encode(), stats])
+
+
+def _run(sim, **params):
+    world = build_world(sim, {**PARAMS, **params})
+    world.step(TICKS)
+    return world
+
+
+@pytest.mark.parametrize("sim", ["ai1", "ai1-array", "ai2", "ai4"])
+@pytest.mark.parametrize("assign", [1, 0])
+def test_same_seed_is_bit_identical(sim, assign):
+    if sim == "ai1-array":
+        pytest.importorskip("numpy")
+    for seed in (0, 7):
+        a = _run(sim, seed=seed, assign=assign)
+        b = _run(sim, seed=seed, assign=assign)
+        assert _state(sim, a) == _state(sim, b)
+    assert _state(sim, _run(sim, seed=0, assign=assign)) != _state(sim, _run(sim, seed=7, assign=assign))
+
+
+@pytest.mark.parametrize("sim", ["ai1", "ai2", "ai4"])
+def test_random_seed_is_reported_and_reproducible(sim):
+    """seed=None memilih seed acak; seed itu (world.rng.seed) cukup untuk mengulang run."""
+    a = _run(sim, seed=None)
+    b = _run(sim, seed=a.rng.seed)
+    assert _state(sim, a) == _state(sim, b)
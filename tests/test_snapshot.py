@@ -0,0 +1,115 @@
+"""simcore.snapshot, posisi WorldRNG, dan World.snapshot -> restore ai2 / ai4."""
+
+import random
+
+import pytest
+
+from simcore import rng as rng_mod
+from simcore import snapshot
+from simcore.rng import WorldRNG
+from simcore.scenarios import build_world
+
+
+def test_pack_unpack_roundtrip():
+    meta = {"tick": 12, "stats": {"captures": 3}, "zone": [1, 2, 3, 4]}
+    columns = {
+        "people.id": snapshot.ints([5, -1, 2 ** 40]),
+        "people.x": snapshot.floats([0.5, -1.25, 1e300]),
+        "people.caught": snapshot.flags([True, False, True]),
+        "people.status": ["red", "", "hijau ✓"],
+        "empty.ints": snapshot.ints([]),
+        "empty.names": [],
+    }
+    got_meta, got = snapshot.unpack(snapshot.pack(meta, columns))
+    assert got_meta == meta
+    assert list(got) == list(columns)
+    for name, col in columns.items():
+        assert list(got[name]) == list(col)
+        if not isinstance(col, list):
+            assert got[name].typecode == col.typecode
+
+
+def test_unpack_rejects_other_data():
+    with pytest.raises(ValueError):
+        snapshot.unpack(b"NOPE" + bytes(16))
+
+
+def test_pack_rejects_unknown_typecode():
+    from array import array
+    with pytest.raises(ValueError):
+        snapshot.pack({}, {"x": array("f", [1.0])})
+
+
+def test_pack_rejects_long_column_names():
+    longest = "p" * snapshot.NAME_BYTES
+    _meta, got = snapshot.unpack(snapshot.pack({}, {longest: snapshot.ints([1])}))
+    assert list(got) == [longest]
+    # dua nama dengan awalan 24 byte sama akan bertabrakan kalau dipotong diam-diam
+    with pytest.raises(ValueError):
+        snapshot.pack({}, {longest + ".a": snapshot.ints([1]), longest + ".b": snapshot.ints([2])})
+    with pytest.raises(ValueError):
+        snapshot.pack({}, {"é" * 13: []})  # 13 karakter, 26 byte utf-8
+
+
+@pytest.mark.parametrize("used", [0, 1, rng_mod.FIRST_BLOCK - 1, rng_mod.FIRST_BLOCK, 3 * rng_mod.FIRST_BLOCK + 5,
+                                  rng_mod.MAX_BLOCK * 2 + 17])
+def test_world_rng_state_roundtrip(used):
+    src = WorldRNG(7)
+    s = src.stream("person:1")
+    for _ in range(used):
+        s.random()
+    src.stream("spawn").randint(0, 10)
+    names, counts = src.state()
+    assert counts[0] == used
+
+    dst = WorldRNG(7)
+    dst.set_state(names, counts)
+    assert dst.state() == (names, counts)
+    for name in names:
+        a, b = src.stream(name), dst.stream(name)
+        assert [a.random() for _ in range(50)] == [b.random() for _ in range(50)]
+        assert [a.randint(0, 99) for _ in range(20)] == [b.randint(0, 99) for _ in range(20)]
+
+
+def _poke(sim, world, r):
+    """Input pengguna acak (sama seperti UI) supaya snapshot juga memuat entitas baru."""
+    if r.random() < 0.02:
+        if sim == "ai2":
+            if r.random() < 0.5:
+                world.spawn_person()
+            else:
+                world.raise_threat_near(r.randrange(28), r.randrange(20))
+        elif r.random() < 0.8:
+            world.spawn_person(r.choice(["red", "yellow", "green"]))
+        else:
+            world.spawn_drone()
+
+
+@pytest.mark.parametrize("sim,params", [
+    ("ai2", {}),
+    ("ai2", {"assign": 0, "intercept": 0, "swept": 0, "obstacles": 0}),
+    ("ai4", {}),
+    ("ai4", {"assign": 0, "intercept": 0, "swept": 0}),
+])
+def test_world_restore_steps_identically(sim, params):
+    world = build_world(sim, {"seed": 5, "people": 30, **params})
+    r = random.Random(5)
+    for _ in range(3):
+        for _ in range(400):
+            _poke(sim, world, r)
+            world.step()
+        data = world.snapshot()
+        clone = type(world).restore(data)
+        assert clone.snapshot() == data
+
+        state = r.getstate()
+        for _ in range(400):
+            _poke(sim, world, r)
+            world.step()
+        r.setstate(state)
+        for _ in range(400):
+            _poke(sim, clone, r)
+            clone.step()
+        assert clone.snapshot() == world.snapshot()
+        assert clone.stats == world.stats
+        world = clone  # lanjutkan dari World hasil restore
@@ -0,0 +1,83 @@
+"""ai2 targets.TargetStore: expiry lewat heap dan index lock, dibandingkan dengan dict biasa."""
+
+import random
+
+from simcore import paths
+
+paths.use("ai2")
+from targets import MAX_OBSERVERS, Observers, TargetStore  # noqa: E402
+
+TTL = 5.0
+
+
+def _reference_evict(ref, now, ttl):
+    stale = [pid for pid, rec in ref.items()
+             if rec.get("locked_by") is None and rec.get("ts") is not None and now - rec["ts"] > ttl]
+    for pid in stale:
+        del ref[pid]
+    return stale
+
+
+def _owned(ref, drone_id):
+    return {pid for pid, rec in ref.items() if rec.get("locked_by") == drone_id}
+
+
+def test_store_matches_plain_dict():
+    rng = random.Random(11)
+    store, ref = TargetStore(), {}
+    drones = ["D0", "D1", "D2"]
+    now = 0.0
+    for _ in range(5000):
+        now += rng.uniform(0, 0.5)
+        pid = f"P{rng.randrange(40)}"
+        op = rng.random()
+        if op < 0.3:
+            rec = {"pos": (1, 2), "ts": now, "locked_by": None, "by": Observers()}
+            store[pid], ref[pid] = rec, dict(rec)
+        elif op < 0.5 and pid in ref:
+            store[pid]["ts"] = ref[pid]["ts"] = now  # update langsung seperti DroneBrain
+        elif op < 0.65 and pid in ref:
+            owner = rng.choice(drones + [None])
+            store[pid]["locked_by"] = ref[pid]["locked_by"] = owner
+        elif op < 0.7 and pid in ref:
+            store[pid].update(locked_by=None, ts=now)
+            ref[pid].update(locked_by=None, ts=now)
+        elif op < 0.75 and pid in ref:
+            del store[pid]
+            del ref[pid]
+        else:
+            assert sorted(store.evict_stale(now, TTL)) == sorted(_reference_evict(ref, now, TTL))
+        assert set(store) == set(ref)
+        for d in drones:
+            assert store.locked_by(d) == _owned(ref, d)
+
+
+def test_locked_record_never_expires():
+    store = TargetStore()
+    store["P1"] = {"ts": 0.0, "locked_by": "D0"}
+    store["P2"] = {"ts": 0.0, "locked_by": None}
+    assert store.evict_stale(100.0, TTL) == ["P2"]
+    store["P1"]["locked_by"] = None  # lock lepas: ts lama langsung kedaluwarsa
+    assert store.evict_stale(100.0, TTL) == ["P1"]
+    assert len(store) == 0 and store.locked_by("D0") == set()
+
+
+def test_replaced_record_is_detached():
+    store = TargetStore()
+    store["P1"] = {"ts": 0.0, "locked_by": "D0"}
+    old = store["P1"]
+    store["P1"] = {"ts": 10.0, "locked_by": None}
+    old["locked_by"] = "D1"  # record lama tidak lagi mengubah index
+    assert store.locked_by("D1") == set()
+    assert store.locked_by("D0") == set()
+    assert store.evict_stale(12.0, TTL) == []
+
+
+def test_observers_bounded():
+    by = Observers()
+    for i in range(3 * MAX_OBSERVERS):
+        by.add(f"D{i}", ts=float(i))
+    by.add(f"D{3 * MAX_OBSERVERS - 1}", ts=100.0)
+    assert len(by) == MAX_OBSERVERS
+    assert f"D{2 * MAX_OBSERVERS}" in by and "D0" not in by
+    assert by.count(f"D{3 * MAX_OBSERVERS - 1}") == 2
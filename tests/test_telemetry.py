@@ -0,0 +1,72 @@
+"""ai4 telemetry: tulis / baca blok kolumnar, dan lanjut menulis setelah crash."""
+
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from simcore import paths  # noqa: E402
+
+paths.use("ai4")
+import telemetry  # noqa: E402
+
+
+def _write(path, ticks, block_size=4):
+    with telemetry.TelemetryWriter(path, block_size=block_size) as w:
+        for t in ticks:
+            w.record(t, telemetry.EVENT_SPAWN, entity=t, x=float(t), y=-float(t), threat=0.5)
+
+
+def _ticks(path):
+    with telemetry.TelemetryReader(path) as r:
+        return r.slice()["tick"].tolist()
+
+
+def test_roundtrip_and_slice(tmp_path):
+    path = str(tmp_path / "t.bin")
+    _write(path, range(10))
+    with telemetry.TelemetryReader(path) as r:
+        assert len(r) == 10
+        assert list(r.block_counts) == [4, 4, 2]
+        part = r.slice(3, 7)
+        assert part["tick"].tolist() == [3, 4, 5, 6]
+        assert part["x"].tolist() == [3.0, 4.0, 5.0, 6.0]
+        assert part["entity"].tolist() == [3, 4, 5, 6]
+
+
+def test_append_after_truncated_tail(tmp_path):
+    path = str(tmp_path / "t.bin")
+    _write(path, range(8))  # dua blok utuh
+    size = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(b"BLK0" + b"\x07" * 20)  # blok ketiga terpotong di tengah header / data
+    _write(path, range(8, 12))
+    assert _ticks(path) == list(range(12))
+    assert os.path.getsize(path) > size
+
+
+def test_append_after_cut_inside_block(tmp_path):
+    path = str(tmp_path / "t.bin")
+    _write(path, range(8))
+    size = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        f.truncate(size - 5)  # blok kedua kehilangan ekornya
+    _write(path, range(8, 10))
+    assert _ticks(path) == list(range(4)) + [8, 9]
+
+
+def test_partial_header_starts_over(tmp_path):
+    path = str(tmp_path / "t.bin")
+    with open(path, "wb") as f:
+        f.write(telemetry.MAGIC[:2])
+    _write(path, range(3))
+    assert _ticks(path) == [0, 1, 2]
+
+
+def test_ticks_must_not_decrease_across_sessions(tmp_path):
+    path = str(tmp_path / "t.bin")
+    _write(path, range(5))
+    with telemetry.TelemetryWriter(path) as w:
+        with pytest.raises(ValueError):
+            w.record(2, telemetry.EVENT_SPAWN)